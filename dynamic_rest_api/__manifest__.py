@@ -13,7 +13,8 @@ Allows non-technical users to:
 - Add custom fields to models dynamically (no code changes needed)
 - Auto-generate fully-routed REST endpoints (GET/POST/PUT/DELETE)
 - Manage API keys with SHA-256 hashing
-- Log every request with timing metrics
+- Log every request with timing metrics (buffered, batched inserts)
+- Hourly/daily request statistics with latency percentiles
 - All endpoints register/unregister at runtime — zero restarts required
     """,
     'author': 'Custom Development',
@@ -26,8 +27,9 @@ Allows non-technical users to:
         'views/dynamic_api_endpoint_views.xml',
         'views/dynamic_api_key_views.xml',
         'views/dynamic_api_log_views.xml',
+        'views/dynamic_api_log_rollup_views.xml',
         'views/menu.xml',
-        # 'data/cron.xml',
+        'data/cron.xml',
     ],
     'assets': {
         'web.assets_backend': [
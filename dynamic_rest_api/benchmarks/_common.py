@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""Helpers shared by the offline benchmarks of this addon."""
+import math
+from types import SimpleNamespace
+
+from werkzeug.test import EnvironBuilder
+from werkzeug.wrappers import Request as WerkzeugRequest
+
+from odoo.http import Response
+
+
+class _OfflineRequest:
+    """The subset of ``odoo.http.request`` the controllers rely on."""
+
+    def __init__(self, env, path, method='GET', query=None, body=None, headers=None):
+        builder = EnvironBuilder(
+            path=path, method=method, query_string=query or {},
+            data=body, headers=headers or {},
+            content_type='application/json' if body is not None else None,
+        )
+        self.httprequest = WerkzeugRequest(builder.get_environ())
+        self.env = env
+        self.db = env.cr.dbname
+        self.session = SimpleNamespace(uid=None)
+
+    @staticmethod
+    def make_response(data, headers=None, status=200):
+        return Response(data, headers=headers, status=status)
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    # Nearest-rank method
+    rank = math.ceil(pct / 100 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(rank, len(sorted_values) - 1))]
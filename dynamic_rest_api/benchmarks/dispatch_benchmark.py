@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""
+Dispatcher latency benchmark
+============================
+
+Offline, reproducible measurement of ``DynamicApiController.dispatch``.
+Nothing goes over the network: each request is built with werkzeug's
+``EnvironBuilder`` and handed to the real dispatcher through a minimal
+stand-in for ``odoo.http.request``, on a private cursor that is rolled back
+at the end — the database is left exactly as it was.
+
+Usage (from ``odoo-bin shell -d <db>``)::
+
+    from odoo.addons.dynamic_rest_api.benchmarks.dispatch_benchmark import run
+    report = run(env, records=2000, iterations=200)
+
+Setup
+-----
+- ``records`` synthetic rows are created on ``model_name`` (default
+  res.partner; the model must not already have an endpoint).
+- One endpoint exposing ``field_names`` with GET/POST/PUT/DELETE enabled,
+  API-key auth and a rate limit high enough never to trigger, plus one key.
+
+Scenarios (``iterations`` requests each)
+----------------------------------------
+    GET list     ?page=<random>&page_size=20
+    GET one      ?id=<random>
+    POST         create one row
+    PUT          ?id=<random> update one row
+    DELETE       ?id=<row created for it, outside the timing>
+
+Phases
+------
+Timings are *exclusive* (a nested phase is not counted in its parent):
+
+    auth        _authenticate (API key verification)
+    rate_limit  dynamic.api.key.check_rate_limit
+    parse       json.loads of the body / domain
+    orm         _handle_get_cached / _handle_post / _handle_put / _handle_delete
+    serialize   _serialize_records, json.dumps and response building
+    log         dynamic.api.log.log_request
+    dispatch    everything else (routing, endpoint lookup, plan, envelope)
+
+Queries are counted on the request cursor (``cr.sql_log_count``); work done
+on side cursors (shared rate-limit buckets, buffered log flushes) is not
+included.
+"""
+import functools
+import json
+import random
+import time
+from unittest.mock import patch
+
+from odoo import api, SUPERUSER_ID
+from odoo.exceptions import UserError
+
+from ..controllers import dynamic_dispatch
+from ..controllers.dynamic_dispatch import DynamicApiController
+from ..utils.log_buffer import request_log_buffer
+from ..utils.response_cache import response_cache
+from ._common import _OfflineRequest, _percentile
+
+DEFAULT_FIELDS = ('name', 'email', 'phone', 'ref', 'city', 'zip')
+PHASES = ('auth', 'rate_limit', 'parse', 'orm', 'serialize', 'log', 'dispatch')
+SCENARIOS = ('GET list', 'GET one', 'POST', 'PUT', 'DELETE')
+PERCENTILES = (50, 95, 99)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Phase recorder
+# ─────────────────────────────────────────────────────────────────────────────
+
+class PhaseRecorder:
+    """Exclusive wall time and query count per phase for one request."""
+
+    def __init__(self, cr):
+        self.cr = cr
+        self._stack = []
+        self.reset()
+
+    def reset(self):
+        self.times = dict.fromkeys(PHASES, 0.0)
+        self.queries = dict.fromkeys(PHASES, 0)
+        self._stack.clear()
+
+    def wrap(self, phase, func):
+        recorder = self
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            # [phase, start, start_queries, child_time, child_queries]
+            frame = [phase, time.perf_counter(), recorder.cr.sql_log_count, 0.0, 0]
+            recorder._stack.append(frame)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                recorder._stack.pop()
+                elapsed = time.perf_counter() - frame[1]
+                queries = recorder.cr.sql_log_count - frame[2]
+                recorder.times[phase] += elapsed - frame[3]
+                recorder.queries[phase] += queries - frame[4]
+                if recorder._stack:
+                    recorder._stack[-1][3] += elapsed
+                    recorder._stack[-1][4] += queries
+        return timed
+
+
+class _TimedJson:
+    """Stand-in for the dispatcher's ``json`` module: times loads / dumps."""
+
+    def __init__(self, recorder):
+        self.loads = recorder.wrap('parse', json.loads)
+        self.dumps = recorder.wrap('serialize', json.dumps)
+
+    def __getattr__(self, name):
+        return getattr(json, name)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Synthetic population
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _row_values(index):
+    return {
+        'name': f'Dynamic API Bench {index:06d}',
+        'email': f'bench{index}@example.com',
+        'phone': f'+1 555 {index:07d}',
+        'ref': f'DYNBENCH-{index}',
+        'city': random.choice(('Dhaka', 'Lisbon', 'Austin', 'Nairobi')),
+        'zip': f'{index % 100000:05d}',
+    }
+
+
+def _setup(env, model_name, field_names, records):
+    model = env['ir.model']._get(model_name)
+    if not model:
+        raise UserError(f'Unknown model {model_name!r}.')
+    if env['dynamic.api.endpoint'].search_count([('model_id', '=', model.id)]):
+        raise UserError(
+            f'An endpoint for {model_name!r} already exists; '
+            f'pass another model_name to the benchmark.'
+        )
+
+    Target = env[model_name]
+    field_names = [name for name in field_names if name in Target._fields]
+    field_records = env['ir.model.fields'].search([
+        ('model_id', '=', model.id), ('name', 'in', field_names),
+    ])
+
+    rows = [_row_values(index) for index in range(records)]
+    rows = [{k: v for k, v in row.items() if k in field_names} for row in rows]
+    record_ids = Target.create(rows).ids
+
+    endpoint = env['dynamic.api.endpoint'].create({
+        'name': 'Dispatcher Benchmark',
+        'model_id': model.id,
+        'allow_get': True,
+        'allow_post': True,
+        'allow_put': True,
+        'allow_delete': True,
+        'auth_type': 'api_key',
+        'rate_limit': 10 ** 9,
+        'rate_limit_strategy': 'memory',
+        'field_ids': [(0, 0, {'field_id': field.id}) for field in field_records],
+    })
+    api_key, raw_key = env['dynamic.api.key'].create_with_key(
+        'Dispatcher Benchmark', endpoint_ids=[endpoint.id],
+    )
+    env.flush_all()
+    return endpoint, raw_key, record_ids, field_names
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Runner
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _summarise(samples):
+    totals = sorted(sample['total'] for sample in samples)
+    count = len(samples) or 1
+    summary = {
+        'requests': len(samples),
+        'mean_ms': sum(totals) / count,
+        'queries_per_request': sum(sample['total_queries'] for sample in samples) / count,
+        'status_codes': sorted({sample['status'] for sample in samples}),
+        'phases': {
+            phase: {
+                'mean_ms': sum(sample['times'][phase] for sample in samples) / count,
+                'queries': sum(sample['queries'][phase] for sample in samples) / count,
+            }
+            for phase in PHASES
+        },
+    }
+    for pct in PERCENTILES:
+        summary[f'p{pct}_ms'] = _percentile(totals, pct)
+    return summary
+
+
+def run(env, records=1000, iterations=100, model_name='res.partner',
+        field_names=DEFAULT_FIELDS, log_mode='sync', cache_ttl=0, seed=42,
+        verbose=True):
+    """
+    Run every scenario and return ``{scenario: summary}``; times in ms.
+    ``log_mode`` is 'sync' or 'buffered' (queued entries are discarded).
+    """
+    random.seed(seed)
+    report = {}
+    with env.registry.cursor() as cr:
+        bench_env = api.Environment(cr, SUPERUSER_ID, {})
+        try:
+            bench_env['ir.config_parameter'].set_param('dynamic_rest_api.log_mode', log_mode)
+            endpoint, raw_key, record_ids, field_names = _setup(
+                bench_env, model_name, field_names, records,
+            )
+            if cache_ttl:
+                endpoint.cache_ttl = cache_ttl
+            report = _run_scenarios(
+                bench_env, endpoint, raw_key, record_ids, field_names, iterations,
+            )
+        finally:
+            cr.rollback()
+            request_log_buffer._drain()
+            response_cache.clear()
+            env.registry.clear_cache()
+
+    if verbose:
+        print(format_report(report))
+    return report
+
+
+def _run_scenarios(env, endpoint, raw_key, record_ids, field_names, iterations):
+    recorder = PhaseRecorder(env.cr)
+    controller = DynamicApiController()
+    slug = endpoint.endpoint_path[len('/api/dynamic/'):]
+    headers = {'X-API-Key': raw_key}
+    Key = type(env['dynamic.api.key'])
+    Log = type(env['dynamic.api.log'])
+    Target = env[endpoint.model_id.model]
+    pages = max(1, len(record_ids) // 20)
+
+    def body():
+        return json.dumps(_row_values(random.randrange(10 ** 6)))
+
+    def fresh_id():
+        # Created before the timer starts, so only the delete is measured
+        values = _row_values(random.randrange(10 ** 6))
+        record = Target.create({k: v for k, v in values.items() if k in field_names})
+        env.flush_all()
+        return record.id
+
+    scenarios = {
+        'GET list': lambda: ('GET', {'page': random.randint(1, pages), 'page_size': 20}, None),
+        'GET one': lambda: ('GET', {'id': random.choice(record_ids)}, None),
+        'POST': lambda: ('POST', {}, body()),
+        'PUT': lambda: ('PUT', {'id': random.choice(record_ids)}, body()),
+        'DELETE': lambda: ('DELETE', {'id': fresh_id()}, None),
+    }
+
+    patches = [
+        patch.object(dynamic_dispatch, 'json', _TimedJson(recorder)),
+        patch.object(Key, 'check_rate_limit', recorder.wrap('rate_limit', Key.check_rate_limit)),
+        patch.object(Log, 'log_request', recorder.wrap('log', Log.log_request)),
+        patch.object(DynamicApiController, '_authenticate',
+                     recorder.wrap('auth', DynamicApiController._authenticate)),
+    ]
+    for name in ('_handle_get_cached', '_handle_post', '_handle_put', '_handle_delete'):
+        patches.append(patch.object(
+            DynamicApiController, name, recorder.wrap('orm', getattr(DynamicApiController, name)),
+        ))
+    for name in ('_serialize_records', '_json_response', '_not_modified_response'):
+        patches.append(patch.object(
+            DynamicApiController, name,
+            recorder.wrap('serialize', getattr(DynamicApiController, name)),
+        ))
+    dispatch = recorder.wrap('dispatch', DynamicApiController.dispatch)
+
+    report = {}
+    for patcher in patches:
+        patcher.start()
+    try:
+        for scenario in SCENARIOS:
+            samples = []
+            for _i in range(iterations):
+                method, query, payload = scenarios[scenario]()
+                offline_request = _OfflineRequest(
+                    env, endpoint.endpoint_path, method,
+                    query=query, body=payload, headers=headers,
+                )
+                recorder.reset()
+                start_queries = env.cr.sql_log_count
+                start = time.perf_counter()
+                with patch.object(dynamic_dispatch, 'request', offline_request):
+                    response = dispatch(controller, slug, **{k: str(v) for k, v in query.items()})
+                total = time.perf_counter() - start
+                samples.append({
+                    'status': response.status_code,
+                    'total': total * 1000,
+                    'total_queries': env.cr.sql_log_count - start_queries,
+                    'times': {phase: value * 1000 for phase, value in recorder.times.items()},
+                    'queries': dict(recorder.queries),
+                })
+            report[scenario] = _summarise(samples)
+    finally:
+        for patcher in reversed(patches):
+            patcher.stop()
+    return report
+
+
+def format_report(report):
+    """Render ``run()`` output as a plain-text table."""
+    header = (
+        f"{'scenario':<10} {'n':>5} {'p50':>8} {'p95':>8} {'p99':>8} {'q/req':>6}  "
+        + ' '.join(f'{phase:>10}' for phase in PHASES)
+    )
+    lines = [header, '-' * len(header)]
+    for scenario, summary in report.items():
+        lines.append(
+            f"{scenario:<10} {summary['requests']:>5} "
+            f"{summary['p50_ms']:>8.2f} {summary['p95_ms']:>8.2f} {summary['p99_ms']:>8.2f} "
+            f"{summary['queries_per_request']:>6.1f}  "
+            + ' '.join(
+                f"{summary['phases'][phase]['mean_ms']:>6.2f}/{summary['phases'][phase]['queries']:<3.0f}"
+                for phase in PHASES
+            )
+        )
+    lines.append('phase columns: mean ms / queries per request (exclusive)')
+    return '\n'.join(lines)
@@ -16,13 +16,19 @@ This route never changes.  At each incoming HTTP request the handler:
   3. Validates auth (public / api_key / session)
   4. Dispatches to _handle_get / _handle_post / _handle_put / _handle_delete
   5. Serialises the ORM result using the endpoint's field alias map
-  6. Writes a log entry
-  7. Returns a standard JSON envelope
+  6. Checks the endpoint's query budget (optional)
+  7. Builds the JSON envelope, writes a log entry (with SQL / time / size
+     instrumentation when enabled) and returns the response
 
 No Odoo restart is required when adding new endpoints.  The ormcache is busted
 by dynamic.api.endpoint.write / create / unlink.  The next request after a
 cache miss re-reads from the DB and re-populates the cache automatically.
 
+Auxiliary routes (opt-in per endpoint)
+--------------------------------------
+    /api/dynamic/export/<slug>   streaming NDJSON / CSV dump   (allow_export)
+    /api/dynamic/batch/<slug>    bulk create / update / delete (allow_batch)
+
 Standard response envelope
 --------------------------
 {
@@ -32,11 +38,36 @@ Standard response envelope
     "meta":    { "total": N, "page": P, "page_size": S, "method": "GET" }
 }
 """
+import csv
+import hashlib
+import io
 import json
 import time
 import logging
 from odoo import http, api, SUPERUSER_ID, _
-from odoo.http import request
+from odoo.http import request, Response
+from odoo.modules.registry import Registry
+from werkzeug.http import http_date
+
+from ..utils.compression import DEFAULT_MIN_SIZE, choose_encoding, compress
+from ..utils.expansion import (
+    InvalidExpansion,
+    authorized_related_plan,
+    expand_rows,
+    parse_expand,
+    parse_fields,
+    present_row,
+)
+from ..utils.instrumentation import RequestMetrics, slow_request_sampler
+from ..utils.keyset import (
+    InvalidCursor,
+    decode_cursor,
+    encode_cursor,
+    keyset_domain,
+    keyset_order_clause,
+    parse_keyset_order,
+)
+from ..utils.response_cache import response_cache
 
 _logger = logging.getLogger(__name__)
 
@@ -44,6 +75,86 @@ _logger = logging.getLogger(__name__)
 DEFAULT_PAGE_SIZE = 100
 MAX_PAGE_SIZE = 1000
 
+# Batch mode
+DEFAULT_BATCH_MAX_SIZE = 100
+BATCH_OPERATIONS = {
+    'create': 'allow_post',
+    'update': 'allow_put',
+    'delete': 'allow_delete',
+}
+
+# Streaming export
+EXPORT_CHUNK_SIZE = 500
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+def _stream_export(dbname, model_name, domain, field_names, alias_map,
+                   export_format, chunk_size):
+    """
+    Generator yielding the export body chunk by chunk.
+
+    Werkzeug consumes it after the request cursor has been closed, so it
+    opens its own cursor.  Rows are fetched by id keyset (``id > last``) and
+    the ORM cache is dropped after each chunk: at most ``chunk_size`` records
+    are held in memory at any time.
+    """
+    columns = ['id'] + [f for f in field_names if f != 'id']
+    header = [alias_map.get(f, f) for f in columns]
+
+    with Registry(dbname).cursor() as cr:
+        env = api.Environment(cr, SUPERUSER_ID, {})
+        model = env[model_name]
+        field_types = {f: model._fields[f].type for f in columns if f in model._fields}
+
+        if export_format == 'csv':
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(header)
+            yield buffer.getvalue().encode('utf-8')
+
+        last_id = 0
+        while True:
+            records = model.search(domain + [('id', '>', last_id)], order='id', limit=chunk_size)
+            if not records:
+                break
+            last_id = records[-1].id
+
+            if export_format == 'csv':
+                buffer.seek(0)
+                buffer.truncate()
+                for row in records.read(columns, load=None):
+                    writer.writerow([
+                        _csv_value(row.get(f), field_types.get(f)) for f in columns
+                    ])
+                yield buffer.getvalue().encode('utf-8')
+            else:
+                lines = [
+                    json.dumps(
+                        {alias_map.get(k, k): v for k, v in row.items()},
+                        default=str, ensure_ascii=False,
+                    )
+                    for row in records.read(columns)
+                ]
+                yield ('\n'.join(lines) + '\n').encode('utf-8')
+
+            env.invalidate_all()
+            if len(records) < chunk_size:
+                break
+
+
+def _csv_value(value, field_type):
+    """Flatten an ORM read() value (load=None) into a CSV cell."""
+    if field_type == 'boolean':
+        return 'true' if value else 'false'
+    if value is False or value is None:
+        return ''
+    if isinstance(value, (list, tuple)):
+        return ' '.join(str(v) for v in value)
+    return value
+
 
 class DynamicApiController(http.Controller):
     """Single master controller for all dynamic REST endpoints."""
@@ -82,6 +193,7 @@ class DynamicApiController(http.Controller):
 
         # ── Step 1: look up endpoint (cached) ────────────────────────────────
         env = request.env(user=SUPERUSER_ID)
+        metrics = RequestMetrics(env.cr)
         endpoint = env['dynamic.api.endpoint']._get_endpoint_for_request(full_path)
 
         if not endpoint:
@@ -91,7 +203,8 @@ class DynamicApiController(http.Controller):
             )
 
         # ── Step 2: method allowed? ───────────────────────────────────────────
-        allowed_methods = endpoint.get_allowed_methods()
+        plan = endpoint.get_execution_plan()
+        allowed_methods = list(plan.allowed_methods)
         if http_method not in allowed_methods:
             return self._json_response(
                 {
@@ -103,34 +216,12 @@ class DynamicApiController(http.Controller):
                 extra_headers={'Allow': ', '.join(allowed_methods)},
             )
 
-        # ── Step 3: authentication ────────────────────────────────────────────
-        auth_user = None
-        api_key_rec = None
-        try:
-            auth_user, api_key_rec = self._authenticate(endpoint, env)
-        except Exception as exc:
-            elapsed_ms = int((time.monotonic() - start_time) * 1000)
-            env['dynamic.api.log'].log_request(
-                endpoint, http_method,
-                self._get_client_ip(), None, 401, elapsed_ms,
-                error=str(exc),
-            )
-            return self._json_response(
-                {'success': False, 'data': None, 'error': str(exc), 'meta': {}},
-                status=401,
-            )
-
-        # ── Step 4: rate limiting ─────────────────────────────────────────────
-        if api_key_rec and endpoint.rate_limit:
-            if not api_key_rec.check_rate_limit(endpoint):
-                return self._json_response(
-                    {
-                        'success': False, 'data': None,
-                        'error': 'Rate limit exceeded. Please retry after a minute.',
-                        'meta': {},
-                    },
-                    status=429,
-                )
+        # ── Step 3 + 4: authentication & rate limiting ───────────────────────
+        auth_user, api_key_rec, error_response = self._authorize(
+            endpoint, env, http_method, start_time,
+        )
+        if error_response:
+            return error_response
 
         # ── Step 5: parse request body ────────────────────────────────────────
         payload = {}
@@ -151,31 +242,85 @@ class DynamicApiController(http.Controller):
                     )
 
         # ── Step 6: dispatch ──────────────────────────────────────────────────
+        settings = env['dynamic.api.log']._get_instrumentation_settings()
+        sample_token = (
+            slow_request_sampler.watch(settings['slow_ms']) if settings['slow_ms'] else None
+        )
+        profile_sample = ''
         try:
-            if http_method == 'GET':
-                response_body, status = self._handle_get(endpoint, env, kwargs)
-            elif http_method == 'POST':
-                response_body, status = self._handle_post(endpoint, env, payload)
-            elif http_method == 'PUT':
-                response_body, status = self._handle_put(endpoint, env, payload, kwargs)
-            elif http_method == 'DELETE':
-                response_body, status = self._handle_delete(endpoint, env, kwargs)
-            else:
+            response_headers = {}
+            try:
+                if http_method == 'GET':
+                    response_body, status = self._handle_get_cached(
+                        endpoint, env, kwargs, response_headers, api_key_rec,
+                    )
+                elif http_method == 'POST':
+                    response_body, status = self._handle_post(endpoint, env, payload)
+                elif http_method == 'PUT':
+                    response_body, status = self._handle_put(endpoint, env, payload, kwargs)
+                elif http_method == 'DELETE':
+                    response_body, status = self._handle_delete(endpoint, env, kwargs)
+                else:
+                    response_body = {
+                        'success': False, 'data': None,
+                        'error': 'Unsupported method', 'meta': {},
+                    }
+                    status = 405
+            except Exception as exc:
+                _logger.exception('DynamicAPI: unhandled error in %s %s', http_method, full_path)
                 response_body = {
                     'success': False, 'data': None,
-                    'error': 'Unsupported method', 'meta': {},
+                    'error': str(exc), 'meta': {},
                 }
-                status = 405
-        except Exception as exc:
-            _logger.exception('DynamicAPI: unhandled error in %s %s', http_method, full_path)
-            response_body = {
-                'success': False, 'data': None,
-                'error': str(exc), 'meta': {},
-            }
-            status = 500
+                status = 500
+
+            # ── Step 6b: query budget ─────────────────────────────────────────
+            budget = endpoint.query_budget
+            sql_count = metrics.sql_count
+            if budget and sql_count > budget:
+                if endpoint.query_budget_action == 'reject':
+                    env.cr.rollback()
+                    env.invalidate_all(flush=False)
+                    response_headers = {}
+                    response_body = {
+                        'success': False, 'data': None,
+                        'error': f'Query budget exceeded: {sql_count} queries '
+                                 f'(budget {budget}).',
+                        'meta': {},
+                    }
+                    status = 503
+                else:
+                    _logger.warning(
+                        'DynamicAPI: %s %s issued %d queries (budget %d)',
+                        http_method, full_path, sql_count, budget,
+                    )
+                response_headers['X-Query-Budget-Exceeded'] = f'{sql_count}/{budget}'
+
+            # ── Step 7: respond & log ─────────────────────────────────────────
+            if status == 304:
+                response = self._not_modified_response(response_headers, endpoint.cors_origins)
+            else:
+                response = self._json_response(response_body, status=status,
+                                               extra_headers=response_headers,
+                                               cors_origins=endpoint.cors_origins)
+        finally:
+            if sample_token:
+                profile_sample = slow_request_sampler.release(sample_token)
 
-        # ── Step 7: log ───────────────────────────────────────────────────────
         elapsed_ms = int((time.monotonic() - start_time) * 1000)
+        log_metrics = None
+        is_slow = bool(settings['slow_ms']) and elapsed_ms >= settings['slow_ms']
+        if settings['enabled'] or is_slow:
+            log_metrics = metrics.snapshot(
+                response_size=len(response.get_data()) if status != 304 else 0,
+            )
+            log_metrics['is_slow'] = is_slow
+            if is_slow:
+                log_metrics['profile_sample'] = profile_sample or False
+                _logger.warning(
+                    'DynamicAPI: slow request %s %s took %d ms (%d queries)',
+                    http_method, full_path, elapsed_ms, log_metrics['sql_count'],
+                )
         env['dynamic.api.log'].log_request(
             endpoint=endpoint,
             method=http_method,
@@ -186,6 +331,192 @@ class DynamicApiController(http.Controller):
             user=auth_user,
             api_key=api_key_rec,
             query_params=dict(request.httprequest.args) if http_method == 'GET' else None,
+            metrics=log_metrics,
+        )
+        return response
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Streaming export route
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @http.route(
+        '/api/dynamic/export/<path:endpoint_path>',
+        auth='none',
+        type='http',
+        methods=['GET'],
+        csrf=False,
+        save_session=False,
+        cors='*',
+    )
+    def export(self, endpoint_path, **kwargs):
+        """
+        Full dump of an endpoint's model as NDJSON (default) or CSV.
+
+        GET /api/dynamic/export/<slug>?format=ndjson|csv&domain=[...]&chunk_size=500
+
+        Authentication, rate limiting and logging happen once per export
+        instead of once per page.  Records are read in id-keyset chunks on a
+        dedicated cursor while the response is being sent, so memory stays
+        constant whatever the size of the table.
+        """
+        start_time = time.monotonic()
+        full_path = f'/api/dynamic/{endpoint_path}'
+
+        env = request.env(user=SUPERUSER_ID)
+        endpoint = env['dynamic.api.endpoint']._get_endpoint_for_request(full_path)
+        if not endpoint or not endpoint.allow_get or not endpoint.allow_export:
+            return self._json_response(
+                {'success': False, 'data': None, 'error': 'Export not available', 'meta': {}},
+                status=404,
+            )
+
+        auth_user, api_key_rec, error_response = self._authorize(
+            endpoint, env, 'GET', start_time,
+        )
+        if error_response:
+            return error_response
+
+        export_format = (kwargs.get('format') or 'ndjson').lower()
+        if export_format not in EXPORT_FORMATS:
+            return self._json_response(
+                {'success': False, 'data': None,
+                 'error': f'Unsupported format. Use one of: {", ".join(EXPORT_FORMATS)}',
+                 'meta': {}},
+                status=400,
+            )
+
+        plan = endpoint.get_execution_plan()
+        readable_fields = list(plan.readable_fields)
+        alias_map = plan.alias_map
+        if not readable_fields:
+            return self._json_response(
+                {'success': False, 'data': None,
+                 'error': 'No fields configured for this endpoint.', 'meta': {}},
+                status=400,
+            )
+
+        domain = []
+        if kwargs.get('domain'):
+            try:
+                domain = json.loads(kwargs['domain'])
+                if not isinstance(domain, list):
+                    raise ValueError('domain must be a JSON array')
+                unknown = plan.unknown_domain_field(domain)
+                if unknown:
+                    raise ValueError(f'unknown field {unknown!r}')
+            except (json.JSONDecodeError, ValueError) as e:
+                return self._json_response(
+                    {'success': False, 'data': None,
+                     'error': f'Invalid domain: {e}', 'meta': {}},
+                    status=400,
+                )
+
+        try:
+            chunk_size = min(
+                MAX_PAGE_SIZE,
+                max(1, int(kwargs.get('chunk_size', EXPORT_CHUNK_SIZE))),
+            )
+        except ValueError:
+            chunk_size = EXPORT_CHUNK_SIZE
+
+        env['dynamic.api.log'].log_request(
+            endpoint=endpoint,
+            method='GET',
+            request_ip=self._get_client_ip(),
+            payload_str=None,
+            response_code=200,
+            response_time_ms=int((time.monotonic() - start_time) * 1000),
+            user=auth_user,
+            api_key=api_key_rec,
+            query_params=dict(request.httprequest.args),
+        )
+
+        body = _stream_export(
+            env.cr.dbname, endpoint.model_name, domain,
+            readable_fields, alias_map, export_format, chunk_size,
+        )
+        slug = endpoint_path.strip('/').replace('/', '-') or 'export'
+        headers = [
+            ('Content-Type', EXPORT_FORMATS[export_format]),
+            ('Content-Disposition', f'attachment; filename="{slug}.{export_format}"'),
+            ('Access-Control-Allow-Origin', endpoint.cors_origins or '*'),
+            ('X-Powered-By', 'Odoo Dynamic REST API'),
+        ]
+        return Response(body, headers=headers, status=200, direct_passthrough=True)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Batch route
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @http.route(
+        '/api/dynamic/batch/<path:endpoint_path>',
+        auth='none',
+        type='http',
+        methods=['POST', 'OPTIONS'],
+        csrf=False,
+        save_session=False,
+        cors='*',
+    )
+    def batch(self, endpoint_path, **kwargs):
+        """
+        Run many create/update/delete operations in one HTTP call.
+
+        POST /api/dynamic/batch/<slug>
+        body: {"operations": [
+                  {"op": "create", "data": {...}},
+                  {"op": "update", "id": 42, "data": {...}},
+                  {"op": "delete", "id": 43}
+              ]}
+        (a bare JSON array of operations is accepted as well)
+
+        Authentication, rate limiting, logging and the commit happen once for
+        the whole batch.  See _handle_batch for execution semantics.
+        """
+        start_time = time.monotonic()
+        if request.httprequest.method.upper() == 'OPTIONS':
+            return self._cors_preflight_response()
+
+        full_path = f'/api/dynamic/{endpoint_path}'
+        env = request.env(user=SUPERUSER_ID)
+        endpoint = env['dynamic.api.endpoint']._get_endpoint_for_request(full_path)
+        if not endpoint or not endpoint.allow_batch:
+            return self._json_response(
+                {'success': False, 'data': None, 'error': 'Batch not available', 'meta': {}},
+                status=404,
+            )
+
+        auth_user, api_key_rec, error_response = self._authorize(
+            endpoint, env, 'POST', start_time,
+        )
+        if error_response:
+            return error_response
+
+        raw_body = request.httprequest.get_data(as_text=True)
+        try:
+            payload = json.loads(raw_body) if raw_body else None
+        except json.JSONDecodeError as e:
+            return self._json_response(
+                {'success': False, 'data': None,
+                 'error': f'Invalid JSON body: {e}', 'meta': {}},
+                status=400,
+            )
+
+        try:
+            response_body, status = self._handle_batch(endpoint, env, payload)
+        except Exception as exc:
+            _logger.exception('DynamicAPI: unhandled error in batch %s', full_path)
+            response_body = {'success': False, 'data': None, 'error': str(exc), 'meta': {}}
+            status = 500
+
+        env['dynamic.api.log'].log_request(
+            endpoint=endpoint,
+            method='POST',
+            request_ip=self._get_client_ip(),
+            payload_str=raw_body,
+            response_code=status,
+            response_time_ms=int((time.monotonic() - start_time) * 1000),
+            user=auth_user,
+            api_key=api_key_rec,
         )
 
         return self._json_response(response_body, status=status,
@@ -195,6 +526,39 @@ class DynamicApiController(http.Controller):
     # Authentication
     # ─────────────────────────────────────────────────────────────────────────
 
+    def _authorize(self, endpoint, env, http_method, start_time):
+        """
+        Authenticate the caller and apply the rate limit.
+        Returns (user, api_key_rec, error_response); error_response is None
+        when the request may proceed.
+        """
+        try:
+            auth_user, api_key_rec = self._authenticate(endpoint, env)
+        except Exception as exc:
+            elapsed_ms = int((time.monotonic() - start_time) * 1000)
+            env['dynamic.api.log'].log_request(
+                endpoint, http_method,
+                self._get_client_ip(), None, 401, elapsed_ms,
+                error=str(exc),
+            )
+            return None, None, self._json_response(
+                {'success': False, 'data': None, 'error': str(exc), 'meta': {}},
+                status=401,
+            )
+
+        if api_key_rec and endpoint.rate_limit:
+            if not api_key_rec.check_rate_limit(endpoint):
+                return auth_user, api_key_rec, self._json_response(
+                    {
+                        'success': False, 'data': None,
+                        'error': 'Rate limit exceeded. Please retry after a minute.',
+                        'meta': {},
+                    },
+                    status=429,
+                )
+
+        return auth_user, api_key_rec, None
+
     def _authenticate(self, endpoint, env):
         """
         Returns (user_recordset, api_key_recordset|None).
@@ -225,20 +589,84 @@ class DynamicApiController(http.Controller):
     # Method handlers
     # ─────────────────────────────────────────────────────────────────────────
 
-    def _handle_get(self, endpoint, env, qs_params):
+    def _handle_get_cached(self, endpoint, env, qs_params, response_headers,
+                           api_key_rec=None):
+        """
+        Serve GET from the short-TTL response cache when the endpoint enables
+        it (cache_ttl > 0), otherwise delegate to _handle_get.  Successful
+        responses are stored together with their ETag / Last-Modified.
+        """
+        # Expanded responses embed other models, whose writes do not
+        # invalidate this endpoint's entries — never cache them.
+        if not endpoint.cache_ttl or qs_params.get('expand'):
+            return self._handle_get(endpoint, env, qs_params, response_headers,
+                                    api_key_rec)
+
+        cache_key = response_cache.make_key(
+            env.cr.dbname, endpoint.id, endpoint.get_execution_plan().alias_map, qs_params,
+        )
+        cached = response_cache.get(cache_key)
+        if cached:
+            body, validators = cached
+            response_headers.update(validators)
+            response_headers['X-Cache'] = 'HIT'
+            if self._if_none_match(validators.get('ETag')):
+                return None, 304
+            return body, 200
+
+        # Taken before the read: a write committed meanwhile makes the entry stale
+        generation = response_cache.generation(env.cr.dbname, endpoint.model_name)
+        body, status = self._handle_get(endpoint, env, qs_params, response_headers,
+                                        api_key_rec)
+        response_headers['X-Cache'] = 'MISS'
+        if status == 200:
+            validators = {k: v for k, v in response_headers.items()
+                          if k in ('ETag', 'Last-Modified')}
+            response_cache.put(cache_key, endpoint.model_name, (body, validators),
+                               endpoint.cache_ttl, generation)
+        return body, status
+
+    def _handle_get(self, endpoint, env, qs_params, response_headers=None,
+                    api_key_rec=None):
         """
         GET  /api/dynamic/<slug>            → list records (paginated)
         GET  /api/dynamic/<slug>?id=42      → single record
         GET  /api/dynamic/<slug>?domain=[]  → filtered list (JSON domain)
+        GET  /api/dynamic/<slug>?cursor=…   → next page (cursor pagination mode)
+
+        Any of them accepts ``fields=a,b`` (projection) and ``expand=a.b``
+        (nested related records), see utils/expansion.py.  Lists accept
+        ``layout=columns`` for a compact column-oriented ``data`` object.
         """
         model = env[endpoint.model_name].sudo()
-        readable_fields = endpoint.get_readable_field_names()
-        alias_map = endpoint.get_field_alias_map()
+        plan = endpoint.get_execution_plan()
+        readable_fields = list(plan.readable_fields)
+        alias_map = plan.alias_map
 
         if not readable_fields:
             return {'success': False, 'data': None,
                     'error': 'No fields configured for this endpoint.', 'meta': {}}, 400
 
+        # Projection and expansion
+        related_plan = self._related_plan_resolver(env, api_key_rec)
+        try:
+            read_fields = parse_fields(qs_params.get('fields'), plan)
+            expand_tree = parse_expand(qs_params.get('expand'), plan, related_plan)
+        except InvalidExpansion as e:
+            return {'success': False, 'data': None, 'error': str(e), 'meta': {}}, 400
+        read_fields += [name for name in expand_tree if name not in read_fields]
+
+        # Output layout for lists: one object per record, or one array per column
+        layout = qs_params.get('layout', 'records')
+        if layout not in ('records', 'columns'):
+            return {'success': False, 'data': None,
+                    'error': 'layout must be "records" or "columns".', 'meta': {}}, 400
+
+        # The validators only cover this model's rows: expanded responses
+        # are always sent in full, without ETag / Last-Modified.
+        conditional = not expand_tree
+        validator_headers = response_headers if conditional else None
+
         # Single-record lookup
         record_id = qs_params.get('id')
         if record_id:
@@ -251,7 +679,15 @@ class DynamicApiController(http.Controller):
             if not records:
                 return {'success': False, 'data': None,
                         'error': f'Record {record_id} not found.', 'meta': {}}, 404
-            data = self._serialize_records(records, readable_fields, alias_map)
+            etag = self._set_validators(
+                validator_headers, endpoint, alias_map,
+                records.read(list(plan.validator_fields)),
+                extra=[read_fields],
+            )
+            if conditional and self._if_none_match(etag):
+                return None, 304
+            data = self._present_rows(env, plan, records.read(read_fields),
+                                      read_fields, expand_tree, related_plan)
             return {
                 'success': True, 'data': data[0] if data else None,
                 'error': None, 'meta': {'method': 'GET', 'id': record_id},
@@ -265,6 +701,9 @@ class DynamicApiController(http.Controller):
                 domain = json.loads(domain_param)
                 if not isinstance(domain, list):
                     raise ValueError('domain must be a JSON array')
+                unknown = plan.unknown_domain_field(domain)
+                if unknown:
+                    raise ValueError(f'unknown field {unknown!r}')
             except (json.JSONDecodeError, ValueError) as e:
                 return {'success': False, 'data': None,
                         'error': f'Invalid domain: {e}', 'meta': {}}, 400
@@ -279,42 +718,112 @@ class DynamicApiController(http.Controller):
         except ValueError:
             page, page_size = 1, DEFAULT_PAGE_SIZE
 
-        # Order
-        order = qs_params.get('order', 'id asc')
-        # Sanitise order to prevent injection: allow only word chars and asc/desc
-        import re
-        if not re.match(r'^[a-zA-Z0-9_]+(?: (?:asc|desc))?(?:, ?[a-zA-Z0-9_]+(?: (?:asc|desc))?)*$', order, re.I):
-            order = 'id asc'
+        # Order — sanitised against injection and restricted to stored fields
+        order = plan.sanitize_order(qs_params.get('order', 'id asc'))
+
+        if endpoint.pagination_mode == 'cursor':
+            return self._handle_get_cursor(
+                endpoint, model, domain, order, page_size, qs_params.get('cursor'),
+                read_fields, alias_map, validator_headers,
+                expand_tree=expand_tree, conditional=conditional, layout=layout,
+                related_plan=related_plan,
+            )
 
         total = model.search_count(domain)
         offset = (page - 1) * page_size
 
-        records = model.search_read(
+        # Cheap first pass: ids + write_date of the page, enough to build the
+        # ETag and answer If-None-Match before reading the exposed fields.
+        page_rows = model.search_read(
             domain=domain,
-            fields=readable_fields,
+            fields=list(plan.validator_fields),
             limit=page_size,
             offset=offset,
             order=order,
         )
+        etag = self._set_validators(
+            validator_headers, endpoint, alias_map, page_rows,
+            extra=[domain, order, page, page_size, total, read_fields, layout],
+        )
+        if conditional and self._if_none_match(etag):
+            return None, 304
+
+        records = model.browse([row['id'] for row in page_rows]).read(read_fields)
+        data = self._present_rows(env, plan, records, read_fields, expand_tree,
+                                  related_plan)
+
+        meta = {
+            'method': 'GET',
+            'total': total,
+            'page': page,
+            'page_size': page_size,
+            'pages': (total + page_size - 1) // page_size if page_size else 1,
+        }
+        if layout == 'columns':
+            data = self._to_columns(data, plan, read_fields)
+            meta['layout'] = 'columns'
+        return {'success': True, 'data': data, 'error': None, 'meta': meta}, 200
+
+    def _handle_get_cursor(self, endpoint, model, domain, order, page_size, cursor,
+                           readable_fields, alias_map, response_headers=None,
+                           expand_tree=None, conditional=True, layout='records',
+                           related_plan=None):
+        """
+        Keyset pagination: every page is fetched with ``WHERE key > last``
+        instead of ``OFFSET``, so page N costs the same as page 1.
+        No total count is computed (that would scan the whole result set).
+        """
+        sort_field, direction = parse_keyset_order(model, order)
+        search_domain = list(domain)
+        if cursor:
+            try:
+                last_value, last_id = decode_cursor(cursor, sort_field, direction)
+            except InvalidCursor as e:
+                return {'success': False, 'data': None,
+                        'error': str(e), 'meta': {}}, 400
+            search_domain += keyset_domain(sort_field, direction, last_value, last_id)
 
-        # Apply alias renaming
-        data = [
-            {alias_map.get(k, k): v for k, v in rec.items() if k in alias_map or k == 'id'}
-            for rec in records
-        ]
+        fetch_fields = list(readable_fields)
+        for extra_field in (sort_field,) + endpoint.get_execution_plan().validator_fields:
+            if extra_field != 'id' and extra_field not in fetch_fields:
+                fetch_fields.append(extra_field)
 
-        return {
-            'success': True,
-            'data': data,
-            'error': None,
-            'meta': {
-                'method': 'GET',
-                'total': total,
-                'page': page,
-                'page_size': page_size,
-                'pages': (total + page_size - 1) // page_size if page_size else 1,
-            },
-        }, 200
+        # One extra row tells us whether another page exists
+        records = model.search_read(
+            domain=search_domain,
+            fields=fetch_fields,
+            limit=page_size + 1,
+            order=keyset_order_clause(sort_field, direction),
+        )
+        has_more = len(records) > page_size
+        records = records[:page_size]
+        next_cursor = (
+            encode_cursor(sort_field, direction, records[-1])
+            if has_more and records else None
+        )
+        etag = self._set_validators(
+            response_headers, endpoint, alias_map, records,
+            extra=[domain, sort_field, direction, cursor, has_more, readable_fields, layout],
+        )
+        if conditional and self._if_none_match(etag):
+            return None, 304
+
+        plan = endpoint.get_execution_plan()
+        data = self._present_rows(model.env, plan, records, readable_fields, expand_tree,
+                                  related_plan)
+
+        meta = {
+            'method': 'GET',
+            'pagination': 'cursor',
+            'page_size': page_size,
+            'order': f'{sort_field} {direction}',
+            'has_more': has_more,
+            'next_cursor': next_cursor,
+        }
+        if layout == 'columns':
+            data = self._to_columns(data, plan, readable_fields)
+            meta['layout'] = 'columns'
+        return {'success': True, 'data': data, 'error': None, 'meta': meta}, 200
 
     def _handle_post(self, endpoint, env, payload):
         """
@@ -325,21 +834,18 @@ class DynamicApiController(http.Controller):
             return {'success': False, 'data': None,
                     'error': 'POST not enabled for this endpoint.', 'meta': {}}, 405
 
-        writable_fields = endpoint.get_writable_field_names()
-        reverse_map = endpoint.get_reverse_alias_map()
-        alias_map = endpoint.get_field_alias_map()
-        readable_fields = endpoint.get_readable_field_names()
+        plan = endpoint.get_execution_plan()
+        writable_fields = plan.writable_fields
+        reverse_map = plan.reverse_alias_map
+        alias_map = plan.alias_map
+        readable_fields = list(plan.readable_fields)
 
         if not isinstance(payload, dict):
             return {'success': False, 'data': None,
                     'error': 'Request body must be a JSON object.', 'meta': {}}, 400
 
         # Translate aliases back to field names, filter to writable only
-        write_vals = {}
-        for key, value in payload.items():
-            field_name = reverse_map.get(key, key)
-            if field_name in writable_fields:
-                write_vals[field_name] = value
+        write_vals = self._to_write_vals(payload, writable_fields, reverse_map)
 
         if not write_vals:
             return {'success': False, 'data': None,
@@ -378,20 +884,17 @@ class DynamicApiController(http.Controller):
             return {'success': False, 'data': None,
                     'error': 'id must be an integer.', 'meta': {}}, 400
 
-        writable_fields = endpoint.get_writable_field_names()
-        reverse_map = endpoint.get_reverse_alias_map()
-        alias_map = endpoint.get_field_alias_map()
-        readable_fields = endpoint.get_readable_field_names()
+        plan = endpoint.get_execution_plan()
+        writable_fields = plan.writable_fields
+        reverse_map = plan.reverse_alias_map
+        alias_map = plan.alias_map
+        readable_fields = list(plan.readable_fields)
 
         if not isinstance(payload, dict):
             return {'success': False, 'data': None,
                     'error': 'Request body must be a JSON object.', 'meta': {}}, 400
 
-        write_vals = {}
-        for key, value in payload.items():
-            field_name = reverse_map.get(key, key)
-            if field_name in writable_fields:
-                write_vals[field_name] = value
+        write_vals = self._to_write_vals(payload, writable_fields, reverse_map)
 
         if not write_vals:
             return {'success': False, 'data': None,
@@ -447,6 +950,229 @@ class DynamicApiController(http.Controller):
             'meta': {'method': 'DELETE', 'id': record_id, 'deleted': True},
         }, 200
 
+    def _handle_batch(self, endpoint, env, payload):
+        """
+        Validate every operation, then execute them in request order as runs
+        of consecutive operations of the same kind, each run with batched ORM
+        calls:
+
+          create  one create(vals_list) for the run
+          update  one write() per group of items sharing identical values
+          delete  one unlink() for the run
+
+        A run ends where the kind changes or an item targets a record the run
+        already touches, so ``update 5, update 5`` or ``delete 5, update 5``
+        give the same result as applying the items one by one.
+
+        Each batched call runs in a savepoint.  If it fails, the run is
+        replayed item by item, each in its own savepoint, so one bad item
+        never rolls back the others.  Per-item results keep request order.
+        """
+        operations = payload.get('operations') if isinstance(payload, dict) else payload
+        if not isinstance(operations, list) or not operations:
+            return {'success': False, 'data': None,
+                    'error': 'Body must be a non-empty array of operations '
+                             '(or {"operations": [...]}).', 'meta': {}}, 400
+
+        max_size = endpoint.batch_max_size or DEFAULT_BATCH_MAX_SIZE
+        if len(operations) > max_size:
+            return {'success': False, 'data': None,
+                    'error': f'Batch too large: {len(operations)} operations '
+                             f'(max {max_size}).', 'meta': {}}, 413
+
+        plan = endpoint.get_execution_plan()
+        writable_fields = plan.writable_fields
+        reverse_map = plan.reverse_alias_map
+        alias_map = plan.alias_map
+        readable_fields = list(plan.readable_fields)
+        model = env[endpoint.model_name].sudo()
+
+        results = [None] * len(operations)
+        valid = []                       # (index, op, record_id, vals)
+
+        def fail(index, op, status, error, record_id=None):
+            results[index] = {
+                'index': index, 'op': op, 'success': False, 'status': status,
+                'id': record_id, 'data': None, 'error': error,
+            }
+
+        def done(index, op, status, record_id):
+            results[index] = {
+                'index': index, 'op': op, 'success': True, 'status': status,
+                'id': record_id, 'data': None, 'error': None,
+            }
+
+        # ── Validation ────────────────────────────────────────────────────────
+        for index, item in enumerate(operations):
+            if not isinstance(item, dict):
+                fail(index, None, 400, 'Operation must be a JSON object.')
+                continue
+            op = item.get('op')
+            if op not in BATCH_OPERATIONS:
+                fail(index, op, 400, f'Unknown op. Use one of: {", ".join(BATCH_OPERATIONS)}')
+                continue
+            if not getattr(endpoint, BATCH_OPERATIONS[op]):
+                fail(index, op, 405, f'{op} not enabled for this endpoint.')
+                continue
+
+            record_id = None
+            if op in ('update', 'delete'):
+                try:
+                    record_id = int(item.get('id'))
+                except (TypeError, ValueError):
+                    fail(index, op, 400, 'id must be an integer.')
+                    continue
+
+            if op == 'delete':
+                valid.append((index, op, record_id, None))
+                continue
+
+            data = item.get('data')
+            if not isinstance(data, dict):
+                fail(index, op, 400, 'data must be a JSON object.', record_id)
+                continue
+            write_vals = self._to_write_vals(data, writable_fields, reverse_map)
+            if not write_vals:
+                fail(index, op, 400, 'No writable fields found in data.', record_id)
+                continue
+            valid.append((index, op, record_id, write_vals))
+
+        # ── Handlers ──────────────────────────────────────────────────────────
+        def create_all(items):
+            records = model.create([vals for _i, vals in items])
+            for (index, _vals), record in zip(items, records):
+                done(index, 'create', 201, record.id)
+
+        def create_one(item):
+            index, vals = item
+            done(index, 'create', 201, model.create(vals).id)
+
+        def update_all(items):
+            model.browse([rid for _i, rid, _v in items]).write(items[0][2])
+            for index, record_id, _vals in items:
+                done(index, 'update', 200, record_id)
+
+        def update_one(item):
+            index, record_id, vals = item
+            model.browse(record_id).write(vals)
+            done(index, 'update', 200, record_id)
+
+        def delete_all(items):
+            model.browse([rid for _i, rid in items]).unlink()
+            for index, record_id in items:
+                done(index, 'delete', 200, record_id)
+
+        def delete_one(item):
+            index, record_id = item
+            model.browse(record_id).unlink()
+            done(index, 'delete', 200, record_id)
+
+        # ── Execution, run by run in request order ────────────────────────────
+        for op, run in self._batch_runs(valid):
+            if op == 'create':
+                self._run_in_savepoints(
+                    env, [(index, vals) for index, _op, _rid, vals in run],
+                    create_all, create_one,
+                    lambda item, exc: fail(item[0], 'create', 400, str(exc)),
+                )
+                continue
+
+            # Existence is checked per run: an earlier run may have deleted
+            # the record.  One query per run.
+            existing_ids = set(model.browse([item[2] for item in run]).exists().ids)
+            for index, _op, record_id, _vals in run:
+                if record_id not in existing_ids:
+                    fail(index, op, 404, f'Record {record_id} not found.', record_id)
+            run = [item for item in run if item[2] in existing_ids]
+
+            if op == 'delete':
+                self._run_in_savepoints(
+                    env, [(index, rid) for index, _op, rid, _vals in run],
+                    delete_all, delete_one,
+                    lambda item, exc: fail(item[0], 'delete', 400, str(exc), item[1]),
+                )
+                continue
+
+            # Records in one run are distinct: grouping cannot reorder writes
+            update_groups = {}
+            for index, _op, record_id, vals in run:
+                signature = json.dumps(vals, sort_keys=True, default=str)
+                update_groups.setdefault(signature, []).append((index, record_id, vals))
+            for group in update_groups.values():
+                self._run_in_savepoints(
+                    env, group, update_all, update_one,
+                    lambda item, exc: fail(item[0], 'update', 400, str(exc), item[1]),
+                )
+
+        # ── Read back created/updated records in one read() ───────────────────
+        written_ids = [
+            r['id'] for r in results
+            if r and r['success'] and r['op'] in ('create', 'update')
+        ]
+        if written_ids and readable_fields:
+            rows = self._serialize_records(model.browse(written_ids), readable_fields, alias_map)
+            data_by_id = {row['id']: row for row in rows if 'id' in row}
+            for result in results:
+                if result['success'] and result['op'] in ('create', 'update'):
+                    result['data'] = data_by_id.get(result['id'])
+
+        failed = sum(1 for r in results if not r['success'])
+        return {
+            'success': not failed,
+            'data': results,
+            'error': None if not failed else f'{failed} operation(s) failed.',
+            'meta': {
+                'method': 'BATCH',
+                'total': len(results),
+                'succeeded': len(results) - failed,
+                'failed': failed,
+            },
+        }, 200
+
+    @staticmethod
+    def _batch_runs(operations):
+        """
+        Split validated ``(index, op, record_id, vals)`` items into
+        ``(op, items)`` runs of consecutive operations of one kind in which
+        no record is targeted twice.
+        """
+        runs = []
+        current_op, current, touched = None, [], set()
+        for item in operations:
+            _index, op, record_id, _vals = item
+            if op != current_op or (record_id is not None and record_id in touched):
+                if current:
+                    runs.append((current_op, current))
+                current_op, current, touched = op, [], set()
+            current.append(item)
+            if record_id is not None:
+                touched.add(record_id)
+        if current:
+            runs.append((current_op, current))
+        return runs
+
+    @staticmethod
+    def _run_in_savepoints(env, items, apply_all, apply_one, on_error):
+        """
+        Apply ``apply_all(items)`` in one savepoint; if it raises, fall back to
+        ``apply_one(item)`` per item, each in its own savepoint, reporting
+        failures through ``on_error(item, exc)``.
+        """
+        if not items:
+            return
+        try:
+            with env.cr.savepoint():
+                apply_all(items)
+            return
+        except Exception:
+            _logger.debug('DynamicAPI: batched call failed, retrying item by item')
+        for item in items:
+            try:
+                with env.cr.savepoint():
+                    apply_one(item)
+            except Exception as exc:
+                on_error(item, exc)
+
     # ─────────────────────────────────────────────────────────────────────────
     # Helpers
     # ─────────────────────────────────────────────────────────────────────────
@@ -462,6 +1188,97 @@ class DynamicApiController(http.Controller):
             for row in raw_list
         ]
 
+    @staticmethod
+    def _related_plan_resolver(env, api_key_rec=None):
+        """
+        ``related_plan`` for expansion, limited to the endpoints this caller
+        could call directly (see utils/expansion.py).
+        """
+        return authorized_related_plan(
+            env['dynamic.api.endpoint'].get_plan_for_model,
+            session_uid=request.session.uid if request else None,
+            api_key_endpoint_ids=(
+                frozenset(api_key_rec.sudo().endpoint_ids.ids) if api_key_rec else None
+            ),
+        )
+
+    @staticmethod
+    def _present_rows(env, plan, rows, field_names, expand_tree=None, related_plan=None):
+        """
+        Expand the requested relations (one batched read per relation and
+        level), then keep the projected fields under their aliases.
+        """
+        if expand_tree:
+            expand_rows(env, rows, expand_tree, plan, related_plan)
+        return [present_row(row, field_names, plan) for row in rows]
+
+    @staticmethod
+    def _to_columns(rows, plan, field_names):
+        """
+        Column-oriented list layout: ``{"id": [1, 2], "name": ["a", "b"]}``.
+        Keys are not repeated per record, which roughly halves typical list
+        payloads before compression.
+        """
+        keys = ['id'] + [plan.alias_map.get(name, name) for name in field_names if name != 'id']
+        return {key: [row.get(key) for row in rows] for key in keys}
+
+    @staticmethod
+    def _set_validators(response_headers, endpoint, alias_map, rows, extra=None):
+        """
+        Derive a weak ETag from the endpoint's field layout, the record ids
+        and their write_date (plus list context such as total and page), and
+        a Last-Modified from the newest write_date.  Returns the ETag.
+
+        Models without write_date get no validators (and ``None``): an
+        id-only ETag would not change when a record is edited, so
+        If-None-Match would answer 304 with stale data.
+        """
+        if 'write_date' not in endpoint.get_execution_plan().validator_fields:
+            return None
+        write_dates = [row['write_date'] for row in rows if row.get('write_date')]
+        signature = json.dumps(
+            [
+                endpoint.id,
+                sorted(alias_map.items()),
+                [(row['id'], str(row.get('write_date') or '')) for row in rows],
+                extra,
+            ],
+            default=str,
+        )
+        etag = 'W/"%s"' % hashlib.sha1(signature.encode()).hexdigest()
+        if response_headers is not None:
+            response_headers['ETag'] = etag
+            if write_dates:
+                response_headers['Last-Modified'] = http_date(max(write_dates))
+        return etag
+
+    @staticmethod
+    def _if_none_match(etag):
+        """True when the client's If-None-Match already holds *etag*."""
+        header = request.httprequest.headers.get('If-None-Match', '')
+        if not etag or not header:
+            return False
+        opaque = etag[2:] if etag.startswith('W/') else etag
+        for candidate in header.split(','):
+            candidate = candidate.strip()
+            if candidate == '*':
+                return True
+            if candidate.startswith('W/'):
+                candidate = candidate[2:]
+            if candidate == opaque:
+                return True
+        return False
+
+    @staticmethod
+    def _to_write_vals(payload, writable_fields, reverse_map):
+        """Translate aliases back to field names, keeping writable fields only."""
+        write_vals = {}
+        for key, value in payload.items():
+            field_name = reverse_map.get(key, key)
+            if field_name in writable_fields:
+                write_vals[field_name] = value
+        return write_vals
+
     def _get_client_ip(self):
         """Extract the real client IP, respecting X-Forwarded-For."""
         forwarded_for = request.httprequest.headers.get('X-Forwarded-For', '')
@@ -488,7 +1305,44 @@ class DynamicApiController(http.Controller):
                                    'error': f'Serialisation error: {e}', 'meta': {}})
             status = 500
 
-        return request.make_response(body_str, headers=list(headers.items()), status=status)
+        body_bytes = body_str.encode('utf-8')
+        min_size = self._compression_min_size()
+        if min_size is not None:
+            headers['Vary'] = 'Accept-Encoding'
+            if len(body_bytes) >= min_size:
+                encoding = choose_encoding(request.httprequest.headers.get('Accept-Encoding'))
+                if encoding:
+                    body_bytes = compress(body_bytes, encoding)
+                    headers['Content-Encoding'] = encoding
+
+        return request.make_response(body_bytes, headers=list(headers.items()), status=status)
+
+    @staticmethod
+    def _compression_min_size():
+        """
+        Smallest body worth compressing, or None when compression is off:
+          dynamic_rest_api.compression           1 | 0   (default: 1)
+          dynamic_rest_api.compression_min_size  bytes   (default: 1024)
+        """
+        ICP = request.env['ir.config_parameter'].sudo()
+        if ICP.get_param('dynamic_rest_api.compression', default='1') in ('0', 'False', 'false'):
+            return None
+        try:
+            return max(0, int(ICP.get_param(
+                'dynamic_rest_api.compression_min_size', default=DEFAULT_MIN_SIZE,
+            )))
+        except (ValueError, TypeError):
+            return DEFAULT_MIN_SIZE
+
+    def _not_modified_response(self, extra_headers=None, cors_origins='*'):
+        """304 Not Modified: validators and CORS headers, no body."""
+        headers = {
+            'Access-Control-Allow-Origin': cors_origins or '*',
+            'X-Powered-By': 'Odoo Dynamic REST API',
+        }
+        if extra_headers:
+            headers.update(extra_headers)
+        return request.make_response('', headers=list(headers.items()), status=304)
 
     def _cors_preflight_response(self):
         """Handle OPTIONS pre-flight for CORS."""
@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
+from . import base
 from . import dynamic_api_endpoint
 from . import dynamic_api_field
 from . import dynamic_api_key
 from . import dynamic_api_log
+from . import dynamic_api_log_rollup
+from . import dynamic_api_rate_bucket
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from odoo import api, models
+
+from ..utils.response_cache import response_cache
+
+
+class Base(models.AbstractModel):
+    """
+    Invalidate cached dynamic API GET responses when the underlying model is
+    written to, from the API or anywhere else.  A write only records the
+    model name on the transaction; the generation is bumped once it commits,
+    and only for models that have cached responses in this worker.
+    """
+    _inherit = 'base'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        response_cache.touch_model_on_commit(self.env.cr, self._name)
+        return records
+
+    def write(self, vals):
+        result = super().write(vals)
+        response_cache.touch_model_on_commit(self.env.cr, self._name)
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        response_cache.touch_model_on_commit(self.env.cr, self._name)
+        return result
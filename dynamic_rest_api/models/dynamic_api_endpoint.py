@@ -4,6 +4,9 @@ import logging
 from odoo import api, fields, models, tools, _
 from odoo.exceptions import ValidationError, UserError
 
+from ..utils.endpoint_plan import EndpointPlan
+from ..utils.response_cache import response_cache
+
 _logger = logging.getLogger(__name__)
 
 
@@ -61,6 +64,21 @@ class DynamicApiEndpoint(models.Model):
     allow_post = fields.Boolean(string='POST', default=False)
     allow_put = fields.Boolean(string='PUT', default=False)
     allow_delete = fields.Boolean(string='DELETE', default=False)
+    allow_batch = fields.Boolean(
+        string='Batch Operations', default=False,
+        help='Expose POST /api/dynamic/batch/<slug> accepting many '
+             'create/update/delete operations in one request.  Each operation '
+             'still requires the matching POST/PUT/DELETE flag.',
+    )
+    batch_max_size = fields.Integer(
+        string='Max Batch Size', default=100,
+        help='Maximum number of operations accepted in one batch request.',
+    )
+    allow_export = fields.Boolean(
+        string='Streaming Export', default=False,
+        help='Expose GET /api/dynamic/export/<slug>?format=ndjson|csv, a '
+             'constant-memory full dump of the model (requires GET).',
+    )
 
     # ── Field selection ───────────────────────────────────────────────────────
 
@@ -105,8 +123,66 @@ class DynamicApiEndpoint(models.Model):
         string='Rate Limit (req/min)', default=60,
         help='Maximum requests per minute per API key (0 = unlimited).',
     )
+    rate_limit_strategy = fields.Selection(
+        selection=[
+            ('memory', 'In-Memory Token Bucket (per worker)'),
+            ('shared', 'Shared Table (all workers)'),
+        ],
+        string='Rate Limit Strategy', default='memory', required=True,
+        help='In-memory buckets cost nothing per request but are enforced per '
+             'worker process.  The shared table enforces the exact limit '
+             'across all workers with one UPSERT per request.',
+    )
+
+    # ── Pagination ────────────────────────────────────────────────────────────
+
+    pagination_mode = fields.Selection(
+        selection=[
+            ('offset', 'Page Number (offset)'),
+            ('cursor', 'Cursor (keyset)'),
+        ],
+        string='Pagination', default='offset', required=True,
+        help='Cursor mode returns an opaque next_cursor instead of page numbers; '
+             'deep pages cost the same as the first one.  Sorting is limited to '
+             'id or a stored date/datetime field.',
+    )
+
+    # ── Query budget ──────────────────────────────────────────────────────────
+
+    query_budget = fields.Integer(
+        string='Query Budget', default=0,
+        help='Maximum SQL queries one request may issue (0 = no budget).',
+    )
+    query_budget_action = fields.Selection(
+        selection=[
+            ('warn', 'Warn (log + response header)'),
+            ('reject', 'Reject (roll back, 503)'),
+        ],
+        string='When Over Budget', default='warn', required=True,
+    )
+
+    # ── Nested expansion ──────────────────────────────────────────────────────
+
+    expand_depth = fields.Integer(
+        string='Max Expansion Depth', default=1,
+        help='Maximum length of an expand= path such as customer.country '
+             '(0 disables expansion, capped at 3).  Only field lines marked '
+             '"Expandable" can be expanded.',
+    )
+
+    # ── Response caching ──────────────────────────────────────────────────────
+
+    cache_ttl = fields.Integer(
+        string='Response Cache TTL (s)', default=0,
+        help='Cache GET responses in each worker for this many seconds '
+             '(0 = disabled).  Entries are dropped when a create, write or '
+             'delete on the model commits in the same worker, whether it came '
+             'from the API or the backend.  Changes committed by other '
+             'workers, or made with raw SQL, are seen after at most the TTL.  '
+             'ETag / If-None-Match work regardless.',
+    )
 
-    # ── Computed stats (no store — live from log table) ───────────────────────
+    # ── Computed stats (no store — read from the rollup table) ────────────────
 
     request_count = fields.Integer(
         string='Total Requests', compute='_compute_stats',
@@ -131,11 +207,14 @@ class DynamicApiEndpoint(models.Model):
                 rec.endpoint_path = False
 
     def _compute_stats(self):
-        Log = self.env['dynamic.api.log']
+        # Daily rollup + not-yet-rolled tail: never scans the full log table
+        totals = self.env['dynamic.api.log.rollup'].sudo().get_endpoint_totals(
+            [rec_id for rec_id in self.ids if isinstance(rec_id, int)]
+        )
         for rec in self:
-            logs = Log.search([('endpoint_id', '=', rec.id)])
-            rec.request_count = len(logs)
-            rec.last_called = max(logs.mapped('timestamp')) if logs else False
+            count, last_called = totals.get(rec.id, (0, None))
+            rec.request_count = count
+            rec.last_called = last_called or False
 
     # ─────────────────────────────────────────────────────────────────────────
     # Cache management
@@ -163,11 +242,47 @@ class DynamicApiEndpoint(models.Model):
         )
         return endpoint.id if endpoint else False
 
+    @api.model
+    @tools.ormcache('endpoint_id', 'write_date')
+    def _get_cached_plan(self, endpoint_id, write_date):
+        """
+        Compiled execution plan (see utils/endpoint_plan.py) for an endpoint.
+
+        Keyed by write_date as well as id so that a stale entry can never be
+        served for a modified endpoint, even before the cache is cleared.
+        Field-line edits do not touch the endpoint's write_date; they call
+        _invalidate_endpoint_cache() instead.
+        """
+        return EndpointPlan.compile(self.sudo().browse(endpoint_id))
+
+    def get_execution_plan(self):
+        """Per-request entry point: a cache lookup once the plan is compiled."""
+        self.ensure_one()
+        return self._get_cached_plan(self.id, self.write_date)
+
+    @api.model
+    @tools.ormcache('model_name')
+    def _get_cached_endpoint_id_for_model(self, model_name):
+        endpoint = self.sudo().search(
+            [('model_name', '=', model_name), ('is_active', '=', True)], limit=1,
+        )
+        return endpoint.id if endpoint else False
+
+    @api.model
+    def get_plan_for_model(self, model_name):
+        """Plan of the active endpoint exposing *model_name*, or None."""
+        endpoint_id = self._get_cached_endpoint_id_for_model(model_name)
+        if not endpoint_id:
+            return None
+        return self.sudo().browse(endpoint_id).get_execution_plan()
+
     def _invalidate_endpoint_cache(self):
         """Bust the ormcache so the next request re-reads from DB."""
-        self.env['dynamic.api.endpoint']._get_cached_endpoint_id.clear_cache(
-            self.env['dynamic.api.endpoint']
-        )
+        Endpoint = self.env['dynamic.api.endpoint']
+        Endpoint._get_cached_endpoint_id.clear_cache(Endpoint)
+        Endpoint._get_cached_plan.clear_cache(Endpoint)
+        Endpoint._get_cached_endpoint_id_for_model.clear_cache(Endpoint)
+        response_cache.invalidate_endpoints(self.env.cr.dbname, self.ids)
 
     @api.model
     def _get_endpoint_for_request(self, path):
@@ -250,6 +365,17 @@ class DynamicApiEndpoint(models.Model):
             'target': 'current',
         }
 
+    def action_view_stats(self):
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Request Statistics — %s') % self.name,
+            'res_model': 'dynamic.api.log.rollup',
+            'view_mode': 'graph,pivot,list',
+            'domain': [('endpoint_id', '=', self.id)],
+            'context': {'search_default_daily': 1},
+        }
+
     def action_view_logs(self):
         self.ensure_one()
         return {
@@ -75,6 +75,12 @@ class DynamicApiField(models.Model):
         help='If checked, this field is excluded from POST/PUT request bodies.',
         default=False,
     )
+    allow_expand = fields.Boolean(
+        string='Expandable',
+        help='Relational fields only: clients may pass expand=<alias> to '
+             'receive the related records instead of ids.',
+        default=False,
+    )
     sequence = fields.Integer(string='Sequence', default=10)
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -92,6 +98,15 @@ class DynamicApiField(models.Model):
                         model=rec.endpoint_id.model_name,
                     ))
 
+    @api.constrains('allow_expand', 'field_id')
+    def _check_allow_expand_relational(self):
+        for rec in self:
+            if rec.allow_expand and rec.field_type not in ('many2one', 'one2many', 'many2many'):
+                raise ValidationError(_(
+                    'Only relational fields can be expandable ("%s" is not).',
+                    rec.field_name,
+                ))
+
     @api.constrains('alias')
     def _check_alias_format(self):
         for rec in self:
@@ -207,12 +222,28 @@ class DynamicApiField(models.Model):
             'api_field_id': api_field.id,
         }
 
+    # ─────────────────────────────────────────────────────────────────────────
+    # ORM overrides — keep the endpoint execution plans consistent
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records.endpoint_id._invalidate_endpoint_cache()
+        return records
+
+    def write(self, vals):
+        result = super().write(vals)
+        self.endpoint_id._invalidate_endpoint_cache()
+        return result
+
     def unlink(self):
         """
         If we own the ir.model.fields record (is_custom=True), drop it too.
         This cascades the schema change automatically via Odoo ORM.
         """
         custom_field_ids = self.filtered('is_custom').mapped('field_id.id')
+        self.endpoint_id._invalidate_endpoint_cache()
         result = super().unlink()
         if custom_field_ids:
             custom_fields = self.env['ir.model.fields'].sudo().browse(custom_field_ids).exists()
@@ -2,10 +2,12 @@
 import secrets
 import hashlib
 import logging
-from datetime import datetime, timedelta
-from odoo import api, fields, models, _
+from odoo import api, fields, models, tools, _
 from odoo.exceptions import UserError, ValidationError
 
+from ..utils.key_usage import key_usage_counters
+from ..utils.rate_limiter import get_rate_limiter
+
 _logger = logging.getLogger(__name__)
 
 
@@ -18,6 +20,9 @@ class DynamicApiKey(models.Model):
     - Only a SHA-256 hash is persisted in the database.
     - The key_prefix (first 8 chars) is stored in plaintext for UI identification.
     - Comparison at request time: sha256(incoming_key) == stored key_hash.
+    - The hash → (id, active, expiry, endpoints) lookup is ormcached and
+      cleared whenever one of those columns changes; usage statistics are
+      aggregated in memory (utils/key_usage.py) and flushed periodically.
     """
     _name = 'dynamic.api.key'
     _description = 'Dynamic REST API Key'
@@ -146,32 +151,86 @@ class DynamicApiKey(models.Model):
         if not raw_key:
             raise UserError(_('Missing X-API-Key header.'))
 
-        key_hash = self._hash_key(raw_key)
-        domain = [('key_hash', '=', key_hash), ('is_active', '=', True)]
-        api_key = self.sudo().search(domain, limit=1)
+        key_id, is_active, expiry_date, endpoint_ids = self._get_key_verification(
+            self._hash_key(raw_key)
+        )
 
-        if not api_key:
+        if not is_active:
             raise UserError(_('Invalid or revoked API key.'))
 
         # Check expiry
-        if api_key.expiry_date and api_key.expiry_date < fields.Date.today():
+        if expiry_date and expiry_date < fields.Date.today():
             raise UserError(_('This API key has expired.'))
 
         # Check endpoint restriction
-        if endpoint and api_key.endpoint_ids:
-            if endpoint.id not in api_key.endpoint_ids.ids:
+        if endpoint and endpoint_ids:
+            if endpoint.id not in endpoint_ids:
                 raise UserError(_('This API key is not authorized for this endpoint.'))
 
-        # Update usage stats (in a separate savepoint to not block the request)
+        # Usage stats are counted in memory and flushed in batches, so the
+        # request never takes a row lock on the key.
+        key_usage_counters.configure(flush_interval=self._get_usage_flush_interval())
+        key_usage_counters.record(self.env.cr.dbname, key_id)
+
+        return self.sudo().browse(key_id)
+
+    # Columns whose change must invalidate the verification cache
+    _VERIFICATION_FIELDS = frozenset({'key_hash', 'is_active', 'expiry_date', 'endpoint_ids'})
+
+    @api.model
+    @tools.ormcache('key_hash')
+    def _get_key_verification(self, key_hash):
+        """
+        Return (key_id, is_active, expiry_date, endpoint_ids) for a key hash.
+        Inactive keys are cached too so that revoked keys are rejected
+        without a query; unknown hashes raise instead of being cached, so
+        clients spraying random keys cannot flood the cache.
+        """
+        api_key = self.sudo().search([('key_hash', '=', key_hash)], limit=1)
+        if not api_key:
+            raise UserError(_('Invalid or revoked API key.'))
+        return (
+            api_key.id,
+            api_key.is_active,
+            api_key.expiry_date,
+            frozenset(api_key.endpoint_ids.ids),
+        )
+
+    def _invalidate_verification_cache(self):
+        self.env['dynamic.api.key']._get_key_verification.clear_cache(
+            self.env['dynamic.api.key']
+        )
+
+    @api.model
+    def _get_usage_flush_interval(self):
+        """dynamic_rest_api.key_usage_flush_interval, in seconds (default: 30)."""
         try:
-            api_key.sudo().write({
-                'last_used': fields.Datetime.now(),
-                'request_count': api_key.request_count + 1,
-            })
-        except Exception:
-            pass  # Do not fail the request if the stats update fails
+            return float(self.env['ir.config_parameter'].sudo().get_param(
+                'dynamic_rest_api.key_usage_flush_interval', default=30,
+            ))
+        except (ValueError, TypeError):
+            return 30.0
+
+    @api.model
+    def flush_usage_counters(self):
+        """Write this worker's pending usage counters now."""
+        key_usage_counters.flush()
+        return key_usage_counters.stats()
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # ORM overrides
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def write(self, vals):
+        result = super().write(vals)
+        if self._VERIFICATION_FIELDS.intersection(vals):
+            self._invalidate_verification_cache()
+        return result
 
-        return api_key
+    def unlink(self):
+        result = super().unlink()
+        self._invalidate_verification_cache()
+        return result
 
     # ─────────────────────────────────────────────────────────────────────────
     # Rate limiting helper
@@ -179,17 +238,13 @@ class DynamicApiKey(models.Model):
 
     def check_rate_limit(self, endpoint):
         """
-        Simple per-key, per-minute rate limit using dynamic.api.log count.
+        Per-key, per-endpoint rate limit using the endpoint's limiter backend
+        (see utils/rate_limiter.py).  O(1); never queries dynamic.api.log.
         Returns True if within limit, False if exceeded.
         """
         limit = endpoint.rate_limit
         if not limit:
             return True  # 0 = unlimited
 
-        since = datetime.utcnow() - timedelta(minutes=1)
-        count = self.env['dynamic.api.log'].sudo().search_count([
-            ('endpoint_id', '=', endpoint.id),
-            ('api_key_id', '=', self.id),
-            ('timestamp', '>=', fields.Datetime.to_string(since)),
-        ])
-        return count < limit
+        limiter = get_rate_limiter(endpoint.rate_limit_strategy)
+        return limiter.allow(self.env, endpoint.id, self.id, limit)
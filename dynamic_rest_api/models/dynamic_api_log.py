@@ -2,6 +2,13 @@
 import logging
 from odoo import api, fields, models, _
 
+from ..utils.log_buffer import (
+    request_log_buffer,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_FLUSH_INTERVAL,
+    DEFAULT_MAX_SIZE,
+)
+
 _logger = logging.getLogger(__name__)
 
 
@@ -11,7 +18,14 @@ class DynamicApiLog(models.Model):
     controller.  Provides audit trail, stats, and rate-limit data.
 
     Auto-cleanup: a scheduled action deletes records older than the retention
-    period (default 30 days) configured in ir.config.parameter.
+    period (default 30 days) configured in ir.config.parameter, day by day.
+    Statistics are read from the rollup table (dynamic.api.log.rollup), which
+    outlives the raw rows.
+
+    Write mode: by default entries are buffered in memory per worker and
+    inserted in batches (see utils/log_buffer.py).  Set the parameter
+    ``dynamic_rest_api.log_mode`` to ``sync`` to insert inside the request
+    transaction instead.
     """
     _name = 'dynamic.api.log'
     _description = 'Dynamic API Request Log'
@@ -49,6 +63,18 @@ class DynamicApiLog(models.Model):
     # Stores the serialised query parameters for GET requests
     query_params = fields.Text(string='Query Parameters', readonly=True)
 
+    # ── Instrumentation (see utils/instrumentation.py) ────────────────────────
+    sql_count = fields.Integer(string='SQL Queries', readonly=True)
+    sql_time_ms = fields.Integer(string='SQL Time (ms)', readonly=True)
+    python_time_ms = fields.Integer(string='Python Time (ms)', readonly=True)
+    response_size = fields.Integer(string='Response Size (bytes)', readonly=True)
+    is_slow = fields.Boolean(string='Slow Request', readonly=True, index=True)
+    profile_sample = fields.Text(
+        string='Profile Sample', readonly=True,
+        help='Collapsed stack samples taken while the request was over the '
+             'slow-request threshold (sample count, then outer;…;inner frames).',
+    )
+
     # ─────────────────────────────────────────────────────────────────────────
     # ORM overrides
     # ─────────────────────────────────────────────────────────────────────────
@@ -65,22 +91,64 @@ class DynamicApiLog(models.Model):
     @api.model
     def _cron_cleanup_old_logs(self):
         """
-        Delete log entries older than the configured retention period.
-        Configured via ir.config.parameter key:
-          dynamic_rest_api.log_retention_days  (default: 30)
+        Drop log entries older than the configured retention period.
+        Configured via ir.config.parameter keys:
+          dynamic_rest_api.log_retention_days     raw logs + hourly rollups (default: 30)
+          dynamic_rest_api.rollup_retention_days  daily rollups             (default: 400)
+
+        Pending rows are rolled up first so no statistics are lost.  Expired
+        logs are removed one whole day at a time with a range DELETE on the
+        timestamp index, committed per day, instead of loading every id into
+        the ORM and unlinking them.
+
+        This is not partition dropping: PostgreSQL still deletes the rows one
+        by one and autovacuum reclaims the space.  The table is created and
+        altered by the ORM, with a primary key on ``id`` alone, which
+        PostgreSQL does not allow on a table partitioned by ``timestamp``.
+        Bounding each statement to one day keeps the transactions short.
         """
-        param = self.env['ir.config_parameter'].sudo().get_param(
-            'dynamic_rest_api.log_retention_days', default='30',
-        )
-        try:
-            days = int(param)
-        except (ValueError, TypeError):
-            days = 30
+        ICP = self.env['ir.config_parameter'].sudo()
+
+        def _days(key, default):
+            try:
+                return int(ICP.get_param(key, default=default))
+            except (ValueError, TypeError):
+                return default
+
+        days = _days('dynamic_rest_api.log_retention_days', 30)
+        rollup_days = _days('dynamic_rest_api.rollup_retention_days', 400)
+
+        Rollup = self.env['dynamic.api.log.rollup']
+        Rollup._cron_rollup_logs()
 
-        cutoff = fields.Datetime.subtract(fields.Datetime.now(), days=days)
-        old_logs = self.search([('timestamp', '<', cutoff)])
-        count = len(old_logs)
-        old_logs.unlink()
+        now = fields.Datetime.now()
+        cutoff = fields.Datetime.start_of(fields.Datetime.subtract(now, days=days), 'day')
+        cr = self.env.cr
+        cr.execute('SELECT MIN(timestamp) FROM dynamic_api_log')
+        oldest = cr.fetchone()[0]
+
+        count = 0
+        chunk_start = oldest and fields.Datetime.start_of(oldest, 'day')
+        while chunk_start and chunk_start < cutoff:
+            chunk_end = fields.Datetime.add(chunk_start, days=1)
+            cr.execute("""
+                DELETE FROM dynamic_api_log
+                 WHERE timestamp >= %s AND timestamp < %s
+            """, (chunk_start, chunk_end))
+            count += cr.rowcount
+            cr.commit()
+            chunk_start = chunk_end
+
+        # Rows without a timestamp can never be reached by the chunks above
+        cr.execute('DELETE FROM dynamic_api_log WHERE timestamp IS NULL')
+        count += cr.rowcount
+
+        Rollup._drop_before('hour', cutoff)
+        Rollup._drop_before(
+            'day',
+            fields.Datetime.start_of(fields.Datetime.subtract(now, days=rollup_days), 'day'),
+        )
+        self.invalidate_model()
         _logger.info('DynamicApiLog: cleaned up %d records older than %d days.', count, days)
         return True
 
@@ -91,10 +159,17 @@ class DynamicApiLog(models.Model):
     @api.model
     def log_request(self, endpoint, method, request_ip,
                     payload_str, response_code, response_time_ms,
-                    user=None, api_key=None, error=None, query_params=None):
+                    user=None, api_key=None, error=None, query_params=None,
+                    metrics=None):
         """
         Create a log entry.  Truncates payload to 4 096 bytes.
         Always uses sudo() since the controller may run as public.
+
+        ``metrics`` is an optional dict of instrumentation values (sql_count,
+        sql_time_ms, python_time_ms, response_size, is_slow, profile_sample).
+
+        In buffered mode the values are queued and an empty recordset is
+        returned; the row is written later by the per-worker flusher.
         """
         MAX_PAYLOAD = 4096
         if payload_str and len(payload_str) > MAX_PAYLOAD:
@@ -118,9 +193,105 @@ class DynamicApiLog(models.Model):
             vals['error_message'] = str(error)[:2048]
         if query_params:
             vals['query_params'] = str(query_params)[:1024]
+        if metrics:
+            vals.update(metrics)
+
+        settings = self._get_log_settings()
+        if settings['mode'] == 'buffered':
+            request_log_buffer.configure(
+                batch_size=settings['batch_size'],
+                flush_interval=settings['flush_interval'],
+                max_size=settings['max_size'],
+            )
+            request_log_buffer.enqueue(self.env.cr.dbname, vals)
+            return self.browse()
 
         try:
             return self.sudo().create(vals)
         except Exception as e:
             _logger.error('DynamicApiLog: failed to write log: %s', e)
             return self.browse()
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Buffered logging
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @api.model
+    def _get_log_settings(self):
+        """
+        Read the logging configuration from ir.config_parameter:
+          dynamic_rest_api.log_mode            buffered | sync   (default: buffered)
+          dynamic_rest_api.log_batch_size      rows per INSERT   (default: 200)
+          dynamic_rest_api.log_flush_interval  seconds           (default: 5)
+          dynamic_rest_api.log_queue_limit     max queued rows   (default: 10000)
+        """
+        ICP = self.env['ir.config_parameter'].sudo()
+
+        def _number(key, default, cast=int):
+            try:
+                return cast(ICP.get_param(key, default=default))
+            except (ValueError, TypeError):
+                return default
+
+        mode = ICP.get_param('dynamic_rest_api.log_mode', default='buffered')
+        return {
+            'mode': 'sync' if mode == 'sync' else 'buffered',
+            'batch_size': _number('dynamic_rest_api.log_batch_size', DEFAULT_BATCH_SIZE),
+            'flush_interval': _number(
+                'dynamic_rest_api.log_flush_interval', DEFAULT_FLUSH_INTERVAL, float,
+            ),
+            'max_size': _number('dynamic_rest_api.log_queue_limit', DEFAULT_MAX_SIZE),
+        }
+
+    @api.model
+    def _create_buffered_logs(self, vals_list):
+        """
+        Insert a batch of queued log values in one multi-row create.
+
+        Endpoints, keys or users may have been deleted between enqueue and
+        flush; dangling references are cleared so that one stale id cannot
+        make the whole batch fail on a foreign-key violation.
+        """
+        for field_name, comodel in (
+            ('endpoint_id', 'dynamic.api.endpoint'),
+            ('api_key_id', 'dynamic.api.key'),
+            ('user_id', 'res.users'),
+        ):
+            ids = {vals[field_name] for vals in vals_list if vals.get(field_name)}
+            if not ids:
+                continue
+            existing = set(self.env[comodel].sudo().browse(ids).exists().ids)
+            for vals in vals_list:
+                if vals.get(field_name) and vals[field_name] not in existing:
+                    vals[field_name] = False
+        return self.sudo().create(vals_list)
+
+    @api.model
+    def _get_instrumentation_settings(self):
+        """
+        Read the instrumentation configuration from ir.config_parameter:
+          dynamic_rest_api.instrumentation  1 = record SQL / time / size  (default: 0)
+          dynamic_rest_api.slow_request_ms  profile requests slower than this,
+                                            0 = off                      (default: 0)
+        """
+        ICP = self.env['ir.config_parameter'].sudo()
+        try:
+            slow_ms = int(ICP.get_param('dynamic_rest_api.slow_request_ms', default=0))
+        except (ValueError, TypeError):
+            slow_ms = 0
+        return {
+            'enabled': ICP.get_param('dynamic_rest_api.instrumentation', default='0')
+                       not in ('0', 'False', 'false', ''),
+            'slow_ms': max(0, slow_ms),
+        }
+
+    @api.model
+    def get_log_buffer_stats(self):
+        """Counters of this worker's log buffer (queued / flushed / dropped)."""
+        return request_log_buffer.stats()
+
+    @api.model
+    def flush_log_buffer(self):
+        """Force an immediate flush of this worker's pending log entries."""
+        request_log_buffer.flush()
+        return True
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+import logging
+from datetime import datetime, timedelta
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+WATERMARK_PARAM = 'dynamic_rest_api.rollup_covered_until'
+LATE_MINUTES_PARAM = 'dynamic_rest_api.rollup_late_minutes'
+DEFAULT_LATE_MINUTES = 120
+
+
+class DynamicApiLogRollup(models.Model):
+    """
+    Pre-aggregated request statistics, one row per
+    (period, period start, endpoint, API key, status code).
+
+    Filled by ``_cron_rollup_logs``, which recomputes in full, from
+    dynamic.api.log, every hour / day bucket from the previous run minus a
+    late window (``dynamic_rest_api.rollup_late_minutes``, default 120) up
+    to now.  The window is by timestamp, not by log id: ids are taken at
+    insert time, so a buffered or slow transaction can commit rows below an
+    id watermark that was already passed, and they would never be counted.
+    Any row committed within the late window of its timestamp is counted.
+    Recomputing whole buckets (rather than adding deltas) keeps the latency
+    percentiles exact.
+
+    Endpoint statistics and the statistics views read this table, so they
+    no longer scan the raw log.  Hourly rows are kept as long as the raw
+    logs; daily rows are kept for ``dynamic_rest_api.rollup_retention_days``.
+    """
+    _name = 'dynamic.api.log.rollup'
+    _description = 'Dynamic API Request Statistics'
+    _order = 'period_start desc'
+    _log_access = False
+
+    period = fields.Selection(
+        [('hour', 'Hourly'), ('day', 'Daily')],
+        string='Period', required=True, readonly=True, index=True,
+    )
+    period_start = fields.Datetime(string='Period Start', required=True, readonly=True, index=True)
+    endpoint_id = fields.Many2one(
+        'dynamic.api.endpoint', string='Endpoint',
+        ondelete='set null', index=True, readonly=True,
+    )
+    endpoint_path = fields.Char(string='Endpoint Path', readonly=True)
+    api_key_id = fields.Many2one(
+        'dynamic.api.key', string='API Key', ondelete='set null', readonly=True,
+    )
+    response_code = fields.Integer(string='HTTP Status Code', readonly=True)
+    request_count = fields.Integer(string='Requests', readonly=True, aggregator='sum')
+    total_time_ms = fields.Integer(string='Total Time (ms)', readonly=True, aggregator='sum')
+    avg_time_ms = fields.Float(string='Avg Time (ms)', readonly=True, aggregator='avg')
+    p50_time_ms = fields.Float(string='p50 (ms)', readonly=True, aggregator='max')
+    p95_time_ms = fields.Float(string='p95 (ms)', readonly=True, aggregator='max')
+    p99_time_ms = fields.Float(string='p99 (ms)', readonly=True, aggregator='max')
+    max_time_ms = fields.Integer(string='Max Time (ms)', readonly=True, aggregator='max')
+    last_timestamp = fields.Datetime(string='Last Request', readonly=True, aggregator='max')
+    sql_count = fields.Integer(string='SQL Queries', readonly=True, aggregator='sum')
+    sql_time_ms = fields.Integer(string='SQL Time (ms)', readonly=True, aggregator='sum')
+    response_size = fields.Integer(string='Response Bytes', readonly=True, aggregator='sum')
+    slow_count = fields.Integer(string='Slow Requests', readonly=True, aggregator='sum')
+
+    _period_start_idx = models.Index('(period, period_start)')
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Incremental rollup
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @api.model
+    def _get_watermark(self):
+        """Log time up to which the rollup is complete, or None before the first run."""
+        value = self.env['ir.config_parameter'].sudo().get_param(WATERMARK_PARAM)
+        try:
+            return fields.Datetime.to_datetime(value) if value else None
+        except ValueError:
+            return None
+
+    @api.model
+    def _get_late_window(self):
+        try:
+            minutes = int(self.env['ir.config_parameter'].sudo().get_param(
+                LATE_MINUTES_PARAM, DEFAULT_LATE_MINUTES,
+            ))
+        except (ValueError, TypeError):
+            minutes = DEFAULT_LATE_MINUTES
+        return timedelta(minutes=max(0, minutes))
+
+    @api.model
+    def _cron_rollup_logs(self):
+        """
+        Recompute every bucket from the previous run minus the late window
+        up to now.
+
+        One pass per period: drop the rollup rows of those buckets and
+        re-aggregate them with a single INSERT … SELECT on the timestamp
+        index.
+        """
+        cr = self.env.cr
+        cr.execute("SELECT (now() AT TIME ZONE 'UTC')")
+        now = cr.fetchone()[0]
+        covered = self._get_watermark()
+        if covered is None:
+            cr.execute('SELECT MIN(timestamp) FROM dynamic_api_log')
+            start = cr.fetchone()[0]
+        else:
+            start = min(covered, now) - self._get_late_window()
+
+        if start is not None:
+            for period in ('hour', 'day'):
+                cr.execute("""
+                    DELETE FROM dynamic_api_log_rollup
+                     WHERE period = %s AND period_start >= date_trunc(%s, %s::timestamp)
+                """, (period, period, start))
+                cr.execute("""
+                    INSERT INTO dynamic_api_log_rollup (
+                        period, period_start, endpoint_id, endpoint_path, api_key_id,
+                        response_code, request_count, total_time_ms, avg_time_ms,
+                        p50_time_ms, p95_time_ms, p99_time_ms, max_time_ms, last_timestamp,
+                        sql_count, sql_time_ms, response_size, slow_count
+                    )
+                    SELECT %s, date_trunc(%s, l.timestamp), l.endpoint_id,
+                           MAX(l.endpoint_path), l.api_key_id, l.response_code,
+                           COUNT(*), SUM(COALESCE(l.response_time_ms, 0)),
+                           AVG(COALESCE(l.response_time_ms, 0)),
+                           percentile_cont(0.50) WITHIN GROUP (ORDER BY l.response_time_ms),
+                           percentile_cont(0.95) WITHIN GROUP (ORDER BY l.response_time_ms),
+                           percentile_cont(0.99) WITHIN GROUP (ORDER BY l.response_time_ms),
+                           MAX(l.response_time_ms), MAX(l.timestamp),
+                           SUM(COALESCE(l.sql_count, 0)), SUM(COALESCE(l.sql_time_ms, 0)),
+                           SUM(COALESCE(l.response_size, 0)),
+                           COUNT(*) FILTER (WHERE l.is_slow)
+                      FROM dynamic_api_log l
+                     WHERE l.timestamp >= date_trunc(%s, %s::timestamp)
+                       AND l.timestamp < %s
+                     GROUP BY date_trunc(%s, l.timestamp), l.endpoint_id,
+                              l.api_key_id, l.response_code
+                """, (period, period, period, start, now, period))
+
+        self.env['ir.config_parameter'].sudo().set_param(
+            WATERMARK_PARAM, fields.Datetime.to_string(now),
+        )
+        self.invalidate_model()
+        _logger.info('DynamicApiLogRollup: rolled up logs from %s to %s.', start, now)
+        return True
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Readers
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @api.model
+    def get_endpoint_totals(self, endpoint_ids):
+        """
+        Return ``{endpoint_id: (request_count, last_timestamp)}`` from the
+        daily rollup plus the (small) tail of logs logged since the last
+        rollup run.
+        """
+        totals = {endpoint_id: [0, None] for endpoint_id in endpoint_ids}
+        if not totals:
+            return {}
+        cr = self.env.cr
+        cr.execute("""
+            SELECT endpoint_id, SUM(request_count), MAX(last_timestamp)
+              FROM dynamic_api_log_rollup
+             WHERE period = 'day' AND endpoint_id = ANY(%s)
+             GROUP BY endpoint_id
+            UNION ALL
+            SELECT endpoint_id, COUNT(*), MAX(timestamp)
+              FROM dynamic_api_log
+             WHERE timestamp >= %s AND endpoint_id = ANY(%s)
+             GROUP BY endpoint_id
+        """, (list(totals), self._get_watermark() or datetime.min, list(totals)))
+        for endpoint_id, count, last in cr.fetchall():
+            entry = totals[endpoint_id]
+            entry[0] += count or 0
+            if last and (entry[1] is None or last > entry[1]):
+                entry[1] = last
+        return {endpoint_id: tuple(entry) for endpoint_id, entry in totals.items()}
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Retention
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @api.model
+    def _drop_before(self, period, cutoff):
+        self.env.cr.execute("""
+            DELETE FROM dynamic_api_log_rollup
+             WHERE period = %s AND period_start < %s
+        """, (period, cutoff))
+        return self.env.cr.rowcount
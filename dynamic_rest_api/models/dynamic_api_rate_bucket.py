@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import logging
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+
+class DynamicApiRateBucket(models.Model):
+    """
+    Shared token-bucket state for the ``shared`` rate-limit strategy.
+
+    One row per (endpoint, API key).  The row is read, refilled and consumed
+    in a single ``INSERT … ON CONFLICT DO UPDATE`` statement, so the decision
+    costs one indexed write regardless of traffic and never touches
+    dynamic.api.log.
+    """
+    _name = 'dynamic.api.rate.bucket'
+    _description = 'Dynamic API Rate-Limit Bucket'
+    _log_access = False
+
+    endpoint_id = fields.Many2one(
+        'dynamic.api.endpoint', string='Endpoint',
+        required=True, ondelete='cascade',
+    )
+    api_key_id = fields.Many2one(
+        'dynamic.api.key', string='API Key',
+        required=True, ondelete='cascade',
+    )
+    tokens = fields.Float(string='Available Tokens', readonly=True)
+    updated_at = fields.Datetime(string='Last Refill', readonly=True)
+    last_allowed = fields.Boolean(string='Last Request Allowed', readonly=True)
+
+    _endpoint_key_unique = models.Constraint(
+        'UNIQUE(endpoint_id, api_key_id)',
+        'Only one rate-limit bucket per endpoint and API key.',
+    )
+
+    # Refilled token level at "now", capped at the bucket capacity.
+    _LEVEL_SQL = (
+        "LEAST(%(capacity)s, b.tokens + %(refill_rate)s * "
+        "EXTRACT(EPOCH FROM ((now() AT TIME ZONE 'UTC') - b.updated_at)))"
+    )
+
+    @api.model
+    def consume(self, endpoint_id, key_id, capacity, refill_rate):
+        """
+        Take one token from the (endpoint, key) bucket.
+        Returns True if the request is within the limit.
+
+        Runs on its own short-lived cursor so the bucket row lock is released
+        immediately instead of being held until the API request commits.
+        """
+        level = self._LEVEL_SQL
+        query = f"""
+            INSERT INTO dynamic_api_rate_bucket AS b
+                (endpoint_id, api_key_id, tokens, updated_at, last_allowed)
+            VALUES (%(endpoint_id)s, %(key_id)s, %(capacity)s - 1,
+                    now() AT TIME ZONE 'UTC', TRUE)
+            ON CONFLICT (endpoint_id, api_key_id) DO UPDATE SET
+                tokens = CASE WHEN {level} >= 1 THEN {level} - 1 ELSE {level} END,
+                last_allowed = {level} >= 1,
+                updated_at = now() AT TIME ZONE 'UTC'
+            RETURNING last_allowed
+        """
+        params = {
+            'endpoint_id': endpoint_id,
+            'key_id': key_id,
+            'capacity': capacity,
+            'refill_rate': refill_rate,
+        }
+        try:
+            with self.env.registry.cursor() as cr:
+                cr.execute(query, params)
+                row = cr.fetchone()
+        except Exception as e:
+            # Fail open: a rate-limiter outage must not take the API down.
+            _logger.error('DynamicAPI: shared rate limiter failed: %s', e)
+            return True
+        return bool(row and row[0])
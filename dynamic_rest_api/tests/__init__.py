@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+from . import test_expansion
+from . import test_keyset
+from . import test_batch
+from . import test_compression
+from . import test_rate_limiter
+from . import test_response_cache
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from odoo.tests.common import TransactionCase
+
+
+class DynamicApiCommon(TransactionCase):
+    """Endpoint fixtures shared by the dynamic_rest_api tests."""
+
+    @classmethod
+    def _make_endpoint(cls, name, model_name, field_names, expandable=(), aliases=None, **vals):
+        field_ids = [
+            (0, 0, {
+                'field_id': cls.env['ir.model.fields']._get(model_name, field_name).id,
+                'allow_expand': field_name in expandable,
+                'alias': (aliases or {}).get(field_name, False),
+            })
+            for field_name in field_names
+        ]
+        return cls.env['dynamic.api.endpoint'].create({
+            'name': name,
+            'model_id': cls.env['ir.model']._get(model_name).id,
+            'field_ids': field_ids,
+            **vals,
+        })
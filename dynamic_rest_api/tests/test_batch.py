@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+from odoo.tests.common import tagged
+
+from ..controllers.dynamic_dispatch import DynamicApiController
+from .common import DynamicApiCommon
+
+
+@tagged('post_install', '-at_install', 'dynamic_rest_api')
+class TestBatchOrder(DynamicApiCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env['dynamic.api.endpoint'].search([('model_name', '=', 'res.partner.category')]).unlink()
+        cls.endpoint = cls._make_endpoint(
+            'Batch Tags', 'res.partner.category', ['name'],
+            allow_post=True, allow_put=True, allow_delete=True, allow_batch=True,
+        )
+        cls.tag = cls.env['res.partner.category'].create({'name': 'Batch'})
+
+    def _batch(self, operations):
+        body, status = DynamicApiController()._handle_batch(
+            self.endpoint, self.env, {'operations': operations},
+        )
+        self.assertEqual(status, 200)
+        return body['data']
+
+    def test_repeated_updates_apply_in_request_order(self):
+        results = self._batch([
+            {'op': 'update', 'id': self.tag.id, 'data': {'name': 'A'}},
+            {'op': 'update', 'id': self.tag.id, 'data': {'name': 'B'}},
+            {'op': 'update', 'id': self.tag.id, 'data': {'name': 'A'}},
+            {'op': 'update', 'id': self.tag.id, 'data': {'name': 'C'}},
+        ])
+        self.assertTrue(all(result['success'] for result in results))
+        self.assertEqual(self.tag.name, 'C')
+
+    def test_delete_then_update_fails_the_update(self):
+        results = self._batch([
+            {'op': 'delete', 'id': self.tag.id},
+            {'op': 'update', 'id': self.tag.id, 'data': {'name': 'Late'}},
+        ])
+        self.assertTrue(results[0]['success'])
+        self.assertEqual(results[1]['status'], 404)
+        self.assertFalse(self.tag.exists())
+
+    def test_update_then_delete(self):
+        results = self._batch([
+            {'op': 'update', 'id': self.tag.id, 'data': {'name': 'Gone'}},
+            {'op': 'delete', 'id': self.tag.id},
+        ])
+        self.assertEqual([r['status'] for r in results], [200, 200])
+        self.assertFalse(self.tag.exists())
+
+    def test_distinct_records_are_still_grouped(self):
+        others = self.env['res.partner.category'].create([{'name': 'x'}, {'name': 'y'}])
+        runs = DynamicApiController._batch_runs([
+            (0, 'update', self.tag.id, {'name': 'z'}),
+            (1, 'update', others[0].id, {'name': 'z'}),
+            (2, 'update', others[1].id, {'name': 'z'}),
+            (3, 'update', self.tag.id, {'name': 'w'}),
+        ])
+        self.assertEqual([len(items) for _op, items in runs], [3, 1])
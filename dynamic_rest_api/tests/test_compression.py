@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import gzip
+import zlib
+
+from odoo.tests.common import BaseCase, tagged
+
+from ..utils import compression
+from ..utils.compression import choose_encoding, compress
+
+
+@tagged('post_install', '-at_install', 'dynamic_rest_api')
+class TestCompressionNegotiation(BaseCase):
+
+    def test_identity_without_header(self):
+        self.assertIsNone(choose_encoding(None))
+        self.assertIsNone(choose_encoding(''))
+        self.assertIsNone(choose_encoding('identity'))
+
+    def test_highest_quality_wins(self):
+        self.assertEqual(choose_encoding('gzip;q=0.5, deflate;q=0.8'), 'deflate')
+        self.assertEqual(choose_encoding('deflate, gzip;q=0.9'), 'deflate')
+
+    def test_server_preference_on_equal_quality(self):
+        self.assertEqual(choose_encoding('deflate, gzip'), 'gzip')
+
+    def test_zero_quality_refuses(self):
+        self.assertIsNone(choose_encoding('gzip;q=0, deflate;q=0'))
+        expected = 'br' if compression.brotli is not None else 'deflate'
+        self.assertEqual(choose_encoding('*, gzip;q=0'), expected)
+
+    def test_malformed_quality_counts_as_zero(self):
+        self.assertEqual(choose_encoding('gzip;q=abc, deflate;q=0.1'), 'deflate')
+
+    def test_case_and_spacing(self):
+        self.assertEqual(choose_encoding('  GZip ; q=1 '), 'gzip')
+
+    def test_brotli_only_when_installed(self):
+        expected = 'br' if compression.brotli is not None else None
+        self.assertEqual(choose_encoding('br'), expected)
+
+    def test_compress_round_trip(self):
+        data = b'{"data": [' + b'{"id": 1}, ' * 500 + b'{}]}'
+        self.assertEqual(gzip.decompress(compress(data, 'gzip')), data)
+        self.assertEqual(zlib.decompress(compress(data, 'deflate')), data)
+        with self.assertRaises(ValueError):
+            compress(data, 'zstd')
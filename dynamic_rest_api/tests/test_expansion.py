@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+from odoo.tests.common import tagged
+
+from ..controllers.dynamic_dispatch import DynamicApiController
+from ..utils.expansion import InvalidExpansion, expand_rows, parse_expand, parse_fields
+from .common import DynamicApiCommon
+
+
+@tagged('post_install', '-at_install', 'dynamic_rest_api')
+class TestExpansionAuthorization(DynamicApiCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env['dynamic.api.endpoint'].search([
+            ('model_name', 'in', ('res.partner', 'res.country')),
+        ]).unlink()
+        # A: partners, country expandable.  B: countries, behind API keys.
+        cls.endpoint_a = cls._make_endpoint(
+            'Expansion Partners', 'res.partner', ['name', 'country_id'],
+            expandable=['country_id'], aliases={'country_id': 'country'},
+            auth_type='api_key', expand_depth=2,
+        )
+        cls.endpoint_b = cls._make_endpoint(
+            'Expansion Countries', 'res.country', ['name', 'code', 'currency_id'],
+            expandable=['currency_id'], auth_type='api_key',
+        )
+        Key = cls.env['dynamic.api.key']
+        cls.key_a, _raw = Key.create_with_key('Only A', endpoint_ids=cls.endpoint_a.ids)
+        cls.key_any, _raw = Key.create_with_key('Any endpoint')
+        cls.country = cls.env.ref('base.be')
+        cls.partner = cls.env['res.partner'].create({
+            'name': 'Expansion Partner', 'country_id': cls.country.id,
+        })
+
+    def _expand(self, api_key, expand):
+        plan = self.endpoint_a.get_execution_plan()
+        related_plan = DynamicApiController._related_plan_resolver(self.env, api_key)
+        tree = parse_expand(expand, plan, related_plan)
+        rows = self.partner.read(['name', 'country_id'])
+        expand_rows(self.env, rows, tree, plan, related_plan)
+        return rows[0]['country_id']
+
+    def test_restricted_key_cannot_read_other_endpoint_fields(self):
+        country = self._expand(self.key_a, 'country')
+        self.assertEqual(country, {
+            'id': self.country.id, 'display_name': self.country.display_name,
+        })
+
+    def test_restricted_key_cannot_expand_through_other_endpoint(self):
+        with self.assertRaises(InvalidExpansion):
+            self._expand(self.key_a, 'country.currency_id')
+
+    def test_authorized_key_reads_other_endpoint_fields(self):
+        country = self._expand(self.key_any, 'country')
+        self.assertEqual(country['code'], self.country.code)
+        self.assertEqual(country['name'], self.country.name)
+
+    def test_no_key_cannot_read_api_key_endpoint(self):
+        country = self._expand(None, 'country')
+        self.assertNotIn('code', country)
+
+    def test_endpoint_without_get_is_not_expanded(self):
+        self.endpoint_b.write({'allow_get': False, 'allow_post': True})
+        country = self._expand(self.key_any, 'country')
+        self.assertNotIn('code', country)
+
+
+@tagged('post_install', '-at_install', 'dynamic_rest_api')
+class TestExpansionParsing(DynamicApiCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env['dynamic.api.endpoint'].search([
+            ('model_name', 'in', ('res.partner', 'res.country')),
+        ]).unlink()
+        cls.partners = cls._make_endpoint(
+            'Parsing Partners', 'res.partner', ['name', 'country_id', 'parent_id'],
+            expandable=['country_id', 'parent_id'], aliases={'country_id': 'country'},
+            auth_type='public', expand_depth=2,
+        )
+        cls.countries = cls._make_endpoint(
+            'Parsing Countries', 'res.country', ['name', 'currency_id'],
+            expandable=['currency_id'], auth_type='public',
+        )
+        cls.plan = cls.partners.get_execution_plan()
+        cls.related_plan = cls.env['dynamic.api.endpoint'].get_plan_for_model
+
+    def test_fields_by_alias(self):
+        self.assertEqual(parse_fields('name,country', self.plan), ['name', 'country_id'])
+        self.assertEqual(parse_fields('id', self.plan), ['id'])
+        self.assertEqual(parse_fields(None, self.plan), list(self.plan.readable_fields))
+
+    def test_fields_rejects_unknown_and_raw_names_behind_aliases(self):
+        with self.assertRaises(InvalidExpansion):
+            parse_fields('name,password', self.plan)
+        with self.assertRaises(InvalidExpansion):
+            parse_fields('country_id', self.plan)
+
+    def test_expand_tree(self):
+        tree = parse_expand('country.currency_id, parent_id', self.plan, self.related_plan)
+        self.assertEqual(tree, {'country_id': {'currency_id': {}}, 'parent_id': {}})
+        self.assertEqual(parse_expand('', self.plan, self.related_plan), {})
+
+    def test_expand_rejects_non_whitelisted_fields(self):
+        with self.assertRaises(InvalidExpansion):
+            parse_expand('name', self.plan, self.related_plan)
+        with self.assertRaises(InvalidExpansion):
+            parse_expand('country.name', self.plan, self.related_plan)
+
+    def test_expand_depth(self):
+        with self.assertRaises(InvalidExpansion):
+            parse_expand('parent_id.parent_id.parent_id', self.plan, self.related_plan)
+
+    def test_expand_stops_at_models_without_endpoint(self):
+        self.countries.is_active = False
+        with self.assertRaises(InvalidExpansion):
+            parse_expand('country.currency_id', self.plan, self.related_plan)
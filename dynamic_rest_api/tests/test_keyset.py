@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+from datetime import date, datetime
+
+from odoo.tests.common import TransactionCase, tagged
+
+from ..utils.keyset import (
+    InvalidCursor,
+    decode_cursor,
+    encode_cursor,
+    keyset_domain,
+    keyset_order_clause,
+)
+
+
+@tagged('post_install', '-at_install', 'dynamic_rest_api')
+class TestKeysetCursor(TransactionCase):
+
+    def test_round_trip_keeps_microseconds(self):
+        value = datetime(2024, 3, 1, 12, 30, 15, 123456)
+        cursor = encode_cursor('create_date', 'asc', {'create_date': value, 'id': 7})
+        self.assertEqual(decode_cursor(cursor, 'create_date', 'asc'), (value, 7))
+
+    def test_round_trip_date_and_null(self):
+        cursor = encode_cursor('date', 'desc', {'date': date(2024, 3, 1), 'id': 3})
+        self.assertEqual(decode_cursor(cursor, 'date', 'desc'), (date(2024, 3, 1), 3))
+        cursor = encode_cursor('date', 'desc', {'date': False, 'id': 4})
+        self.assertEqual(decode_cursor(cursor, 'date', 'desc'), (None, 4))
+
+    def test_round_trip_id(self):
+        cursor = encode_cursor('id', 'desc', {'id': 42})
+        self.assertEqual(decode_cursor(cursor, 'id', 'desc'), (None, 42))
+
+    def test_rejects_other_order_and_garbage(self):
+        cursor = encode_cursor('id', 'asc', {'id': 42})
+        with self.assertRaises(InvalidCursor):
+            decode_cursor(cursor, 'id', 'desc')
+        with self.assertRaises(InvalidCursor):
+            decode_cursor('not-a-cursor', 'id', 'asc')
+
+
+@tagged('post_install', '-at_install', 'dynamic_rest_api')
+class TestKeysetPaging(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.partners = cls.env['res.partner'].create([
+            {'name': 'Keyset %s' % n} for n in range(5)
+        ])
+        # Same second, different microseconds, and ids not in key order
+        stamps = ['2024-03-01 12:00:00.000300', '2024-03-01 12:00:00.000100',
+                  '2024-03-01 12:00:00.000500', '2024-03-01 12:00:00.000200',
+                  '2024-03-01 12:00:00.000100']
+        cls.env.flush_all()
+        for partner, stamp in zip(cls.partners, stamps):
+            cls.env.cr.execute(
+                'UPDATE res_partner SET create_date = %s WHERE id = %s', (stamp, partner.id),
+            )
+        cls.env['res.partner'].invalidate_model(['create_date'])
+
+    def _walk(self, direction):
+        Partner = self.env['res.partner']
+        domain = [('id', 'in', self.partners.ids)]
+        seen, cursor = [], None
+        for _page in range(len(self.partners) + 1):
+            page_domain = list(domain)
+            if cursor:
+                page_domain += keyset_domain(
+                    'create_date', direction, *decode_cursor(cursor, 'create_date', direction)
+                )
+            rows = Partner.search_read(
+                page_domain, ['create_date'], limit=2,
+                order=keyset_order_clause('create_date', direction),
+            )
+            if not rows:
+                break
+            seen += [row['id'] for row in rows]
+            cursor = encode_cursor('create_date', direction, rows[-1])
+        return seen
+
+    def _expected(self, direction):
+        ordered = self.partners.sorted(lambda p: (p.create_date, p.id))
+        return ordered.ids if direction == 'asc' else ordered.ids[::-1]
+
+    def test_ascending_pages_neither_repeat_nor_skip(self):
+        self.assertEqual(self._walk('asc'), self._expected('asc'))
+
+    def test_descending_pages_neither_repeat_nor_skip(self):
+        self.assertEqual(self._walk('desc'), self._expected('desc'))
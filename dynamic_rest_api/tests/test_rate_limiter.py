@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+from unittest.mock import patch
+
+from odoo.tests.common import TransactionCase, tagged
+
+from ..utils import rate_limiter
+from ..utils.rate_limiter import TokenBucketLimiter
+
+
+@tagged('post_install', '-at_install', 'dynamic_rest_api')
+class TestTokenBucketLimiter(TransactionCase):
+
+    def setUp(self):
+        super().setUp()
+        self.limiter = TokenBucketLimiter()
+        self.now = 1000.0
+        clock = patch.object(rate_limiter.time, 'monotonic', lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def _allowed(self, count, limit=60, endpoint_id=1, key_id=1):
+        return sum(
+            self.limiter.allow(self.env, endpoint_id, key_id, limit) for _i in range(count)
+        )
+
+    def test_burst_up_to_the_limit(self):
+        self.assertEqual(self._allowed(100), 60)
+
+    def test_refill_rate(self):
+        self._allowed(60)
+        self.now += 1.0            # 60 per minute: one token per second
+        self.assertEqual(self._allowed(5), 1)
+        self.now += 30.0
+        self.assertEqual(self._allowed(100), 30)
+
+    def test_refill_is_capped_at_the_limit(self):
+        self._allowed(60)
+        self.now += 3600.0
+        self.assertEqual(self._allowed(100), 60)
+
+    def test_buckets_are_per_endpoint_and_key(self):
+        self._allowed(60)
+        self.assertEqual(self._allowed(1, endpoint_id=2), 1)
+        self.assertEqual(self._allowed(1, key_id=2), 1)
+
+    def test_lowered_limit_applies_at_once(self):
+        self._allowed(1)
+        self.assertEqual(self._allowed(100, limit=5), 5)
+
+    def test_idle_buckets_are_pruned(self):
+        with patch.object(rate_limiter, '_PRUNE_THRESHOLD', 2):
+            self._allowed(1, key_id=1)
+            self._allowed(1, key_id=2)
+            self.now += rate_limiter._IDLE_BUCKET_SECONDS + 1
+            self._allowed(1, key_id=3)
+        self.assertEqual(len(self.limiter._buckets), 1)
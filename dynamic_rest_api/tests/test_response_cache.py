@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from odoo.tests.common import TransactionCase, tagged
+
+from ..utils.response_cache import response_cache
+
+
+@tagged('post_install', '-at_install', 'dynamic_rest_api')
+class TestResponseCacheInvalidation(TransactionCase):
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(response_cache.clear)
+        self.env.cr.postcommit.clear()
+        self.tag = self.env['res.partner.category'].create({'name': 'Cached'})
+        self.key = response_cache.make_key(self.env.cr.dbname, 0, {}, {})
+        generation = response_cache.generation(self.env.cr.dbname, 'res.partner.category')
+        response_cache.put(self.key, 'res.partner.category', 'body', 60, generation)
+
+    def test_orm_write_invalidates_on_commit(self):
+        self.tag.name = 'Renamed'
+        self.env.flush_all()
+        self.assertEqual(response_cache.get(self.key), 'body')
+        self.env.cr.postcommit.run()
+        self.assertIsNone(response_cache.get(self.key))
+
+    def test_unrelated_model_keeps_entry(self):
+        self.env['res.partner'].create({'name': 'Unrelated'})
+        self.env.cr.postcommit.run()
+        self.assertEqual(response_cache.get(self.key), 'body')
+
+    def test_rollback_keeps_entry(self):
+        self.tag.unlink()
+        self.env.cr.postcommit.clear()
+        self.assertEqual(response_cache.get(self.key), 'body')
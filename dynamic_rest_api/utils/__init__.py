@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+from . import log_buffer
+from . import rate_limiter
+from . import keyset
+from . import response_cache
+from . import endpoint_plan
+from . import key_usage
+from . import expansion
+from . import instrumentation
+from . import compression
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Response compression
+====================
+
+Content negotiation for JSON responses: the best encoding accepted by the
+client (``Accept-Encoding`` with q-values) among brotli — only when the
+optional ``brotli`` package is installed — gzip and deflate.  Bodies smaller
+than the configured threshold are sent as-is: below about a kilobyte the
+compression overhead outweighs the saving.
+"""
+import gzip
+import zlib
+
+try:
+    import brotli
+except ImportError:     # optional dependency
+    brotli = None
+
+DEFAULT_MIN_SIZE = 1024     # bytes
+COMPRESS_LEVEL = 6          # gzip / deflate; brotli uses its quality 5
+
+# Server preference when the client accepts several with the same q-value
+_PREFERENCE = ('br', 'gzip', 'deflate')
+
+
+def supported_encodings():
+    return tuple(enc for enc in _PREFERENCE if enc != 'br' or brotli is not None)
+
+
+def choose_encoding(accept_encoding):
+    """Return the encoding to use for *accept_encoding*, or None (identity)."""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.split(','):
+        name, _sep, params = part.strip().partition(';')
+        name = name.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in supported_encodings():
+        quality = weights.get(encoding, weights.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(data, encoding):
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=COMPRESS_LEVEL)
+    if encoding == 'deflate':
+        # HTTP "deflate" is the zlib format (RFC 9110 §8.4.1.2)
+        return zlib.compress(data, COMPRESS_LEVEL)
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(data, quality=5)
+    raise ValueError(f'Unsupported content encoding: {encoding}')
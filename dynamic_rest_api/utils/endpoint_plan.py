@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Compiled endpoint execution plans
+=================================
+
+Everything the dispatcher derives from an endpoint's configuration — exposed
+and writable field lists, alias / reverse-alias maps, allowed methods,
+sortable, filterable and expandable fields, ETag validator columns — used to
+be rebuilt from ``field_ids`` on every request.  ``EndpointPlan.compile``
+does that work once; ``dynamic.api.endpoint.get_execution_plan`` caches the
+result with ``ormcache`` keyed by (endpoint id, write_date), so per-request
+setup is a dictionary lookup.
+
+Plans are shared between requests and threads: every attribute is immutable
+(tuples, frozensets, read-only mappings).  Callers needing a list for the
+ORM must copy it (``list(plan.readable_fields)``).
+"""
+import re
+from types import MappingProxyType
+
+DEFAULT_ORDER = 'id asc'
+
+# Hard ceiling for endpoint.expand_depth, whatever the configuration says
+MAX_EXPAND_DEPTH = 3
+
+_ORDER_RE = re.compile(
+    r'^[a-zA-Z0-9_]+(?: (?:asc|desc))?(?:, ?[a-zA-Z0-9_]+(?: (?:asc|desc))?)*$',
+    re.I,
+)
+
+
+class EndpointPlan:
+    __slots__ = (
+        'endpoint_id', 'model_name', 'auth_type', 'allowed_methods',
+        'readable_fields', 'writable_fields',
+        'alias_map', 'reverse_alias_map', 'readable_by_alias',
+        'sortable_fields', 'filterable_fields', 'validator_fields',
+        'expandable', 'expand_depth',
+    )
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            setattr(self, name, values[name])
+
+    @classmethod
+    def compile(cls, endpoint):
+        model_fields = (
+            endpoint.env[endpoint.model_name]._fields
+            if endpoint.model_name in endpoint.env else {}
+        )
+        alias_map = endpoint.get_field_alias_map()
+        readable = set(endpoint.get_readable_field_names())
+        expandable = {}
+        for line in endpoint.field_ids:
+            field = model_fields.get(line.field_name)
+            if line.allow_expand and line.field_name in readable and field and field.relational:
+                expandable[line.field_name] = (field.comodel_name, field.type != 'many2one')
+        return cls(
+            endpoint_id=endpoint.id,
+            model_name=endpoint.model_name,
+            auth_type=endpoint.auth_type,
+            allowed_methods=tuple(endpoint.get_allowed_methods()),
+            readable_fields=tuple(endpoint.get_readable_field_names()),
+            writable_fields=frozenset(endpoint.get_writable_field_names()),
+            alias_map=MappingProxyType(alias_map),
+            reverse_alias_map=MappingProxyType(endpoint.get_reverse_alias_map()),
+            readable_by_alias=MappingProxyType(
+                {alias: name for name, alias in alias_map.items()}
+            ),
+            sortable_fields=frozenset(
+                name for name, field in model_fields.items() if field.store
+            ),
+            filterable_fields=frozenset(model_fields),
+            validator_fields=('write_date',) if 'write_date' in model_fields else ('id',),
+            # {field_name: (comodel_name, is_x2many)} for relations with allow_expand
+            expandable=MappingProxyType(expandable),
+            expand_depth=max(0, min(endpoint.expand_depth, MAX_EXPAND_DEPTH)),
+        )
+
+    def sanitize_order(self, order):
+        """
+        Accept ``field [asc|desc], …`` on stored fields only; anything else
+        (injection attempts, unknown or non-stored fields) becomes id asc.
+        """
+        if not order or not _ORDER_RE.match(order):
+            return DEFAULT_ORDER
+        for term in order.split(','):
+            if term.split()[0] not in self.sortable_fields:
+                return DEFAULT_ORDER
+        return order
+
+    def unknown_domain_field(self, domain):
+        """Return the first domain leaf field that does not exist, else None."""
+        for leaf in domain:
+            if isinstance(leaf, (list, tuple)) and len(leaf) == 3 and isinstance(leaf[0], str):
+                if leaf[0].split('.')[0] not in self.filterable_fields:
+                    return leaf[0]
+        return None
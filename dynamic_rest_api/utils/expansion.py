@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+Field projection and nested expansion
+=====================================
+
+    GET /api/dynamic/<slug>?fields=name,customer&expand=customer.country
+
+``fields=`` restricts the response to a subset of the exposed fields (client
+names, i.e. aliases).  ``expand=`` replaces relational values — ``[id, name]``
+pairs or id lists — by the related records themselves, so clients do not
+issue one follow-up request per related record.
+
+Whitelisting
+------------
+- A relation can be expanded only if its endpoint field line has
+  ``allow_expand`` set.
+- Related records are returned with the fields of the endpoint that exposes
+  the related model (aliases included); nested expansion follows *that*
+  endpoint's whitelist — but only if the caller may call that endpoint
+  itself (``authorized_related_plan``): it must allow GET, its auth type
+  must be satisfied and an API key restricted to other endpoints does not
+  qualify.  Otherwise,
+  and for models without an active endpoint, related records are returned
+  as ``{id, display_name}`` and cannot be expanded further.
+- Paths longer than the root endpoint's ``expand_depth`` are rejected.
+
+Cost: one batched ``read()`` per expanded relation and level, whatever the
+number of rows on the page.
+"""
+
+DEFAULT_RELATED_FIELDS = ('display_name',)
+
+
+class InvalidExpansion(ValueError):
+    """Raised for unknown projected fields or non-expandable paths."""
+
+
+def parse_fields(fields_param, plan):
+    """Translate ``fields=a,b`` (aliases) into field names of the plan."""
+    if not fields_param:
+        return list(plan.readable_fields)
+    names = []
+    for alias in fields_param.split(','):
+        alias = alias.strip()
+        if not alias or alias == 'id':
+            continue
+        name = plan.readable_by_alias.get(alias)
+        if not name:
+            raise InvalidExpansion(f'Unknown field in fields=: {alias}')
+        if name not in names:
+            names.append(name)
+    # read([]) would return every column of the model
+    return names or ['id']
+
+
+def authorized_related_plan(related_plan, session_uid=None, api_key_endpoint_ids=None):
+    """
+    Wrap ``related_plan(model_name)`` so it only returns the plans of
+    endpoints the caller is authorized for, ``None`` for the others.
+
+    *session_uid* is the caller's Odoo session user, if any.
+    *api_key_endpoint_ids* is ``None`` when no API key was presented, else
+    the key's endpoint restriction (empty: every endpoint).
+    """
+    def resolve(model_name):
+        sub_plan = related_plan(model_name)
+        if sub_plan is None or 'GET' not in sub_plan.allowed_methods:
+            return None
+        if sub_plan.auth_type == 'public':
+            return sub_plan
+        if sub_plan.auth_type == 'session':
+            return sub_plan if session_uid else None
+        if sub_plan.auth_type == 'api_key':
+            if api_key_endpoint_ids is None:
+                return None
+            if api_key_endpoint_ids and sub_plan.endpoint_id not in api_key_endpoint_ids:
+                return None
+            return sub_plan
+        return None
+    return resolve
+
+
+def parse_expand(expand_param, plan, related_plan):
+    """
+    Turn ``expand=a.b,c`` into a tree of field names ``{a: {b: {}}, c: {}}``.
+    ``related_plan(model_name)`` returns the plan of the endpoint exposing a
+    model, or None.
+    """
+    tree = {}
+    if not expand_param:
+        return tree
+    for path in expand_param.split(','):
+        segments = [segment.strip() for segment in path.split('.') if segment.strip()]
+        if not segments:
+            continue
+        if len(segments) > plan.expand_depth:
+            raise InvalidExpansion(
+                f'Expansion "{path.strip()}" exceeds the maximum depth of {plan.expand_depth}.'
+            )
+        node, node_plan = tree, plan
+        for segment in segments:
+            name = node_plan.readable_by_alias.get(segment) if node_plan else None
+            if not name or name not in node_plan.expandable:
+                raise InvalidExpansion(f'Field "{segment}" cannot be expanded.')
+            node = node.setdefault(name, {})
+            node_plan = related_plan(node_plan.expandable[name][0])
+    return tree
+
+
+def expand_rows(env, rows, tree, plan, related_plan):
+    """
+    Replace relational values of ``rows`` (``read()`` dicts, raw field names)
+    in place by the related records, level by level.
+    """
+    for name, subtree in tree.items():
+        comodel, is_x2many = plan.expandable[name]
+        sub_plan = related_plan(comodel)
+
+        ids = []
+        seen = set()
+        for row in rows:
+            value = row.get(name)
+            if not value:
+                continue
+            for related_id in (value if is_x2many else value[:1]):
+                if related_id not in seen:
+                    seen.add(related_id)
+                    ids.append(related_id)
+
+        by_id = {}
+        if ids:
+            if sub_plan:
+                sub_fields = list(sub_plan.readable_fields) or ['id']
+            else:
+                sub_fields = list(DEFAULT_RELATED_FIELDS)
+            related_rows = env[comodel].sudo().browse(ids).read(sub_fields)
+            if subtree:
+                expand_rows(env, related_rows, subtree, sub_plan, related_plan)
+            for related in related_rows:
+                by_id[related['id']] = present_row(related, sub_fields, sub_plan)
+
+        for row in rows:
+            value = row.get(name)
+            if is_x2many:
+                row[name] = [by_id[i] for i in (value or []) if i in by_id]
+            else:
+                row[name] = by_id.get(value[0]) if value else None
+
+
+def present_row(row, field_names, plan=None):
+    """Keep ``id`` and the projected fields, renamed to their aliases."""
+    alias_map = plan.alias_map if plan else {}
+    selected = set(field_names)
+    return {
+        alias_map.get(k, k): v
+        for k, v in row.items()
+        if k in selected or k == 'id'
+    }
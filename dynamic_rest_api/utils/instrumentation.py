@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Per-request instrumentation
+===========================
+
+``RequestMetrics`` measures one dispatcher call: SQL query count and SQL time
+(from the counters Odoo keeps on the serving thread, falling back to the
+cursor's query counter), Python time (wall time minus SQL time) and the
+response size.  Taking the measurement costs two attribute reads.
+
+``SlowRequestSampler`` captures a profile sample of slow requests only.  A
+request registers its thread with a deadline (start + threshold); a single
+watchdog thread per process samples the stacks of requests that are past
+their deadline every ``interval`` seconds.  Fast requests are never sampled
+and pay one dict insert / delete.  The sample is reported in collapsed-stack
+form (``count  outer;…;inner``), most frequent stacks first.
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+DEFAULT_SAMPLE_INTERVAL = 0.005    # seconds
+MAX_STACK_DEPTH = 40
+MAX_REPORTED_STACKS = 20
+
+
+class RequestMetrics:
+    __slots__ = ('cr', 'started', 'thread', 'count0', 'time0')
+
+    def __init__(self, cr):
+        self.cr = cr
+        self.thread = threading.current_thread()
+        self.count0, self.time0 = self._sql_counters()
+        self.started = time.monotonic()
+
+    def _sql_counters(self):
+        if hasattr(self.thread, 'query_count'):
+            return self.thread.query_count, getattr(self.thread, 'query_time', 0.0)
+        return getattr(self.cr, 'sql_log_count', 0), 0.0
+
+    @property
+    def sql_count(self):
+        return self._sql_counters()[0] - self.count0
+
+    def snapshot(self, response_size=0):
+        """Metrics since construction, as dynamic.api.log values."""
+        elapsed = time.monotonic() - self.started
+        count, sql_time = self._sql_counters()
+        sql_time -= self.time0
+        return {
+            'sql_count': count - self.count0,
+            'sql_time_ms': int(sql_time * 1000),
+            'python_time_ms': max(0, int((elapsed - sql_time) * 1000)),
+            'response_size': response_size,
+        }
+
+
+class SlowRequestSampler:
+
+    def __init__(self, interval=DEFAULT_SAMPLE_INTERVAL):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._watched = {}         # token → [thread_id, deadline, Counter]
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def watch(self, threshold_ms):
+        """Start watching the current thread; returns a token for release()."""
+        token = object()
+        deadline = time.monotonic() + threshold_ms / 1000.0
+        with self._lock:
+            self._watched[token] = [threading.get_ident(), deadline, Counter()]
+        self._ensure_watchdog()
+        self._wakeup.set()
+        return token
+
+    def release(self, token):
+        """Stop watching; return the formatted sample, or '' if none was taken."""
+        with self._lock:
+            entry = self._watched.pop(token, None)
+        if not entry or not entry[2]:
+            return ''
+        return '\n'.join(
+            f'{count:>6}  {stack}'
+            for stack, count in entry[2].most_common(MAX_REPORTED_STACKS)
+        )
+
+    def _ensure_watchdog(self):
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == pid and self._thread.is_alive():
+                return
+            self._pid = pid
+            self._thread = threading.Thread(
+                target=self._run, name='dynamic_api_slow_request_sampler', daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                deadlines = [entry[1] for entry in self._watched.values()]
+            if not deadlines:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            delay = min(deadlines) - time.monotonic()
+            if delay > 0:
+                # Most requests are released before their deadline
+                self._wakeup.wait(delay)
+                self._wakeup.clear()
+                continue
+            self._sample()
+            time.sleep(self.interval)
+
+    def _sample(self):
+        now = time.monotonic()
+        with self._lock:
+            due = [entry for entry in self._watched.values() if entry[1] <= now]
+        if not due:
+            return
+        frames = sys._current_frames()
+        for thread_id, _deadline, counter in due:
+            frame = frames.get(thread_id)
+            if frame is not None:
+                counter[_collapse(frame)] += 1
+
+
+def _collapse(frame):
+    names = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        names.append(f'{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}')
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+# Per-process singleton used by the dispatcher
+slow_request_sampler = SlowRequestSampler()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+In-memory API key usage counters
+================================
+
+``dynamic.api.key.validate_key`` used to write ``last_used`` and
+``request_count`` on the key row inside every request.  Concurrent requests
+with the same key then serialised on that row lock.  The counters are now
+aggregated here per worker process and written by a background thread every
+``flush_interval`` seconds with one batched UPDATE per database:
+
+    UPDATE dynamic_api_key SET request_count = request_count + v.hits,
+                               last_used     = GREATEST(last_used, v.last_used)
+      FROM unnest(ids, hits, last_used) v ...
+
+Key ids are sorted so concurrent flushes from several workers lock rows in
+the same order.  Pending counts are flushed on interpreter exit; counts of a
+worker that is killed hard are lost, which is acceptable for statistics.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL = 30.0   # seconds
+
+
+class KeyUsageCounters:
+    """Thread-safe ``(dbname, key_id) → [hits, last_used]`` accumulator."""
+
+    def __init__(self, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = {}          # dbname → {key_id: [hits, last_used]}
+        self._thread = None
+        self._pid = None
+
+        self.flushed = 0
+        self.failed = 0
+
+    def configure(self, flush_interval=None):
+        if flush_interval:
+            self.flush_interval = max(1.0, flush_interval)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Producer side — called from the request thread
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def record(self, dbname, key_id):
+        """Count one request for ``key_id``.  Never touches the database."""
+        now = datetime.utcnow().replace(microsecond=0)
+        with self._lock:
+            counters = self._pending.setdefault(dbname, {})
+            entry = counters.get(key_id)
+            if entry is None:
+                counters[key_id] = [1, now]
+            else:
+                entry[0] += 1
+                entry[1] = now
+        self._ensure_flusher()
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Consumer side — background thread / exit hook
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            for dbname, counters in pending.items():
+                if not counters:
+                    continue
+                try:
+                    self._write(dbname, counters)
+                    self.flushed += len(counters)
+                except Exception:
+                    self.failed += len(counters)
+                    _logger.exception(
+                        'DynamicApiKey: failed to flush usage counters of %d key(s) for db %s',
+                        len(counters), dbname,
+                    )
+
+    @staticmethod
+    def _write(dbname, counters):
+        from odoo.modules.registry import Registry
+
+        key_ids = sorted(counters)
+        with Registry(dbname).cursor() as cr:
+            cr.execute("""
+                UPDATE dynamic_api_key k
+                   SET request_count = COALESCE(k.request_count, 0) + v.hits,
+                       last_used = GREATEST(k.last_used, v.last_used)
+                  FROM unnest(%s::int[], %s::int[], %s::timestamp[])
+                       AS v(id, hits, last_used)
+                 WHERE k.id = v.id
+            """, (
+                key_ids,
+                [counters[key_id][0] for key_id in key_ids],
+                [counters[key_id][1] for key_id in key_ids],
+            ))
+
+    def _ensure_flusher(self):
+        """Start the flusher thread lazily, once per (forked) process."""
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == pid and self._thread.is_alive():
+                return
+            self._pid = pid
+            self._thread = threading.Thread(
+                target=self._run, name='dynamic_api_key_usage_flusher', daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                _logger.exception('DynamicApiKey: usage flusher iteration failed')
+
+    def stats(self):
+        with self._lock:
+            pending = sum(len(counters) for counters in self._pending.values())
+        return {
+            'pending_keys': pending,
+            'flushed': self.flushed,
+            'failed': self.failed,
+            'flush_interval': self.flush_interval,
+        }
+
+
+# Per-process singleton used by dynamic.api.key
+key_usage_counters = KeyUsageCounters()
+
+
+@atexit.register
+def _flush_on_exit():
+    if key_usage_counters.stats()['pending_keys']:
+        key_usage_counters.flush()
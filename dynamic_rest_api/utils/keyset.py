@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Keyset (cursor) pagination helpers
+==================================
+
+Offset pagination makes PostgreSQL walk and discard ``offset`` rows, so page
+N costs O(N × page_size).  Keyset pagination instead remembers the sort key
+and id of the last row returned and asks for rows strictly "after" it:
+
+    ORDER BY <key> ASC NULLS LAST, id ASC
+    WHERE  key > :v  OR  (key = :v AND id > :id)  OR  key IS NULL
+
+With an index on the sort key every page costs the same as the first one.
+
+Only ``id`` and stored date / datetime fields are accepted as sort keys;
+anything else falls back to ``id``.  Those are the fields the ORM reads
+back as ``False`` exactly when the column is NULL, so the cursor can tell
+the trailing NULL block apart.  Numbers are excluded: a NULL integer,
+float or monetary column reads as ``0``, which would put a cursor taken
+inside the NULL block back at the start of it and repeat pages forever.
+The cursor handed to clients is an opaque URL-safe token.  Key values are
+stored in ISO format with their microseconds and parsed back to the same
+``date`` / ``datetime``: rows created within the same second must still
+compare exactly, or pages would repeat (ascending) or skip (descending)
+rows.
+"""
+import base64
+import json
+import re
+from datetime import date, datetime
+
+KEYSET_FIELD_TYPES = ('date', 'datetime')
+
+_ORDER_RE = re.compile(r'^\s*([a-zA-Z0-9_]+)(?:\s+(asc|desc))?\s*$', re.I)
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client-supplied cursor cannot be decoded or reused."""
+
+
+def parse_keyset_order(model, order):
+    """
+    Reduce an ``order`` query parameter to a single keyset-compatible
+    ``(field_name, direction)`` pair.  Only the first term is honoured; the
+    id tie-breaker is always added by :func:`keyset_order_clause`.
+    """
+    first_term = (order or '').split(',')[0]
+    match = _ORDER_RE.match(first_term)
+    if not match:
+        return 'id', 'asc'
+    field_name = match.group(1)
+    direction = (match.group(2) or 'asc').lower()
+    if field_name == 'id':
+        return 'id', direction
+    field = model._fields.get(field_name)
+    if not field or not field.store or field.type not in KEYSET_FIELD_TYPES:
+        return 'id', 'asc'
+    return field_name, direction
+
+
+def keyset_order_clause(field_name, direction):
+    if field_name == 'id':
+        return f'id {direction}'
+    return f'{field_name} {direction} nulls last, id {direction}'
+
+
+def keyset_domain(field_name, direction, last_value, last_id):
+    """Domain selecting the rows that sort strictly after the cursor row."""
+    op = '>' if direction == 'asc' else '<'
+    if field_name == 'id':
+        return [('id', op, last_id)]
+    if last_value is None:
+        # Already inside the trailing NULL block
+        return [(field_name, '=', False), ('id', op, last_id)]
+    return [
+        '|', '|',
+        (field_name, op, last_value),
+        '&', (field_name, '=', last_value), ('id', op, last_id),
+        (field_name, '=', False),
+    ]
+
+
+def _dump_value(value):
+    if value is False or value is None:
+        return None
+    return value.isoformat()
+
+
+def _load_value(value):
+    """Inverse of :func:`_dump_value`: ``YYYY-MM-DD`` is a date."""
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise ValueError('cursor value must be a string')
+    if len(value) == 10:
+        return date.fromisoformat(value)
+    return datetime.fromisoformat(value)
+
+
+def encode_cursor(field_name, direction, row):
+    """Build the opaque ``next_cursor`` token from the last row of a page."""
+    token = {
+        'k': field_name,
+        'd': direction,
+        'v': None if field_name == 'id' else _dump_value(row.get(field_name)),
+        'id': row['id'],
+    }
+    raw = json.dumps(token, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor, field_name, direction):
+    """Return ``(last_value, last_id)``; the cursor must match the sort."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        token = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(token, dict):
+            raise ValueError('cursor payload must be an object')
+        last_id = int(token['id'])
+        last_value = None if field_name == 'id' else _load_value(token.get('v'))
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursor('Invalid cursor.')
+    if token.get('k') != field_name or token.get('d') != direction:
+        raise InvalidCursor('Cursor does not match the requested order.')
+    return last_value, last_id
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+In-memory request log buffer
+============================
+
+``dynamic.api.log.log_request`` used to INSERT one row inside the serving
+transaction of every API call.  In *buffered* mode the log values are queued
+here instead and written in batches by a background flusher thread using its
+own cursor, so the request transaction never touches the log table.
+
+Design
+------
+- One buffer per worker process (module-level singleton below).  Entries are
+  grouped by database name because a single worker may serve several DBs.
+- The queue is bounded: when ``max_size`` entries are waiting, new entries are
+  dropped and counted in ``dropped`` — logging must never exhaust memory.
+- A flush is triggered when ``batch_size`` entries are queued, or every
+  ``flush_interval`` seconds, whichever comes first.
+- Pending entries are flushed on interpreter exit (worker recycling).
+
+The synchronous path in ``log_request`` stays available as a fallback
+(``dynamic_rest_api.log_mode = sync``).
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL = 5.0    # seconds
+DEFAULT_MAX_SIZE = 10000
+
+
+class LogBuffer:
+    """Bounded, thread-safe queue of ``dynamic.api.log`` create values."""
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE,
+                 flush_interval=DEFAULT_FLUSH_INTERVAL, max_size=DEFAULT_MAX_SIZE):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._queues = {}           # dbname → [vals, ...]
+        self._size = 0
+        self._thread = None
+        self._pid = None
+        self._last_flush = time.monotonic()
+
+        # Counters (per process, since start)
+        self.enqueued = 0
+        self.flushed = 0
+        self.dropped = 0
+        self.failed = 0
+        self._dropped_reported = 0
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Configuration
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def configure(self, batch_size=None, flush_interval=None, max_size=None):
+        """Apply settings read from ir.config_parameter (cheap, idempotent)."""
+        if batch_size:
+            self.batch_size = max(1, batch_size)
+        if flush_interval:
+            self.flush_interval = max(0.1, flush_interval)
+        if max_size:
+            self.max_size = max(1, max_size)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Producer side — called from the request thread
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def enqueue(self, dbname, vals):
+        """
+        Queue one log entry.  Returns False (and counts a drop) when the
+        buffer is full.  Never blocks on I/O.
+        """
+        with self._lock:
+            if self._size >= self.max_size:
+                self.dropped += 1
+                return False
+            self._queues.setdefault(dbname, []).append(vals)
+            self._size += 1
+            self.enqueued += 1
+            due = (
+                self._size >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+
+        self._ensure_flusher()
+        if due:
+            self._wakeup.set()
+        return True
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Consumer side — background thread / exit hook
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _drain(self):
+        with self._lock:
+            queues, self._queues, self._size = self._queues, {}, 0
+            self._last_flush = time.monotonic()
+        return queues
+
+    def flush(self):
+        """Write every queued entry, one batched create per chunk and DB."""
+        with self._flush_lock:
+            for dbname, vals_list in self._drain().items():
+                for start in range(0, len(vals_list), self.batch_size):
+                    chunk = vals_list[start:start + self.batch_size]
+                    try:
+                        self._write(dbname, chunk)
+                        self.flushed += len(chunk)
+                    except Exception:
+                        self.failed += len(chunk)
+                        _logger.exception(
+                            'DynamicApiLog: failed to flush %d buffered log(s) for db %s',
+                            len(chunk), dbname,
+                        )
+
+            if self.dropped > self._dropped_reported:
+                _logger.warning(
+                    'DynamicApiLog: log buffer full — %d entr(y/ies) dropped so far '
+                    '(max_size=%d).', self.dropped, self.max_size,
+                )
+                self._dropped_reported = self.dropped
+
+    @staticmethod
+    def _write(dbname, vals_list):
+        # Imported lazily: this module is also used by offline tooling.
+        from odoo import api, SUPERUSER_ID
+        from odoo.modules.registry import Registry
+
+        with Registry(dbname).cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            env['dynamic.api.log']._create_buffered_logs(vals_list)
+
+    def _ensure_flusher(self):
+        """Start the flusher thread lazily, once per (forked) process."""
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == pid and self._thread.is_alive():
+                return
+            self._pid = pid
+            self._thread = threading.Thread(
+                target=self._run, name='dynamic_api_log_flusher', daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                _logger.exception('DynamicApiLog: log flusher iteration failed')
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Introspection
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def stats(self):
+        with self._lock:
+            queued = self._size
+        return {
+            'queued': queued,
+            'enqueued': self.enqueued,
+            'flushed': self.flushed,
+            'dropped': self.dropped,
+            'failed': self.failed,
+            'batch_size': self.batch_size,
+            'flush_interval': self.flush_interval,
+            'max_size': self.max_size,
+        }
+
+
+# Per-process singleton used by dynamic.api.log
+request_log_buffer = LogBuffer()
+
+
+@atexit.register
+def _flush_on_exit():
+    if request_log_buffer.stats()['queued']:
+        request_log_buffer.flush()
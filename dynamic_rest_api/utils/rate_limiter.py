@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Pluggable rate-limiter engine
+=============================
+
+``dynamic.api.key.check_rate_limit`` used to ``search_count`` the log table
+for the last minute on every request.  It now delegates to a limiter backend
+chosen per endpoint (``dynamic.api.endpoint.rate_limit_strategy``):
+
+    memory  (default)  Token bucket held in this worker process.  O(1), no
+                       SQL at all.  Each worker enforces the limit on its own,
+                       so the effective cluster-wide limit is limit × workers.
+
+    shared             Token bucket stored in ``dynamic.api.rate.bucket`` and
+                       updated with a single atomic UPSERT.  Exact across all
+                       workers at the cost of one indexed statement.
+
+Both backends model "rate_limit requests per minute" as a bucket of
+``rate_limit`` tokens refilled at ``rate_limit / 60`` tokens per second, which
+allows the same burst as the former one-minute window.
+
+Buckets need no reset when the configuration changes: the token count is
+capped by the current ``rate_limit`` on every call, so a lowered limit
+applies at once and a raised one within its refill time.  Buckets of
+deleted endpoints or keys go idle and are pruned (memory) or removed by
+``ondelete='cascade'`` (shared).
+
+Additional backends can be plugged in with :func:`register_rate_limiter`
+(together with a ``selection_add`` on ``rate_limit_strategy``).
+"""
+import threading
+import time
+
+# Buckets idle for longer than this are pruned from the in-memory table.
+_IDLE_BUCKET_SECONDS = 600
+_PRUNE_THRESHOLD = 10000
+
+
+class TokenBucketLimiter:
+    """Per-process token bucket keyed by (db, endpoint id, key id)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}      # key → [tokens, last_refill_monotonic]
+
+    def allow(self, env, endpoint_id, key_id, limit):
+        capacity = float(limit)
+        refill_rate = capacity / 60.0
+        bucket_key = (env.cr.dbname, endpoint_id, key_id)
+        now = time.monotonic()
+
+        with self._lock:
+            bucket = self._buckets.get(bucket_key)
+            if bucket is None:
+                if len(self._buckets) >= _PRUNE_THRESHOLD:
+                    self._prune(now)
+                self._buckets[bucket_key] = [capacity - 1, now]
+                return True
+
+            tokens = min(capacity, bucket[0] + (now - bucket[1]) * refill_rate)
+            bucket[1] = now
+            if tokens >= 1:
+                bucket[0] = tokens - 1
+                return True
+            bucket[0] = tokens
+            return False
+
+    def _prune(self, now):
+        stale = [
+            bucket_key for bucket_key, (_tokens, last) in self._buckets.items()
+            if now - last > _IDLE_BUCKET_SECONDS
+        ]
+        for bucket_key in stale:
+            del self._buckets[bucket_key]
+
+
+class SharedTableLimiter:
+    """Token bucket persisted in ``dynamic.api.rate.bucket`` (multi-worker)."""
+
+    def allow(self, env, endpoint_id, key_id, limit):
+        return env['dynamic.api.rate.bucket'].sudo().consume(
+            endpoint_id, key_id, capacity=float(limit), refill_rate=limit / 60.0,
+        )
+
+
+RATE_LIMITERS = {
+    'memory': TokenBucketLimiter(),
+    'shared': SharedTableLimiter(),
+}
+DEFAULT_STRATEGY = 'memory'
+
+
+def register_rate_limiter(name, limiter):
+    """Register a backend exposing ``allow(env, endpoint_id, key_id, limit)``."""
+    RATE_LIMITERS[name] = limiter
+
+
+def get_rate_limiter(strategy):
+    return RATE_LIMITERS.get(strategy) or RATE_LIMITERS[DEFAULT_STRATEGY]
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Short-TTL in-process GET response cache
+=======================================
+
+Caches the JSON envelope (plus its ETag / Last-Modified validators) of GET
+responses per endpoint and query signature, for ``endpoint.cache_ttl``
+seconds.
+
+Invalidation
+------------
+- Every create / write / unlink on a model (hook in models/base.py) bumps
+  that model's *generation* once its transaction commits
+  (``touch_model_on_commit``); nothing is bumped on rollback.  Entries
+  remember the generation read *before* their data was read and are
+  discarded when it changes, so a response built from pre-commit data is
+  never kept past the commit.  Only models that have cached entries are
+  tracked, so for all other models the hook costs a set insertion per write
+  and a dict lookup per commit.
+- Endpoint edits (dynamic.api.endpoint._invalidate_endpoint_cache) drop the
+  endpoint's entries.
+- The cache lives in each worker process: a write committed by another
+  worker, or by raw SQL that bypasses the ORM, is only picked up when the
+  TTL expires, so keep TTLs short (a few seconds).
+"""
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 1000
+
+
+class ResponseCache:
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # key → (expires_at, model_key, generation, value)
+        self._generations = {}          # (dbname, model_name) → int
+
+    @staticmethod
+    def make_key(dbname, endpoint_id, alias_map, qs_params):
+        """Key on endpoint, exposed field layout and the full query string."""
+        return (
+            dbname,
+            endpoint_id,
+            tuple(sorted(alias_map.items())),
+            tuple(sorted((k, str(v)) for k, v in qs_params.items())),
+        )
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, model_key, generation, value = entry
+            if expires_at < time.monotonic() or self._generations.get(model_key) != generation:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def generation(self, dbname, model_name):
+        """Current generation of *model_name*; take it before reading the data."""
+        with self._lock:
+            return self._generations.setdefault((dbname, model_name), 0)
+
+    def put(self, key, model_name, value, ttl, generation):
+        """Store *value*, built from data read at *generation*."""
+        model_key = (key[0], model_name)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, model_key, generation, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def touch_model(self, dbname, model_name):
+        """Invalidate the entries of *model_name*; no-op for models never cached."""
+        model_key = (dbname, model_name)
+        if model_key not in self._generations:
+            return
+        with self._lock:
+            self._generations[model_key] += 1
+
+    def touch_model_on_commit(self, cr, model_name):
+        """:meth:`touch_model` once *cr* commits (dropped on rollback)."""
+        touched = cr.postcommit.data.get('dynamic_api.touched_models')
+        if touched is None:
+            # One callback per transaction, however many writes it makes
+            touched = cr.postcommit.data['dynamic_api.touched_models'] = set()
+            dbname = cr.dbname
+
+            @cr.postcommit.add
+            def touch_models():
+                for name in touched:
+                    self.touch_model(dbname, name)
+        touched.add(model_name)
+
+    def invalidate_endpoints(self, dbname, endpoint_ids):
+        endpoint_ids = set(endpoint_ids)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == dbname and k[1] in endpoint_ids]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+
+
+# Per-process singleton used by the dispatcher
+response_cache = ResponseCache()
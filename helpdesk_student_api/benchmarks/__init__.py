@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+# Offline tooling: not imported by the addon, see blacklist_benchmark.py and auth_load_test.py
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+Auth endpoints load test
+========================
+
+Offline login-storm simulation for ``/api/v1/auth/login``, ``/refresh``,
+``/logout`` and ``/health``.  Requests are built with werkzeug's
+``EnvironBuilder`` and handed to the real ``HelpdeskAuthController``
+handlers from a pool of threads; each request runs on its own cursor and
+is committed, like a request served by the HTTP layer.
+
+Usage (from ``odoo-bin shell -d <db>``)::
+
+    from odoo.addons.helpdesk_student_api.benchmarks.auth_load_test import run
+    report = run(env, sessions=2000, workers=16)
+
+Population
+----------
+``students`` portal users are created and committed (the authentication
+service opens its own cursor, so they must be visible to other
+transactions).  The password is hashed once and written to every user.
+Users, their partners and everything cascading from them — login logs,
+blacklist rows — are deleted again at the end.
+
+Sessions
+--------
+Each of the ``sessions`` simulated students runs::
+
+    login → refresh × refreshes_per_session → logout (+ refresh token)
+
+with one ``/health`` call every ``health_every`` sessions.  Sessions are
+spread over ``workers`` threads.
+
+Report
+------
+    throughput    requests per second over the whole run
+    per endpoint  count, HTTP status counts, p50/p95/p99 latency in ms
+    phases        share of the summed request time spent in each phase;
+                  times are exclusive (a phase nested in another is only
+                  counted once):
+
+        hashing          passlib ``verify_and_update`` (password check)
+        authenticate     the rest of the authentication service call
+        generate_tokens  ``jwt_utils.generate_tokens``
+        decode_token     ``jwt_utils.decode_token``
+        blacklist        ``is_blacklisted`` / ``revoke``
+        commit           transaction commit after the handler
+        other            request parsing, response building, …
+"""
+import json
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from unittest.mock import patch
+
+from passlib.context import CryptContext
+
+from odoo import api, SUPERUSER_ID
+
+from ..controllers import auth_api
+from ..controllers.auth_api import HelpdeskAuthController
+from ..models.token_blacklist import HelpdeskApiTokenBlacklist
+from ..utils import jwt_utils
+from ._common import _OfflineRequest, _percentile
+
+PERCENTILES = (50, 95, 99)
+PHASES = (
+    'hashing', 'authenticate', 'generate_tokens', 'decode_token',
+    'blacklist', 'commit', 'other',
+)
+_PASSWORD = 'load-test-password'
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Request stand-in
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _ThreadRequest(threading.local):
+    """Stand-in for the ``request`` proxy: one current request per thread."""
+
+    current = None
+
+    def __getattr__(self, name):
+        return getattr(self.current, name)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Phase timing
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _PhaseTimer(threading.local):
+    """Exclusive time per phase for the request running on this thread."""
+
+    def __init__(self):
+        self.stack  = []                 # [phase, start, child time]
+        self.totals = defaultdict(float)
+
+    def wrap(self, phase, func):
+        timer = self
+
+        def timed(*args, **kwargs):
+            timer.stack.append([phase, time.perf_counter(), 0.0])
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _phase, start, children = timer.stack.pop()
+                elapsed = time.perf_counter() - start
+                timer.totals[phase] += elapsed - children
+                if timer.stack:
+                    timer.stack[-1][2] += elapsed
+        return timed
+
+    def take(self):
+        totals, self.totals = self.totals, defaultdict(float)
+        return totals
+
+
+def _instrument(stack, timer):
+    """Patch every measured phase for the duration of *stack*."""
+    for owner, name, phase in (
+        (CryptContext, 'verify_and_update', 'hashing'),
+        (auth_api, '_authenticate', 'authenticate'),
+        (jwt_utils, 'generate_tokens', 'generate_tokens'),
+        (jwt_utils, 'decode_token', 'decode_token'),
+        (HelpdeskApiTokenBlacklist, 'is_blacklisted', 'blacklist'),
+        (HelpdeskApiTokenBlacklist, 'revoke', 'blacklist'),
+    ):
+        stack.enter_context(
+            patch.object(owner, name, timer.wrap(phase, getattr(owner, name)))
+        )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Population
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _create_students(registry, count, run_id):
+    with registry.cursor() as cr:
+        env   = api.Environment(cr, SUPERUSER_ID, {})
+        Users = env['res.users'].with_context(no_reset_password=True)
+        groups_field = 'group_ids' if 'group_ids' in Users._fields else 'groups_id'
+        users = Users.create([
+            {
+                'name':       'Load Test Student %s' % n,
+                'login':      'loadtest-%s-%s@example.com' % (run_id, n),
+                'email':      'loadtest-%s-%s@example.com' % (run_id, n),
+                groups_field: [(6, 0, [env.ref('base.group_portal').id])],
+            }
+            for n in range(count)
+        ])
+        # Hash once instead of once per user
+        env.flush_all()
+        cr.execute(
+            'UPDATE res_users SET password = %s WHERE id = ANY(%s)',
+            (users._crypt_context().hash(_PASSWORD), users.ids),
+        )
+        return users.mapped('login'), users.ids, users.partner_id.ids
+
+
+def _delete_students(registry, user_ids, partner_ids):
+    with registry.cursor() as cr:
+        env = api.Environment(cr, SUPERUSER_ID, {'active_test': False})
+        env['res.users'].browse(user_ids).unlink()
+        env['res.partner'].browse(partner_ids).unlink()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Runner
+# ─────────────────────────────────────────────────────────────────────────────
+
+def run(env, sessions=1000, workers=8, students=200, refreshes_per_session=2,
+        health_every=10, verbose=True):
+    """
+    Run *sessions* simulated student sessions on *workers* threads and
+    return the report described in the module docstring; times in ms.
+    """
+    registry   = env.registry
+    run_id     = uuid.uuid4().hex[:8]
+    controller = HelpdeskAuthController()
+    request    = _ThreadRequest()
+    timer      = _PhaseTimer()
+    samples    = []                      # (endpoint, status, ms, phases)
+    lock       = threading.Lock()
+
+    def call(endpoint, handler, method='POST', body=None, headers=None):
+        with registry.cursor() as cr:
+            request_env = api.Environment(cr, SUPERUSER_ID, {})
+            request.current = _OfflineRequest(
+                request_env, '/api/v1/' + endpoint, method,
+                body=json.dumps(body) if body is not None else None, headers=headers,
+            )
+            timer.take()
+            start = time.perf_counter()
+            response = handler()
+            commit_start = time.perf_counter()
+            cr.commit()
+            end = time.perf_counter()
+        phases = timer.take()
+        phases['commit'] = end - commit_start
+        phases['other']  = max(0.0, (end - start) - sum(phases.values()))
+        with lock:
+            samples.append((endpoint, response.status_code, (end - start) * 1000, phases))
+        return json.loads(response.get_data() or b'{}')
+
+    def session(n):
+        login = logins[n % len(logins)]
+        if health_every and n % health_every == 0:
+            call('health', controller.health, method='GET')
+        tokens = call('auth/login', controller.login,
+                      body={'email': login, 'password': _PASSWORD}).get('data')
+        if not tokens:
+            return
+        for _i in range(refreshes_per_session):
+            refreshed = call('auth/refresh', controller.refresh,
+                             body={'refresh_token': tokens['refresh_token']}).get('data')
+            if not refreshed:
+                return
+            tokens = refreshed
+        call('auth/logout', controller.logout,
+             body={'refresh_token': tokens['refresh_token']},
+             headers={'Authorization': 'Bearer %s' % tokens['access_token']})
+
+    logins, user_ids, partner_ids = _create_students(registry, students, run_id)
+    try:
+        with ExitStack() as stack:
+            stack.enter_context(patch.object(auth_api, 'request', request))
+            _instrument(stack, timer)
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for future in [pool.submit(session, n) for n in range(sessions)]:
+                    future.result()
+            wall = time.perf_counter() - start
+    finally:
+        _delete_students(registry, user_ids, partner_ids)
+
+    report = _summarise(samples, wall, workers)
+    if verbose:
+        print(format_report(report))
+    return report
+
+
+def _summarise(samples, wall, workers):
+    by_endpoint = defaultdict(list)
+    statuses    = defaultdict(Counter)
+    phase_total = defaultdict(float)
+    for endpoint, status, ms, phases in samples:
+        by_endpoint[endpoint].append(ms)
+        statuses[endpoint][status] += 1
+        for phase, seconds in phases.items():
+            phase_total[phase] += seconds
+
+    endpoints = {}
+    for endpoint, timings in by_endpoint.items():
+        timings.sort()
+        summary = {
+            'requests': len(timings),
+            'statuses': dict(statuses[endpoint]),
+            'mean_ms':  sum(timings) / len(timings),
+        }
+        for pct in PERCENTILES:
+            summary['p%s_ms' % pct] = _percentile(timings, pct)
+        endpoints[endpoint] = summary
+
+    busy = sum(phase_total.values()) or 1
+    return {
+        'requests':   len(samples),
+        'workers':    workers,
+        'wall_s':     wall,
+        'throughput': len(samples) / wall if wall else 0.0,
+        'endpoints':  endpoints,
+        'phases':     {phase: phase_total.get(phase, 0.0) / busy for phase in PHASES},
+    }
+
+
+def format_report(report):
+    """Render ``run()`` output as plain text."""
+    lines = [
+        f"{report['requests']} requests on {report['workers']} workers in "
+        f"{report['wall_s']:.1f} s → {report['throughput']:.1f} req/s",
+        '',
+    ]
+    header = (
+        f"{'endpoint':<14} {'reqs':>6} {'p50':>8} {'p95':>8} {'p99':>8}  statuses"
+    )
+    lines += [header, '-' * len(header)]
+    for endpoint, summary in sorted(report['endpoints'].items()):
+        statuses = ' '.join(
+            '%s×%s' % (status, count) for status, count in sorted(summary['statuses'].items())
+        )
+        lines.append(
+            f"{endpoint:<14} {summary['requests']:>6} {summary['p50_ms']:>8.2f} "
+            f"{summary['p95_ms']:>8.2f} {summary['p99_ms']:>8.2f}  {statuses}"
+        )
+    lines += ['', 'time share by phase']
+    for phase, share in report['phases'].items():
+        lines.append(f"  {phase:<16} {share * 100:>5.1f} %")
+    return '\n'.join(lines)
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+Token blacklist load test
+=========================
+
+Offline check that JTI lookups on ``helpdesk.api.token.blacklist`` keep a
+constant cost as the table grows, and of what a bucketed purge costs.
+Everything runs on a private cursor that is rolled back at the end — the
+database is left exactly as it was.
+
+Usage (from ``odoo-bin shell -d <db>``)::
+
+    from odoo.addons.helpdesk_student_api.benchmarks.blacklist_benchmark import run
+    report = run(env, sizes=(10000, 100000, 500000), lookups=5000)
+
+Population
+----------
+The table is grown step by step to each entry of ``sizes`` with one
+``INSERT … SELECT generate_series`` per step (an ORM ``create`` per token
+would take longer than the measurement).  Expiries are spread from one
+day in the past to six days ahead, so about one row in seven is already
+expired and every expiry bucket of the week is populated.
+
+Measurements (per table size)
+-----------------------------
+    hit p50/p95/p99    ``is_blacklisted`` on a revoked JTI, µs
+    miss p50/p95/p99   ``is_blacklisted`` on an unknown JTI, µs
+    plan               planner node of the lookup (``Index Only Scan`` once
+                       autovacuum has set the visibility map; rows inserted
+                       by this uncommitted run usually show ``Index Scan``)
+    buckets            distinct expiry buckets
+
+After the largest size the expired rows are purged with
+``purge_expired(commit=False)``; its duration and row count are reported.
+``constant`` is true when the p50 hit latency at the largest size is
+within ``tolerance`` times the one at the smallest size.
+"""
+import random
+import time
+import uuid
+
+from odoo import api, SUPERUSER_ID
+
+from ..models.token_blacklist import BUCKET_SECONDS
+from ._common import _percentile
+
+PERCENTILES = (50, 95, 99)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Population
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _grow(env, prefix, start, stop):
+    """Insert blacklist rows ``prefix-start`` … ``prefix-stop`` in one statement."""
+    Blacklist = env['helpdesk.api.token.blacklist']
+    env.cr.execute(f"""
+        INSERT INTO {Blacklist._table} (
+            jti, token_type, expires_at, reason, expiry_bucket,
+            create_uid, create_date, write_uid, write_date
+        )
+        SELECT %(prefix)s || '-' || n,
+               CASE WHEN n %% 5 = 0 THEN 'refresh' ELSE 'access' END,
+               x.expires_at,
+               'benchmark',
+               floor(extract(epoch FROM x.expires_at) / %(bucket)s)::int,
+               %(uid)s, x.now, %(uid)s, x.now
+          FROM generate_series(%(start)s, %(stop)s) AS n,
+               LATERAL (
+                   SELECT (now() AT TIME ZONE 'UTC') AS now,
+                          (now() AT TIME ZONE 'UTC')
+                            + (((n * 7919) %% 10080) - 1440) * interval '1 minute'
+                            AS expires_at
+               ) AS x
+    """, {
+        'prefix': prefix,
+        'bucket': BUCKET_SECONDS,
+        'uid':    SUPERUSER_ID,
+        'start':  start,
+        'stop':   stop,
+    })
+    env.cr.execute(f'ANALYZE {Blacklist._table}')
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Runner
+# ─────────────────────────────────────────────────────────────────────────────
+
+def run(env, sizes=(10000, 100000, 300000), lookups=2000, tolerance=2.0,
+        seed=42, verbose=True):
+    """
+    Grow the blacklist through *sizes* and time *lookups* hits and misses
+    at each size.  Returns ``{'sizes': {size: summary}, 'purge': {...},
+    'constant': bool}``; latencies in µs.
+    """
+    random.seed(seed)
+    prefix = 'bench-%s' % uuid.uuid4().hex[:12]
+    report = {'sizes': {}}
+    with env.registry.cursor() as cr:
+        bench_env = api.Environment(cr, SUPERUSER_ID, {})
+        Blacklist = bench_env['helpdesk.api.token.blacklist']
+        try:
+            populated = 0
+            for size in sorted(sizes):
+                _grow(bench_env, prefix, populated + 1, size)
+                populated = size
+                report['sizes'][size] = _measure(bench_env, prefix, size, lookups)
+
+            start   = time.perf_counter()
+            purged  = Blacklist.purge_expired(commit=False)
+            elapsed = time.perf_counter() - start
+            report['purge'] = {
+                'rows':      purged,
+                'ms':        elapsed * 1000,
+                'remaining': Blacklist.blacklist_stats()['rows'],
+            }
+        finally:
+            cr.rollback()
+
+    measured = [report['sizes'][size]['hit_p50_us'] for size in sorted(report['sizes'])]
+    report['constant'] = bool(measured) and measured[-1] <= measured[0] * tolerance
+
+    if verbose:
+        print(format_report(report))
+    return report
+
+
+def _measure(env, prefix, size, lookups):
+    Blacklist = env['helpdesk.api.token.blacklist']
+    hits   = ['%s-%s' % (prefix, random.randint(1, size)) for _i in range(lookups)]
+    misses = ['%s-miss-%s' % (prefix, n) for n in range(lookups)]
+
+    # Warm-up: statement plan, index root pages
+    for jti in hits[:50] + misses[:50]:
+        Blacklist.is_blacklisted(jti)
+
+    summary = {}
+    for label, jtis, expected in (('hit', hits, True), ('miss', misses, False)):
+        timings = []
+        for jti in jtis:
+            start = time.perf_counter()
+            found = Blacklist.is_blacklisted(jti)
+            timings.append((time.perf_counter() - start) * 1e6)
+            assert found is expected, 'unexpected lookup result for %s' % jti
+        timings.sort()
+        for pct in PERCENTILES:
+            summary['%s_p%s_us' % (label, pct)] = _percentile(timings, pct)
+
+    env.cr.execute(
+        f'EXPLAIN (FORMAT JSON) SELECT 1 FROM {Blacklist._table} WHERE jti = %s',
+        (hits[0],),
+    )
+    summary['plan'] = env.cr.fetchone()[0][0]['Plan']['Node Type']
+    summary.update(Blacklist.blacklist_stats())
+    return summary
+
+
+def format_report(report):
+    """Render ``run()`` output as a plain-text table."""
+    header = (
+        f"{'rows':>9} {'hit p50':>8} {'p95':>8} {'p99':>8} "
+        f"{'miss p50':>9} {'p95':>8} {'p99':>8} {'buckets':>8}  plan"
+    )
+    lines = [header, '-' * len(header)]
+    for size, summary in sorted(report['sizes'].items()):
+        lines.append(
+            f"{summary['rows']:>9} {summary['hit_p50_us']:>8.1f} "
+            f"{summary['hit_p95_us']:>8.1f} {summary['hit_p99_us']:>8.1f} "
+            f"{summary['miss_p50_us']:>9.1f} {summary['miss_p95_us']:>8.1f} "
+            f"{summary['miss_p99_us']:>8.1f} {summary['buckets']:>8}  {summary['plan']}"
+        )
+    purge = report.get('purge')
+    if purge:
+        lines.append(
+            f"purge: {purge['rows']} expired row(s) in {purge['ms']:.1f} ms, "
+            f"{purge['remaining']} left"
+        )
+    lines.append('lookup latency constant: %s' % ('yes' if report['constant'] else 'NO'))
+    return '\n'.join(lines)
@@ -6,10 +6,12 @@ Helpdesk Student REST API — Ticket Controller
 Endpoints
 ---------
 GET  /api/v1/helpdesk/tickets
-    List all tickets for a student (identified by ``email`` query param).
+    List all tickets for a student (identified by ``email`` query param),
+    page- or cursor-paged, with the student's summary counters.
 
 GET  /api/v1/helpdesk/tickets/<ticket_id>
-    Full detail for a single ticket belonging to that student.
+    Full detail for a single ticket belonging to that student; long
+    threads can be fetched newest-first in pages ("load older").
 
 Authentication
 --------------
@@ -22,7 +24,7 @@ Obtain one from  ``POST /api/v1/auth/login``.
 Error codes
 -----------
 400  MISSING_EMAIL      – email query param absent or blank
-400  VALIDATION_ERROR   – bad pagination / sort value
+400  VALIDATION_ERROR   – bad pagination / sort / state value or cursor
 401  MISSING_AUTH       – no Authorization header
 401  TOKEN_EXPIRED      – access token has expired (use /refresh)
 401  TOKEN_REVOKED      – token has been logged out
@@ -33,11 +35,15 @@ Error codes
 """
 
 import logging
+from datetime import datetime
 
 from odoo.exceptions import AccessError
 from odoo.http import request, route, Controller
 
 from ..utils.api_helpers import (
+    decode_cursor,
+    decode_message_cursor,
+    encode_cursor,
     error_response,
     require_jwt,
     resolve_partner_by_email,
@@ -48,14 +54,74 @@ from ..utils.api_helpers import (
 
 _logger = logging.getLogger(__name__)
 
-_DEFAULT_PAGE_SIZE = 20
-_MAX_PAGE_SIZE     = 100
+_DEFAULT_PAGE_SIZE  = 20
+_MAX_PAGE_SIZE      = 100
+_MAX_MESSAGE_LIMIT  = 200
+# sort_by → SQL sort key (helpdesk_ticket t LEFT JOIN helpdesk_stage s);
+# ties are broken on t.id in the same direction.
 _VALID_SORT_FIELDS = {
-    'create_date': 'create_date',
-    'name':        'name',
-    'stage':       'stage_id',
+    'create_date': ('t.create_date',),
+    'name':        ("COALESCE(t.name, '')",),
+    'stage':       ('COALESCE(s.sequence, 0)', 'COALESCE(s.id, 0)'),
 }
 _VALID_SORT_DIRS = ('asc', 'desc')
+# state → SQL condition.  A ticket is closed when its stage is folded.
+_VALID_STATES = {
+    'open':           'NOT COALESCE(s.fold, FALSE)',
+    'closed':         's.fold',
+    'awaiting_reply': 'NOT COALESCE(s.fold, FALSE) AND t.student_awaiting_reply',
+}
+
+
+def _ticket_query(partner, email, stage_ids, state, sort_by, sort_dir,
+                  after=None, limit=None, offset=0, count=False):
+    """
+    Run the list query for one student in SQL and return the rows:
+    ``[(id, *sort_values)]``, or ``[(count,)]`` with *count*.
+
+    *after* is ``(sort_values, id)`` of the last row already returned
+    (keyset paging).
+    """
+    Ticket = request.env['helpdesk.ticket'].sudo()
+    Ticket.flush_model()
+    request.env['helpdesk.stage'].flush_model(['sequence', 'fold'])
+
+    where = ['(t.partner_id = %s OR lower(t.partner_email) = lower(%s))']
+    args  = [partner.id, email]
+    if 'active' in Ticket._fields:
+        where.append('t.active IS NOT FALSE')
+    if stage_ids is not None:
+        where.append('t.stage_id = ANY(%s)')
+        args.append(stage_ids)
+    if state:
+        where.append(_VALID_STATES[state])
+
+    keys = _VALID_SORT_FIELDS[sort_by]
+    if count:
+        select, tail = 'COUNT(*)', ''
+    else:
+        if after:
+            values, last_id = after
+            where.append('(%s, t.id) %s (%s, %%s)' % (
+                ', '.join(keys),
+                '<' if sort_dir == 'desc' else '>',
+                ', '.join(['%s'] * len(keys)),
+            ))
+            args += list(values) + [last_id]
+        select = ', '.join(('t.id',) + keys)
+        tail = 'ORDER BY %s LIMIT %%s OFFSET %%s' % ', '.join(
+            '%s %s' % (key, sort_dir) for key in keys + ('t.id',)
+        )
+        args += [limit, offset]
+
+    request.env.cr.execute(f"""
+        SELECT {select}
+          FROM helpdesk_ticket t
+          LEFT JOIN helpdesk_stage s ON s.id = t.stage_id
+         WHERE {' AND '.join(where)}
+         {tail}
+    """, args)
+    return request.env.cr.fetchall()
 
 
 class HelpdeskStudentAPIController(Controller):
@@ -75,18 +141,28 @@ class HelpdeskStudentAPIController(Controller):
     @require_jwt
     def list_student_tickets(self, **params):
         """
-        Return ALL helpdesk tickets belonging to the student identified by
+        Return the helpdesk tickets belonging to the student identified by
         the ``email`` query parameter.
 
         The email is looked up against ``res.partner``.  Tickets are matched
         on ``partner_id`` **or** ``partner_email`` (covers agent-created tickets).
+        Filtering, sorting and paging all run in a single SQL query.
+
+        Paging
+        ------
+        Page mode (default): ``page`` / ``page_size``, with ``total_count``.
+        Cursor mode: pass ``cursor`` (empty for the first page, then the
+        ``next_cursor`` of the previous response).  Keyset paging — cost
+        does not grow with the page number and no count query is run.
 
         Query Parameters
         ----------------
         email       str   REQUIRED – student e-mail address
         page        int   optional – 1-based page number         (default: 1)
         page_size   int   optional – records per page            (default: 20, max 100)
+        cursor      str   optional – switches to cursor mode (see above)
         status      str   optional – partial case-insensitive stage name match
+        state       str   optional – open | closed | awaiting_reply
         sort_by     str   optional – create_date | name | stage  (default: create_date)
         sort_dir    str   optional – asc | desc                  (default: desc)
 
@@ -106,10 +182,13 @@ class HelpdeskStudentAPIController(Controller):
             "meta": {
                 "student_email": "john@university.com",
                 "student_name":  "John Smith",
-                "total_count":   5,
-                "page":          1,
+                "total_count":   5,              (page mode only)
+                "page":          1,              (page mode only)
                 "page_size":     20,
-                "total_pages":   1
+                "total_pages":   1,              (page mode only)
+                "has_more":      false,
+                "next_cursor":   null,
+                "summary": {"total": 5, "open": 2, "closed": 3, "awaiting_reply": 1}
             }
         }
         """
@@ -148,8 +227,11 @@ class HelpdeskStudentAPIController(Controller):
                 )
 
             status_filter = (params.get('status')   or '').strip()
+            state         = (params.get('state')    or '').strip().lower()
             sort_by       = (params.get('sort_by')   or 'create_date').strip()
             sort_dir      = (params.get('sort_dir')  or 'desc').strip().lower()
+            cursor_mode   = 'cursor' in params
+            raw_cursor    = (params.get('cursor') or '').strip()
 
             if sort_by not in _VALID_SORT_FIELDS:
                 return error_response(
@@ -161,58 +243,93 @@ class HelpdeskStudentAPIController(Controller):
                     400, 'VALIDATION_ERROR',
                     '"sort_dir" must be "asc" or "desc".',
                 )
+            if state and state not in _VALID_STATES:
+                return error_response(
+                    400, 'VALIDATION_ERROR',
+                    f'"state" must be one of: {", ".join(_VALID_STATES)}.',
+                )
 
-            # ── 4. Build ORM domain ──────────────────────────────────────
-            domain = [
-                '|',
-                ('partner_id',    '=',     partner.id),
-                ('partner_email', '=ilike', email),
-            ]
+            query_key = [sort_by, sort_dir, state, status_filter]
+            after = None
+            if raw_cursor:
+                try:
+                    cursor = decode_cursor(raw_cursor)
+                    if cursor.get('q') != query_key:
+                        raise ValueError
+                    values = list(cursor['k'])
+                    if sort_by == 'create_date':
+                        values[0] = datetime.fromisoformat(values[0])
+                    after = (values, int(cursor['id']))
+                except (ValueError, TypeError, KeyError, IndexError):
+                    return error_response(
+                        400, 'VALIDATION_ERROR',
+                        '"cursor" is invalid or was issued for other filters / sorting.',
+                    )
+
+            meta = {
+                'student_email': email,
+                'student_name':  partner.name,
+                'page_size':     page_size,
+                'summary':       request.env['helpdesk.student.ticket.summary']
+                                 .get_for_partner(partner),
+            }
 
+            # ── 4. Resolve stage-name filter ─────────────────────────────
+            stage_ids = None
             if status_filter:
-                stages = request.env['helpdesk.stage'].sudo().search(
+                stage_ids = request.env['helpdesk.stage'].sudo().search(
                     [('name', 'ilike', status_filter)]
+                ).ids
+                if not stage_ids:
+                    if not cursor_mode:
+                        meta.update(total_count=0, page=page, total_pages=0)
+                    meta.update(has_more=False, next_cursor=None)
+                    return success_response([], meta=meta)
+
+            # ── 5. Query (one SQL statement, +1 row to detect more) ──────
+            rows = _ticket_query(
+                partner, email, stage_ids, state, sort_by, sort_dir,
+                after=after,
+                limit=page_size + 1,
+                offset=0 if cursor_mode else (page - 1) * page_size,
+            )
+            has_more = len(rows) > page_size
+            rows     = rows[:page_size]
+
+            next_cursor = None
+            if has_more:
+                next_cursor = encode_cursor({
+                    'q':  query_key,
+                    'k':  [
+                        value.isoformat() if isinstance(value, datetime) else value
+                        for value in rows[-1][1:]
+                    ],
+                    'id': rows[-1][0],
+                })
+            meta.update(has_more=has_more, next_cursor=next_cursor)
+
+            if not cursor_mode:
+                total_count = _ticket_query(
+                    partner, email, stage_ids, state, sort_by, sort_dir, count=True,
+                )[0][0]
+                meta.update(
+                    total_count=total_count,
+                    page=page,
+                    total_pages=max(1, -(-total_count // page_size)),
                 )
-                if not stages:
-                    return success_response(
-                        [],
-                        meta={
-                            'student_email': email,
-                            'student_name':  partner.name,
-                            'total_count':   0,
-                            'page':          page,
-                            'page_size':     page_size,
-                            'total_pages':   0,
-                        },
-                    )
-                domain.append(('stage_id', 'in', stages.ids))
-
-            # ── 5. Query ─────────────────────────────────────────────────
-            Ticket = request.env['helpdesk.ticket'].sudo()
-            order  = f'{_VALID_SORT_FIELDS[sort_by]} {sort_dir}, id desc'
 
-            total_count = Ticket.search_count(domain)
-            total_pages = max(1, -(-total_count // page_size))
-            offset      = (page - 1) * page_size
-
-            tickets = Ticket.search(
-                domain, order=order, limit=page_size, offset=offset
+            tickets = request.env['helpdesk.ticket'].sudo().browse(
+                [row[0] for row in rows]
             )
 
             _logger.info(
-                'list_student_tickets: email=%s → %d ticket(s)', email, total_count
+                'list_student_tickets: email=%s → %d ticket(s) on this page',
+                email, len(tickets),
             )
 
             return success_response(
                 [serialize_ticket_list_item(t) for t in tickets],
-                meta={
-                    'student_email': email,
-                    'student_name':  partner.name,
-                    'total_count':   total_count,
-                    'page':          page,
-                    'page_size':     page_size,
-                    'total_pages':   total_pages,
-                },
+                meta=meta,
             )
 
         except AccessError as exc:
@@ -249,9 +366,13 @@ class HelpdeskStudentAPIController(Controller):
         --------------
         ticket_id   int   REQUIRED – internal Odoo ID
 
-        Query Parameter
-        ---------------
-        email       str   REQUIRED – student e-mail (ownership check)
+        Query Parameters
+        ----------------
+        email           str   REQUIRED – student e-mail (ownership check)
+        message_limit   int   optional – only the newest N messages
+                                         (max 200; default: whole thread)
+        before          str   optional – ``messages_older_cursor`` of the
+                                         previous response ("load older")
 
         Success Response ``200``
         ------------------------
@@ -265,7 +386,8 @@ class HelpdeskStudentAPIController(Controller):
                 "create_date": "2025-03-10T08:22:00Z",
                 "team":        "Student Support",
                 "description": "<p>…</p>",
-                "communication_history": [ … ],
+                "communication_history": [ … ],      (oldest first)
+                "messages_older_cursor": "eyJk…",    (null: no older messages)
                 "attachments": [ … ]
             }
         }
@@ -291,7 +413,29 @@ class HelpdeskStudentAPIController(Controller):
                     f'No student record found for email: {email}',
                 )
 
-            # ── 3. Fetch ticket ──────────────────────────────────────────
+            # ── 3. Parse message paging ──────────────────────────────────
+            message_limit = None
+            if params.get('message_limit') or params.get('before'):
+                try:
+                    message_limit = min(
+                        _MAX_MESSAGE_LIMIT,
+                        max(1, int(params.get('message_limit') or _DEFAULT_PAGE_SIZE)),
+                    )
+                except (ValueError, TypeError):
+                    return error_response(
+                        400, 'VALIDATION_ERROR',
+                        '"message_limit" must be a positive integer.',
+                    )
+            messages_before = None
+            if params.get('before'):
+                try:
+                    messages_before = decode_message_cursor(params['before'].strip())
+                except ValueError:
+                    return error_response(
+                        400, 'VALIDATION_ERROR', '"before" is not a valid cursor.',
+                    )
+
+            # ── 4. Fetch ticket ──────────────────────────────────────────
             ticket = request.env['helpdesk.ticket'].sudo().browse(ticket_id)
             if not ticket.exists():
                 return error_response(
@@ -299,7 +443,7 @@ class HelpdeskStudentAPIController(Controller):
                     f'Ticket {ticket_id} does not exist.',
                 )
 
-            # ── 4. Ownership check ───────────────────────────────────────
+            # ── 5. Ownership check ───────────────────────────────────────
             owned_by_partner = (ticket.partner_id.id == partner.id)
             owned_by_email   = (
                 (ticket.partner_email or '').strip().lower() == email.lower()
@@ -316,7 +460,11 @@ class HelpdeskStudentAPIController(Controller):
                 )
 
             _logger.info('get_ticket_detail: email=%s ticket=%s OK', email, ticket_id)
-            return success_response(serialize_ticket_detail(ticket))
+            return success_response(serialize_ticket_detail(
+                ticket,
+                message_limit=message_limit,
+                messages_before=messages_before,
+            ))
 
         except AccessError as exc:
             _logger.warning('Access error ticket=%s email=%s: %s',
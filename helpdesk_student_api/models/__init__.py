@@ -1,2 +1,6 @@
 # -*- coding: utf-8 -*-
 from . import token_blacklist
+from . import student_ticket_summary
+from . import helpdesk_ticket
+from . import helpdesk_stage
+from . import res_partner
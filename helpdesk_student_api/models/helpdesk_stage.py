@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+``helpdesk.stage`` extension for the student API
+================================================
+Whether a ticket counts as open or closed in
+``helpdesk.student.ticket.summary`` depends on its stage's ``fold`` flag;
+changing it recomputes the summaries of the students with tickets in the
+stage.
+"""
+
+from odoo import models
+
+
+class HelpdeskStage(models.Model):
+    _inherit = 'helpdesk.stage'
+
+    def write(self, vals):
+        if 'fold' not in vals:
+            return super().write(vals)
+        result = super().write(vals)
+        tickets = self.env['helpdesk.ticket'].sudo().with_context(active_test=False).search(
+            [('stage_id', 'in', self.ids)]
+        )
+        self.env['helpdesk.student.ticket.summary'].sudo()._refresh_existing_partners(
+            tickets._student_summary_partner_ids()
+        )
+        return result
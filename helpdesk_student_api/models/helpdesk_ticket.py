@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+``helpdesk.ticket`` extensions for the student API
+==================================================
+- ``student_awaiting_reply``: set when support staff post a public reply,
+  cleared when the student answers.  Used by the ``state=awaiting_reply``
+  list filter and the summary counters.
+- Keeps ``helpdesk.student.ticket.summary`` current: any change to a
+  ticket's owner, stage, active flag or awaiting-reply flag recomputes the
+  summary rows of the students involved (before and after the change).
+- ``init`` adds an index on ``lower(partner_email)``, the expression the
+  list endpoint and the summary use to match tickets by student e-mail,
+  and backfills ``student_awaiting_reply`` on tickets that predate it.
+"""
+
+from odoo import api, fields, models
+from odoo.tools import sql
+
+_SUMMARY_FIELDS = {'partner_id', 'partner_email', 'stage_id', 'active', 'student_awaiting_reply'}
+
+
+class HelpdeskTicket(models.Model):
+    _inherit = 'helpdesk.ticket'
+
+    student_awaiting_reply = fields.Boolean(
+        string='Awaiting student reply',
+        index=True,
+        copy=False,
+        readonly=True,
+        help='Set when support staff post a public reply, cleared when the '
+             'student answers.',
+    )
+
+    def init(self):
+        super().init()
+        sql.create_index(
+            self.env.cr,
+            'helpdesk_ticket_partner_email_lower_idx',
+            self._table,
+            ['lower(partner_email)'],
+        )
+        self._backfill_student_awaiting_reply()
+
+    def _backfill_student_awaiting_reply(self) -> None:
+        """
+        Classify tickets never seen by ``message_post`` (column still NULL)
+        with the rule it applies, on the last public message written by
+        support staff or by the student.  Runs once per ticket: afterwards
+        the column is always TRUE or FALSE.
+        """
+        cr = self.env.cr
+        cr.execute(f"""
+            UPDATE {self._table} t
+               SET student_awaiting_reply = COALESCE((
+                       SELECT EXISTS (
+                                  SELECT 1 FROM res_users u
+                                   WHERE u.partner_id = m.author_id AND NOT u.share
+                              )
+                         FROM mail_message m
+                         JOIN res_partner a ON a.id = m.author_id
+                         LEFT JOIN mail_message_subtype st ON st.id = m.subtype_id
+                        WHERE m.model = %s
+                          AND m.res_id = t.id
+                          AND m.message_type IN ('comment', 'email')
+                          AND NOT COALESCE(st.internal, FALSE)
+                          AND (
+                                EXISTS (
+                                    SELECT 1 FROM res_users u
+                                     WHERE u.partner_id = m.author_id AND NOT u.share
+                                )
+                             OR m.author_id = t.partner_id
+                             OR (btrim(COALESCE(t.partner_email, '')) != ''
+                                 AND lower(btrim(a.email)) = lower(btrim(t.partner_email)))
+                          )
+                        ORDER BY m.date DESC, m.id DESC
+                        LIMIT 1
+                   ), FALSE)
+             WHERE t.student_awaiting_reply IS NULL
+        """, (self._name,))
+        if cr.rowcount and sql.table_exists(cr, 'helpdesk_student_ticket_summary'):
+            # Counters computed before the backfill are wrong; they are
+            # recomputed on first read.
+            cr.execute('DELETE FROM helpdesk_student_ticket_summary')
+
+    # ── Summary maintenance ──────────────────────────────────────────────────
+
+    def _student_summary_partner_ids(self) -> set:
+        """Partners whose summary depends on these tickets."""
+        partner_ids = set(self.partner_id.ids)
+        emails = {t.partner_email.strip().lower() for t in self if t.partner_email}
+        if emails:
+            self.env['res.partner'].flush_model(['email'])
+            self.env.cr.execute(
+                'SELECT id FROM res_partner WHERE lower(email) = ANY(%s)',
+                (list(emails),),
+            )
+            partner_ids.update(row[0] for row in self.env.cr.fetchall())
+        return partner_ids
+
+    def _refresh_student_summaries(self, extra_partner_ids=()) -> None:
+        self.env['helpdesk.student.ticket.summary'].sudo()._refresh_partners(
+            self.sudo()._student_summary_partner_ids() | set(extra_partner_ids)
+        )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        tickets = super().create(vals_list)
+        tickets._refresh_student_summaries()
+        return tickets
+
+    def write(self, vals):
+        if not _SUMMARY_FIELDS.intersection(vals):
+            return super().write(vals)
+        before = self.sudo()._student_summary_partner_ids()
+        result = super().write(vals)
+        self._refresh_student_summaries(before)
+        return result
+
+    def unlink(self):
+        before = self.sudo()._student_summary_partner_ids()
+        result = super().unlink()
+        self.env['helpdesk.student.ticket.summary'].sudo()._refresh_partners(before)
+        return result
+
+    # ── Awaiting-reply flag ──────────────────────────────────────────────────
+
+    def message_post(self, **kwargs):
+        message = super().message_post(**kwargs)
+        if len(self) == 1 and message.message_type in ('comment', 'email'):
+            mt_note = self.env.ref('mail.mt_note', raise_if_not_found=False)
+            if not (mt_note and message.subtype_id == mt_note):
+                author = message.author_id
+                if any(not user.share for user in author.user_ids):
+                    awaiting = True
+                elif author and (
+                    author == self.partner_id
+                    or (self.partner_email and (author.email or '').strip().lower()
+                        == self.partner_email.strip().lower())
+                ):
+                    awaiting = False
+                else:
+                    awaiting = self.student_awaiting_reply
+                if awaiting != self.student_awaiting_reply:
+                    self.sudo().write({'student_awaiting_reply': awaiting})
+        return message
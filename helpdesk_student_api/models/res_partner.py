@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""
+``res.partner`` extension for the student API
+=============================================
+Tickets are matched to a student on ``partner_id`` **or** the partner's
+e-mail, so changing the e-mail recomputes the student's
+``helpdesk.student.ticket.summary`` row.
+"""
+
+from odoo import models
+
+
+class ResPartner(models.Model):
+    _inherit = 'res.partner'
+
+    def write(self, vals):
+        result = super().write(vals)
+        if 'email' in vals:
+            self.env['helpdesk.student.ticket.summary'].sudo()._refresh_existing_partners(
+                self.ids
+            )
+        return result
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+``helpdesk.student.ticket.summary``
+===================================
+One row per student partner with the counters shown in the header of the
+mobile ticket list, so the app can render it without fetching every ticket:
+
+- ``total_count``           all active tickets of the student
+- ``open_count``            tickets in a stage that is not folded
+- ``closed_count``          tickets in a folded (closed) stage
+- ``awaiting_reply_count``  open tickets whose last public message came from
+                            support staff, i.e. waiting for the student
+
+A student's tickets are matched exactly as in the list endpoint: on
+``partner_id`` **or** a case-insensitive ``partner_email`` match.
+
+Rows are kept current by ``helpdesk.ticket`` (create / write / unlink /
+message_post), by ``helpdesk.stage`` when ``fold`` changes and by
+``res.partner`` when ``email`` changes: each change recomputes the rows of
+the students it affects with one aggregate ``INSERT … ON CONFLICT``
+statement.  Rows missing for a student are computed on first read.
+"""
+
+from odoo import api, fields, models
+
+
+class HelpdeskStudentTicketSummary(models.Model):
+    _name        = 'helpdesk.student.ticket.summary'
+    _description = 'Student Ticket Summary'
+    _rec_name    = 'partner_id'
+    _log_access  = False
+
+    # ── Fields ──────────────────────────────────────────────────────────────
+
+    partner_id = fields.Many2one(
+        comodel_name='res.partner',
+        string='Student',
+        required=True,
+        ondelete='cascade',
+        readonly=True,
+    )
+    total_count          = fields.Integer(string='Tickets',        readonly=True)
+    open_count           = fields.Integer(string='Open',           readonly=True)
+    closed_count         = fields.Integer(string='Closed',         readonly=True)
+    awaiting_reply_count = fields.Integer(string='Awaiting reply', readonly=True)
+    refreshed_at         = fields.Datetime(string='Refreshed at',  readonly=True)
+
+    # ── Constraints ──────────────────────────────────────────────────────────
+
+    # ON CONFLICT (partner_id) in _refresh_partners relies on this index
+    _partner_unique = models.Constraint(
+        'UNIQUE(partner_id)',
+        'One summary per student.',
+    )
+
+    # ── Maintenance ──────────────────────────────────────────────────────────
+
+    @api.model
+    def _refresh_partners(self, partner_ids) -> None:
+        """Recompute the summary rows of *partner_ids* in one statement."""
+        partner_ids = [pid for pid in set(partner_ids or ()) if pid]
+        if not partner_ids:
+            return
+        self.env['helpdesk.ticket'].flush_model()
+        self.env['helpdesk.stage'].flush_model(['fold'])
+        self.env['res.partner'].flush_model(['email'])
+        active_clause = (
+            'AND t.active IS NOT FALSE'
+            if 'active' in self.env['helpdesk.ticket']._fields else ''
+        )
+        self.env.cr.execute(f"""
+            INSERT INTO helpdesk_student_ticket_summary (
+                partner_id, total_count, open_count, closed_count,
+                awaiting_reply_count, refreshed_at
+            )
+            SELECT p.id,
+                   COUNT(t.id),
+                   COUNT(t.id) FILTER (WHERE NOT COALESCE(s.fold, FALSE)),
+                   COUNT(t.id) FILTER (WHERE s.fold),
+                   COUNT(t.id) FILTER (WHERE NOT COALESCE(s.fold, FALSE)
+                                         AND t.student_awaiting_reply),
+                   now() AT TIME ZONE 'UTC'
+              FROM res_partner p
+              LEFT JOIN helpdesk_ticket t
+                     ON (t.partner_id = p.id
+                         OR lower(t.partner_email) = lower(p.email))
+                    {active_clause}
+              LEFT JOIN helpdesk_stage s ON s.id = t.stage_id
+             WHERE p.id = ANY(%s)
+             GROUP BY p.id
+            ON CONFLICT (partner_id) DO UPDATE SET
+                total_count          = EXCLUDED.total_count,
+                open_count           = EXCLUDED.open_count,
+                closed_count         = EXCLUDED.closed_count,
+                awaiting_reply_count = EXCLUDED.awaiting_reply_count,
+                refreshed_at         = EXCLUDED.refreshed_at
+        """, (partner_ids,))
+        self.invalidate_model()
+
+    @api.model
+    def _refresh_existing_partners(self, partner_ids) -> None:
+        """
+        Recompute the rows that already exist for *partner_ids*; used by
+        changes that also touch non-students (partner e-mails, stages).
+        Missing rows are computed on first read anyway.
+        """
+        if not partner_ids:
+            return
+        self._refresh_partners(
+            self.sudo().search([('partner_id', 'in', list(partner_ids))]).partner_id.ids
+        )
+
+    @api.model
+    def get_for_partner(self, partner) -> dict:
+        """Return the counters of *partner*, computing the row if missing."""
+        summary = self.sudo().search([('partner_id', '=', partner.id)], limit=1)
+        if not summary:
+            self.sudo()._refresh_partners([partner.id])
+            summary = self.sudo().search([('partner_id', '=', partner.id)], limit=1)
+        return {
+            'total':          summary.total_count,
+            'open':           summary.open_count,
+            'closed':         summary.closed_count,
+            'awaiting_reply': summary.awaiting_reply_count,
+        }
@@ -3,15 +3,57 @@
 ``helpdesk.api.token.blacklist``
 ================================
 Stores the JTI (JWT ID) of every token that has been explicitly revoked
-via the logout endpoint.  The ``require_jwt`` decorator checks this table
-on every request so revoked tokens are rejected even before their ``exp``
-claim would expire.
+via the logout endpoint.  ``require_jwt`` rejects revoked tokens even before
+their ``exp`` claim would expire, through a per-process copy of this table
+(``utils.token_cache.revocation_filter``) that ``revoke`` updates and that
+is resynced from the table every few seconds.
 
-A scheduled action (cron) provided in ``jwt_config_data.xml`` purges
-entries whose ``expires_at`` has passed to keep the table lean.
+Storage
+-------
+Every row carries an ``expiry_bucket``: the hour (since the epoch) in which
+the token expires.  The table only ever needs two access paths:
+
+- lookup by ``jti``   — served by the ``UNIQUE(jti)`` index alone; with the
+  aggressive autovacuum settings set in ``init`` the visibility map stays
+  current under insert/delete churn, so the lookup is an index-only scan
+  whose cost does not depend on the table size;
+- purge by bucket     — every bucket older than the current hour is expired
+  as a whole and its rows are deleted through the ``expiry_bucket`` index
+  in bounded batches, each committed on its own, so a purge never holds a
+  long transaction or loads the rows into the ORM.  Only the current bucket
+  needs a per-row ``expires_at`` check.
+
+Buckets are a column, not PostgreSQL partitions: the table is created and
+altered by the ORM (primary key on ``id`` alone, ``UNIQUE(jti)``), and a
+table partitioned by expiry could enforce neither.  A purge therefore
+deletes rows — it does not drop partitions — and autovacuum reclaims the
+space; the batch size bounds the work per transaction.
+
+A scheduled action (cron) provided in ``jwt_config_data.xml`` runs
+``purge_expired`` and logs the blacklist size (``blacklist_stats``).
 """
 
+import logging
+from datetime import datetime, timezone
+
 from odoo import api, fields, models
+from odoo.tools import sql
+
+from ..utils.token_cache import revocation_filter
+
+_logger = logging.getLogger(__name__)
+
+BUCKET_SECONDS = 3600
+PURGE_BATCH    = 10000
+
+
+def expiry_bucket(expires_at) -> int:
+    """Bucket number of a token expiring at *expires_at* (datetime or epoch)."""
+    if isinstance(expires_at, datetime):
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        expires_at = expires_at.timestamp()
+    return int(expires_at // BUCKET_SECONDS)
 
 
 class HelpdeskApiTokenBlacklist(models.Model):
@@ -25,8 +67,8 @@ class HelpdeskApiTokenBlacklist(models.Model):
     jti = fields.Char(
         string='JWT ID (jti)',
         required=True,
-        index=True,
-        help='Unique identifier extracted from the JWT payload.',
+        help='Unique identifier extracted from the JWT payload. '
+             'Looked up through the UNIQUE(jti) index.',
     )
     uid = fields.Many2one(
         comodel_name='res.users',
@@ -48,45 +90,161 @@ class HelpdeskApiTokenBlacklist(models.Model):
         string='Revocation reason',
         default='logout',
     )
+    expiry_bucket = fields.Integer(
+        string='Expiry bucket',
+        index=True,
+        readonly=True,
+        help='Hour since the epoch in which the token expires; purges '
+             'delete whole buckets.',
+    )
 
     # ── Constraints ──────────────────────────────────────────────────────────
 
-    _sql_constraints = [
-        ('jti_unique', 'UNIQUE(jti)', 'Each JWT ID must appear only once in the blacklist.'),
-    ]
+    # Also the index every jti lookup uses
+    _jti_unique = models.Constraint(
+        'UNIQUE(jti)',
+        'Each JWT ID must appear only once in the blacklist.',
+    )
+    # Incremental resync of the per-process revocation filters
+    _create_date_idx = models.Index('(create_date)')
+
+    def init(self):
+        super().init()
+        cr = self.env.cr
+        # Tables created while the constraint was declared through
+        # _sql_constraints (ignored by Odoo 19) may hold duplicate JTIs,
+        # which makes the ORM fail to add it: dedupe and add it here.
+        constraint = f'{self._table}_jti_unique'
+        if not sql.constraint_definition(cr, self._table, constraint):
+            cr.execute(f"""
+                DELETE FROM {self._table} dup
+                 USING {self._table} keep
+                 WHERE dup.jti = keep.jti AND dup.id > keep.id
+            """)
+            sql.add_constraint(cr, self._table, constraint, 'UNIQUE(jti)')
+        # Rows written before expiry_bucket existed
+        cr.execute(f"""
+            UPDATE {self._table}
+               SET expiry_bucket = floor(
+                       extract(epoch FROM expires_at) / {BUCKET_SECONDS}
+                   )::int
+             WHERE expiry_bucket IS NULL
+        """)
+        # Keep the visibility map current so jti lookups stay index-only
+        cr.execute(f"""
+            ALTER TABLE {self._table} SET (
+                autovacuum_vacuum_scale_factor  = 0.02,
+                autovacuum_analyze_scale_factor = 0.02
+            )
+        """)
 
     # ── Class-level helpers (called from jwt_utils) ───────────────────────
 
     @api.model
     def is_blacklisted(self, jti: str) -> bool:
         """Return ``True`` when *jti* is present in the blacklist."""
-        return bool(
-            self.sudo().search_count([('jti', '=', jti)], limit=1)
+        self.flush_model(['jti'])
+        self.env.cr.execute(
+            f'SELECT 1 FROM {self._table} WHERE jti = %s', (jti,),
         )
+        return bool(self.env.cr.fetchone())
 
     @api.model
     def revoke(self, jti: str, uid: int, token_type: str,
                expires_at, reason: str = 'logout') -> None:
         """Insert *jti* into the blacklist (idempotent)."""
-        if not self.sudo().search([('jti', '=', jti)], limit=1):
+        if isinstance(expires_at, datetime) and expires_at.tzinfo is not None:
+            expires_at = expires_at.astimezone(timezone.utc).replace(tzinfo=None)
+        if not self.is_blacklisted(jti):
             self.sudo().create({
-                'jti':        jti,
-                'uid':        uid,
-                'token_type': token_type,
-                'expires_at': expires_at,
-                'reason':     reason,
+                'jti':           jti,
+                'uid':           uid,
+                'token_type':    token_type,
+                'expires_at':    expires_at,
+                'reason':        reason,
+                'expiry_bucket': expiry_bucket(expires_at),
             })
+        dbname = self.env.cr.dbname
+        self.env.cr.postcommit.add(
+            lambda: revocation_filter.add(dbname, jti, expires_at)
+        )
 
     @api.model
-    def purge_expired(self) -> int:
+    def purge_expired(self, batch_size: int = PURGE_BATCH, commit: bool = True) -> int:
         """
-        Delete all blacklist entries whose token has already expired.
-        Called by the scheduled cron action.
+        Delete all blacklist entries whose token has already expired:
+        batched row DELETEs by expiry bucket (see the module docstring; no
+        partition is dropped).  Called by the scheduled cron action; commits
+        after every batch unless *commit* is false.
         Returns the number of records deleted.
         """
-        expired = self.sudo().search(
-            [('expires_at', '<', fields.Datetime.now())]
+        self.flush_model()
+        cr      = self.env.cr
+        now     = fields.Datetime.now()
+        current = expiry_bucket(now)
+        count   = 0
+
+        # 1. Whole buckets before the current hour: no per-row check
+        while True:
+            cr.execute(f"""
+                DELETE FROM {self._table}
+                 WHERE id IN (
+                        SELECT id FROM {self._table}
+                         WHERE expiry_bucket < %s
+                         LIMIT %s
+                       )
+            """, (current, batch_size))
+            deleted = cr.rowcount
+            count  += deleted
+            if commit:
+                cr.commit()
+            if deleted < batch_size:
+                break
+
+        # 2. The current bucket: only the rows already past expires_at
+        cr.execute(f"""
+            DELETE FROM {self._table}
+             WHERE expiry_bucket = %s AND expires_at < %s
+        """, (current, now))
+        count += cr.rowcount
+        if commit:
+            cr.commit()
+        self.invalidate_model()
+
+        stats = self.blacklist_stats()
+        _logger.info(
+            'Token blacklist: purged %s expired row(s); %s row(s) in %s '
+            'bucket(s), %s JTI(s) in this worker\'s revocation filter.',
+            count, stats['rows'], stats['buckets'], stats['filter_jtis'],
         )
-        count = len(expired)
-        expired.unlink()
         return count
+
+    @api.model
+    def blacklist_stats(self) -> dict:
+        """
+        Size metrics of the blacklist:
+
+        ``rows``         rows in the table
+        ``expired``      rows already expired, waiting for the next purge
+        ``buckets``      distinct expiry buckets
+        ``oldest_bucket`` / ``newest_bucket``  bucket range (``None`` if empty)
+        ``filter_jtis``  JTIs held by this worker's revocation filter
+        """
+        self.flush_model()
+        self.env.cr.execute(f"""
+            SELECT COUNT(*),
+                   COUNT(*) FILTER (WHERE expires_at < %s),
+                   COUNT(DISTINCT expiry_bucket),
+                   MIN(expiry_bucket),
+                   MAX(expiry_bucket)
+              FROM {self._table}
+        """, (fields.Datetime.now(),))
+        rows, expired, buckets, oldest, newest = self.env.cr.fetchone()
+        return {
+            'rows':          rows,
+            'expired':       expired,
+            'buckets':       buckets,
+            'oldest_bucket': oldest,
+            'newest_bucket': newest,
+            'filter_jtis':   revocation_filter.size(self.env.cr.dbname),
+        }
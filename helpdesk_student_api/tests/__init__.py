@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+from . import test_ticket_list
+from . import test_ticket_messages
+from . import test_revocation_filter
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+from contextlib import nullcontext
+from datetime import timedelta
+from types import SimpleNamespace
+
+from odoo import fields
+from odoo.tests.common import TransactionCase, tagged
+
+from ..models.token_blacklist import expiry_bucket
+from ..utils.token_cache import RevocationFilter
+
+
+@tagged('post_install', '-at_install', 'helpdesk_student_api')
+class TestRevocationFilter(TransactionCase):
+
+    def setUp(self):
+        super().setUp()
+        self.filter = RevocationFilter()
+        self.dbname = self.env.cr.dbname
+        self.env['ir.config_parameter'].sudo().set_param(
+            'helpdesk_api.revocation_sync_seconds', 0,
+        )
+
+    def _revoke(self, jti, minutes=30):
+        expires_at = fields.Datetime.now() + timedelta(minutes=minutes)
+        self.env['helpdesk.api.token.blacklist'].create({
+            'jti': jti, 'expires_at': expires_at, 'expiry_bucket': expiry_bucket(expires_at),
+        })
+        self.env.flush_all()
+
+    def test_first_use_loads_the_table(self):
+        self._revoke('filter-a')
+        self._revoke('filter-expired', minutes=-5)
+        self.assertTrue(self.filter.is_revoked(self.env, 'filter-a'))
+        self.assertFalse(self.filter.is_revoked(self.env, 'filter-expired'))
+        self.assertFalse(self.filter.is_revoked(self.env, 'filter-unknown'))
+
+    def test_incremental_sync_picks_up_new_rows(self):
+        self.assertFalse(self.filter.is_revoked(self.env, 'filter-b'))
+        self._revoke('filter-b')
+        self.assertTrue(self.filter.is_revoked(self.env, 'filter-b'))
+
+    def test_sync_in_progress_does_not_block(self):
+        self.filter.is_revoked(self.env, 'filter-c')
+        self._revoke('filter-c')
+        state = self.filter._state(self.dbname)
+        with state.sync_lock:
+            # Another thread is syncing: answer from the current set
+            self.assertFalse(self.filter.is_revoked(self.env, 'filter-c'))
+        self.assertTrue(self.filter.is_revoked(self.env, 'filter-c'))
+
+    def test_full_reload_drops_deleted_rows_and_keeps_fresh_ones(self):
+        self._revoke('filter-deleted')
+        self.filter.is_revoked(self.env, 'filter-deleted')
+        state = self.filter._state(self.dbname)
+        state.reloaded_at = float('-inf')
+        # The hooks left on the test cursor must not reload for real
+        self.filter._reload = lambda registry, dbname: None
+        self.filter.sync(self.env)
+        self.assertEqual(state.fresh, {})       # reload scheduled, not run
+
+        self.filter.add(self.dbname, 'filter-fresh', fields.Datetime.now() + timedelta(hours=1))
+        self.env.cr.execute(
+            "DELETE FROM helpdesk_api_token_blacklist WHERE jti = 'filter-deleted'",
+        )
+        registry = SimpleNamespace(cursor=lambda: nullcontext(self.env.cr))
+        RevocationFilter._reload(self.filter, registry, self.dbname)
+
+        self.assertIsNone(state.fresh)
+        self.assertFalse(self.filter.is_revoked(self.env, 'filter-deleted'))
+        self.assertTrue(self.filter.is_revoked(self.env, 'filter-fresh'))
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from odoo.tests.common import TransactionCase, tagged
+
+from ..controllers import helpdesk_api
+from ..controllers.helpdesk_api import _ticket_query
+from ..utils.api_helpers import decode_cursor, encode_cursor
+
+
+@tagged('post_install', '-at_install', 'helpdesk_student_api')
+class TestTicketCursor(TransactionCase):
+
+    def test_round_trip(self):
+        values = {'q': 'abc', 'k': ['2024-01-31T12:00:00.123456', 3], 'id': 7}
+        self.assertEqual(decode_cursor(encode_cursor(values)), values)
+
+    def test_cursor_is_url_safe(self):
+        cursor = encode_cursor({'k': ['?' * 50], 'id': 1})
+        self.assertNotRegex(cursor, r'[+/=]')
+
+    def test_malformed(self):
+        for cursor in ('%%%', 'bm90IGpzb24', encode_cursor([1, 2])):
+            with self.assertRaises(ValueError, msg=cursor):
+                decode_cursor(cursor)
+
+
+@tagged('post_install', '-at_install', 'helpdesk_student_api')
+class TestTicketQuery(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        Stage = cls.env['helpdesk.stage']
+        cls.stage_new = Stage.create({'name': 'Query New', 'sequence': 1})
+        cls.stage_done = Stage.create({'name': 'Query Done', 'sequence': 9, 'fold': True})
+        cls.student = cls.env['res.partner'].create({
+            'name': 'Query Student', 'email': 'Query.Student@example.com',
+        })
+        other = cls.env['res.partner'].create({'name': 'Other', 'email': 'other@example.com'})
+
+        Ticket = cls.env['helpdesk.ticket']
+        names = ['b', 'a', 'b', 'c', 'a']
+        cls.tickets = Ticket.create([
+            {'name': name, 'partner_id': cls.student.id,
+             'stage_id': (cls.stage_done if n % 2 else cls.stage_new).id}
+            for n, name in enumerate(names)
+        ])
+        # Matched on the e-mail only, whatever its case
+        cls.tickets |= Ticket.create({
+            'name': 'a', 'partner_email': 'query.student@EXAMPLE.com',
+            'stage_id': cls.stage_new.id,
+        })
+        Ticket.create({'name': 'a', 'partner_id': other.id})
+
+        # Ties on the sort keys, ids not in key order
+        stamps = ['2024-01-01 10:00:00.5', '2024-01-01 10:00:00.5', '2024-01-01 09:00:00',
+                  '2024-01-01 11:00:00', '2024-01-01 10:00:00.5', '2024-01-01 08:00:00']
+        cls.env.flush_all()
+        for ticket, stamp in zip(cls.tickets, stamps):
+            cls.env.cr.execute(
+                'UPDATE helpdesk_ticket SET create_date = %s WHERE id = %s', (stamp, ticket.id),
+            )
+        Ticket.invalidate_model(['create_date'])
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch.object(helpdesk_api, 'request', SimpleNamespace(env=self.env))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _query(self, sort_by='create_date', sort_dir='desc', **kwargs):
+        return _ticket_query(self.student, self.student.email, None, None,
+                             sort_by, sort_dir, **kwargs)
+
+    def _walk(self, sort_by, sort_dir, page_size=2):
+        ids, after = [], None
+        for _page in range(len(self.tickets) + 1):
+            rows = self._query(sort_by, sort_dir, after=after, limit=page_size)
+            if not rows:
+                break
+            ids += [row[0] for row in rows]
+            after = (rows[-1][1:], rows[-1][0])
+        return ids
+
+    def test_matches_partner_and_email(self):
+        rows = self._query(limit=None)
+        self.assertEqual(sorted(row[0] for row in rows), sorted(self.tickets.ids))
+        self.assertEqual(self._query(count=True), [(len(self.tickets),)])
+
+    def test_keyset_pages_follow_the_full_order(self):
+        for sort_by in ('create_date', 'name', 'stage'):
+            for sort_dir in ('asc', 'desc'):
+                full = [row[0] for row in self._query(sort_by, sort_dir, limit=None)]
+                self.assertEqual(self._walk(sort_by, sort_dir), full, (sort_by, sort_dir))
+
+    def test_sort_order_with_id_tie_breaker(self):
+        rows = self._query('name', 'asc', limit=None)
+        expected = sorted(self.tickets, key=lambda t: (t.name, t.id))
+        self.assertEqual([row[0] for row in rows], [t.id for t in expected])
+
+    def test_offset_paging(self):
+        full = [row[0] for row in self._query(limit=None)]
+        page = [row[0] for row in self._query(limit=2, offset=2)]
+        self.assertEqual(page, full[2:4])
+
+    def test_state_filter(self):
+        closed = _ticket_query(self.student, self.student.email, None, 'closed',
+                               'create_date', 'desc', limit=None)
+        self.assertEqual(
+            sorted(row[0] for row in closed),
+            sorted(self.tickets.filtered(lambda t: t.stage_id == self.stage_done).ids),
+        )
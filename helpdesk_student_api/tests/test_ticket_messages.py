@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from odoo.tests.common import TransactionCase, tagged
+
+from ..utils import api_helpers
+from ..utils.api_helpers import decode_message_cursor, fetch_messages
+
+
+@tagged('post_install', '-at_install', 'helpdesk_student_api')
+class TestFetchMessages(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.ticket = cls.env['helpdesk.ticket'].with_context(tracking_disable=True).create({
+            'name': 'Messages',
+        })
+        cls.author = cls.env['res.partner'].create({'name': 'Message Author'})
+        comment = cls.env.ref('mail.mt_comment')
+        note = cls.env.ref('mail.mt_note')
+        start = datetime(2024, 1, 1, 9, 0, 0)
+
+        def message(minutes, body='<p>Hi</p>', **vals):
+            return cls.env['mail.message'].create(dict({
+                'model':        'helpdesk.ticket',
+                'res_id':       cls.ticket.id,
+                'message_type': 'comment',
+                'subtype_id':   comment.id,
+                'body':         body,
+                'author_id':    cls.author.id,
+                'date':         start + timedelta(minutes=minutes),
+            }, **vals))
+
+        cls.visible = (
+            message(0)
+            | message(1, message_type='email')
+            # Same date as the next one: paging must use the id tie-breaker
+            | message(2)
+            | message(2)
+            | message(3)
+        )
+        cls.hidden = (
+            message(4, subtype_id=note.id)                  # internal subtype
+            | message(5, is_internal=True)                  # internal message
+            | message(6, body='')                           # nothing to show
+            | message(7, body='   ')
+            | message(8, message_type='notification')
+        )
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch.object(api_helpers, 'request', SimpleNamespace(env=self.env))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _expected(self):
+        return self.visible.sorted(lambda m: (m.date, m.id)).ids
+
+    def test_internal_and_empty_messages_are_excluded(self):
+        messages, cursor = fetch_messages(self.ticket)
+        self.assertEqual([m['id'] for m in messages], self._expected())
+        self.assertIsNone(cursor)
+        self.assertEqual(messages[0]['author'], 'Message Author')
+        self.assertEqual(messages[0]['attachments'], [])
+
+    def test_pages_walk_back_without_gaps_or_repeats(self):
+        pages, before = [], None
+        for _page in range(len(self.visible) + 1):
+            messages, cursor = fetch_messages(self.ticket, limit=2, before=before)
+            pages.insert(0, [m['id'] for m in messages])
+            if not cursor:
+                break
+            before = decode_message_cursor(cursor)
+        self.assertEqual([i for page in pages for i in page], self._expected())
+        self.assertEqual([len(page) for page in pages], [1, 2, 2])
+
+    def test_attachments_are_loaded(self):
+        message = self.visible[0]
+        attachment = self.env['ir.attachment'].create({
+            'name': 'notes.txt', 'raw': b'x', 'mimetype': 'text/plain',
+            'res_model': 'helpdesk.ticket', 'res_id': self.ticket.id,
+        })
+        message.attachment_ids = attachment
+        messages, _cursor = fetch_messages(self.ticket)
+        by_id = {m['id']: m for m in messages}
+        self.assertEqual([a['id'] for a in by_id[message.id]['attachments']], attachment.ids)
+
+    def test_malformed_message_cursor(self):
+        for cursor in ('garbage', api_helpers.encode_cursor({'d': 'x', 'id': 1}),
+                       api_helpers.encode_cursor({'id': 1})):
+            with self.assertRaises(ValueError, msg=cursor):
+                decode_message_cursor(cursor)
@@ -1,3 +1,4 @@
 # -*- coding: utf-8 -*-
+from . import token_cache
 from . import jwt_utils
 from . import api_helpers
@@ -7,11 +7,16 @@ Responsibilities
 - ``require_jwt``   decorator  – validates Bearer JWT on every protected route
 - Partner resolution from student e-mail
 - Uniform JSON response builders  (success / error)
+- Opaque paging cursors           (encode / decode)
 - Ticket serialisers              (list item vs. full detail)
+- Message query layer             (SQL-side filtering, "load older" paging)
 """
 
+import base64
+import binascii
 import json
 import logging
+from datetime import datetime
 from functools import wraps
 
 from odoo.http import request, Response
@@ -47,6 +52,28 @@ def error_response(http_status: int, code: str, message: str) -> Response:
     )
 
 
+# ---------------------------------------------------------------------------
+# Paging cursors
+# ---------------------------------------------------------------------------
+
+def encode_cursor(values: dict) -> str:
+    """Pack *values* into an opaque, URL-safe cursor string."""
+    raw = json.dumps(values, separators=(',', ':'), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Inverse of :func:`encode_cursor`.  Raises ``ValueError`` if malformed."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError, binascii.Error):
+        raise ValueError('Invalid cursor.')
+    if not isinstance(values, dict):
+        raise ValueError('Invalid cursor.')
+    return values
+
+
 # ---------------------------------------------------------------------------
 # JWT authentication decorator
 # ---------------------------------------------------------------------------
@@ -163,8 +190,18 @@ def serialize_ticket_list_item(ticket) -> dict:
     }
 
 
-def serialize_ticket_detail(ticket) -> dict:
-    """Full payload — detail endpoint."""
+def serialize_ticket_detail(ticket, *, message_limit: int = None,
+                            messages_before: tuple = None) -> dict:
+    """
+    Full payload — detail endpoint.
+
+    With *message_limit* only the newest messages (older than
+    *messages_before*, a decoded ``messages_older_cursor``) are included;
+    ``messages_older_cursor`` then points at the next older page.
+    """
+    messages, older_cursor = fetch_messages(
+        ticket, limit=message_limit, before=messages_before,
+    )
     return {
         'id':                    ticket.id,
         'ticket_ref':            ticket.ticket_ref or f'HD{ticket.id:05d}',
@@ -173,50 +210,127 @@ def serialize_ticket_detail(ticket) -> dict:
         'create_date':           _fmt_dt(ticket.create_date),
         'team':                  ticket.team_id.name  if ticket.team_id  else None,
         'description':           ticket.description or '',
-        'communication_history': _get_messages(ticket),
+        'communication_history': messages,
+        'messages_older_cursor': older_cursor,
         'attachments':           _get_attachments(ticket),
     }
 
 
 # ---------------------------------------------------------------------------
-# Internal serialisation helpers
+# Message query layer
 # ---------------------------------------------------------------------------
 
-def _get_messages(ticket) -> list[dict]:
+_VISIBLE_MESSAGE_TYPES = ['comment', 'email', 'email_outgoing']
+
+
+def decode_message_cursor(cursor: str) -> tuple:
     """
-    Human-written chatter messages, oldest first.
-    Excludes automated log-notes, stage-change notifications, empty bodies.
+    Decode a ``messages_older_cursor`` into ``(date, id)`` for
+    :func:`fetch_messages`.  Raises ``ValueError`` if malformed.
     """
-    messages = ticket.message_ids.filtered(
-        lambda m: (
-            m.message_type in ('comment', 'email', 'email_outgoing')
-            and bool((m.body or '').strip())
-        )
-    ).sorted('date')
-
-    result = []
-    for msg in messages:
-        result.append({
-            'id':           msg.id,
-            'date':         _fmt_dt(msg.date),
-            'author':       msg.author_id.name if msg.author_id else 'Unknown',
-            'author_id':    msg.author_id.id   if msg.author_id else None,
-            'message_type': msg.message_type,
-            'body':         msg.body,
-            'attachments': [
-                {
-                    'id':       att.id,
-                    'name':     att.name,
-                    'mimetype': att.mimetype,
-                    'url':      f'/web/content/{att.id}?download=true',
-                }
-                for att in msg.attachment_ids
-            ],
+    values = decode_cursor(cursor)
+    try:
+        return datetime.fromisoformat(values['d']), int(values['id'])
+    except (KeyError, TypeError):
+        raise ValueError('Invalid cursor.')
+
+
+def fetch_messages(ticket, *, limit: int = None, before: tuple = None):
+    """
+    Student-visible chatter messages of *ticket*, oldest first, and the
+    cursor of the next older page (``None`` when there is none).
+
+    Visibility and paging are decided in SQL: only comments and e-mails
+    with a non-empty body, excluding internal notes (internal message or
+    internal subtype).  With *limit*, the newest *limit* messages older
+    than *before* — ``(date, id)`` — are returned.  Authors and
+    attachments are loaded with one query each for the whole page.
+    """
+    env = request.env
+    env['mail.message'].flush_model()
+    env['mail.message.subtype'].flush_model(['internal'])
+
+    where = [
+        'm.model = %s',
+        'm.res_id = %s',
+        'm.message_type = ANY(%s)',
+        "btrim(COALESCE(m.body, '')) != ''",
+        'NOT COALESCE(m.is_internal, FALSE)',
+        'NOT COALESCE(st.internal, FALSE)',
+    ]
+    args = [ticket._name, ticket.id, _VISIBLE_MESSAGE_TYPES]
+    if before:
+        where.append('(m.date, m.id) < (%s, %s)')
+        args += list(before)
+    args.append(limit + 1 if limit else None)
+
+    env.cr.execute(f"""
+        SELECT m.id, m.date, m.author_id, m.message_type, m.body
+          FROM mail_message m
+          LEFT JOIN mail_message_subtype st ON st.id = m.subtype_id
+         WHERE {' AND '.join(where)}
+         ORDER BY m.date DESC, m.id DESC
+         LIMIT %s
+    """, args)
+    rows = env.cr.fetchall()
+
+    older_cursor = None
+    if limit and len(rows) > limit:
+        rows = rows[:limit]
+        older_cursor = encode_cursor({
+            'd':  rows[-1][1].isoformat(),
+            'id': rows[-1][0],
         })
+    rows.reverse()
 
+    authors = env['res.partner'].sudo().browse(
+        {row[2] for row in rows if row[2]}
+    )
+    author_names = {partner.id: partner.name for partner in authors}
+    attachments  = _message_attachments([row[0] for row in rows])
+
+    return [
+        {
+            'id':           msg_id,
+            'date':         _fmt_dt(date),
+            'author':       author_names.get(author_id, 'Unknown'),
+            'author_id':    author_id or None,
+            'message_type': message_type,
+            'body':         body,
+            'attachments':  attachments.get(msg_id, []),
+        }
+        for msg_id, date, author_id, message_type, body in rows
+    ], older_cursor
+
+
+def _message_attachments(message_ids: list) -> dict:
+    """``{message_id: [attachment dict, …]}`` for *message_ids*, one query."""
+    if not message_ids:
+        return {}
+    env = request.env
+    env['ir.attachment'].flush_model(['name', 'mimetype'])
+    env.cr.execute("""
+        SELECT rel.message_id, att.id, att.name, att.mimetype
+          FROM message_attachment_rel rel
+          JOIN ir_attachment att ON att.id = rel.attachment_id
+         WHERE rel.message_id = ANY(%s)
+         ORDER BY rel.message_id, att.id DESC
+    """, (message_ids,))
+    result = {}
+    for message_id, att_id, name, mimetype in env.cr.fetchall():
+        result.setdefault(message_id, []).append({
+            'id':       att_id,
+            'name':     name,
+            'mimetype': mimetype,
+            'url':      f'/web/content/{att_id}?download=true',
+        })
     return result
 
 
+# ---------------------------------------------------------------------------
+# Internal serialisation helpers
+# ---------------------------------------------------------------------------
+
 def _get_attachments(ticket) -> list[dict]:
     """All ``ir.attachment`` records linked directly to this ticket."""
     attachments = (
@@ -7,6 +7,7 @@ Responsibilities
 - Secret key:  auto-generated once, persisted in ``ir.config_parameter``
 - Token generation:  ``generate_tokens(uid, env)`` → (access_token, refresh_token)
 - Token validation: ``decode_token(raw, env)`` → payload dict or raises
+  (verified tokens and revocations are cached per process, see token_cache)
 - Helpers:  ``datetime`` ↔ epoch conversion
 
 Requires
@@ -37,6 +38,8 @@ from datetime import datetime, timezone, timedelta
 from odoo.exceptions import ValidationError
 from odoo.http import request
 
+from .token_cache import revocation_filter, token_digest, verified_tokens
+
 _logger = logging.getLogger(__name__)
 
 # ── System-parameter keys ────────────────────────────────────────────────────
@@ -95,6 +98,9 @@ def rotate_secret(env) -> str:
     IrParam = env['ir.config_parameter'].sudo()
     new_secret = secrets.token_urlsafe(64)
     IrParam.set_param(_PARAM_SECRET, new_secret)
+    # Other workers drop their entries on the next lookup: the cached
+    # secret no longer matches.
+    verified_tokens.clear()
     _logger.warning('JWT: secret key rotated — all existing tokens are now invalid.')
     return new_secret
 
@@ -193,25 +199,36 @@ def decode_token(raw_token: str, env, *, expected_type: str = 'access') -> dict:
     1. Structural / cryptographic validity  (PyJWT)
     2. Expiry  (``exp`` claim)
     3. ``type`` claim matches *expected_type*
-    4. JTI is not in the blacklist table
+    4. JTI is not revoked
+
+    Steps 1–2 are skipped for a token already verified by this process
+    (same secret, not yet expired).  Step 4 uses the in-memory revocation
+    filter for access tokens; refresh tokens, used once per rotation, are
+    still checked against the blacklist table so a replayed refresh token
+    is caught even before the filter resyncs.
 
     Returns the decoded payload dict on success.
     Raises :class:`JWTError` on any failure.
     """
-    jwt    = _jwt()
-    secret = _get_secret(env)
-
-    try:
-        payload = jwt.decode(
-            raw_token,
-            secret,
-            algorithms=['HS256'],
-            options={'require': ['exp', 'iat', 'jti', 'uid', 'type']},
-        )
-    except jwt.ExpiredSignatureError:
-        raise JWTError('TOKEN_EXPIRED', 'Token has expired. Please log in again.')
-    except jwt.InvalidTokenError as exc:
-        raise JWTError('INVALID_TOKEN', f'Token is invalid: {exc}')
+    secret  = _get_secret(env)      # ormcached parameter, no query
+    dbname  = env.cr.dbname
+    digest  = token_digest(raw_token)
+    payload = verified_tokens.get(dbname, digest, secret)
+
+    if payload is None:
+        jwt = _jwt()
+        try:
+            payload = jwt.decode(
+                raw_token,
+                secret,
+                algorithms=['HS256'],
+                options={'require': ['exp', 'iat', 'jti', 'uid', 'type']},
+            )
+        except jwt.ExpiredSignatureError:
+            raise JWTError('TOKEN_EXPIRED', 'Token has expired. Please log in again.')
+        except jwt.InvalidTokenError as exc:
+            raise JWTError('INVALID_TOKEN', f'Token is invalid: {exc}')
+        verified_tokens.put(dbname, digest, secret, payload)
 
     # ── type check ────────────────────────────────────────────────────────
     if payload.get('type') != expected_type:
@@ -222,10 +239,15 @@ def decode_token(raw_token: str, env, *, expected_type: str = 'access') -> dict:
 
     # ── blacklist check ───────────────────────────────────────────────────
     jti = payload.get('jti', '')
-    if env['helpdesk.api.token.blacklist'].sudo().is_blacklisted(jti):
+    if expected_type == 'access':
+        revoked = revocation_filter.is_revoked(env, jti)
+    else:
+        revoked = env['helpdesk.api.token.blacklist'].sudo().is_blacklisted(jti)
+    if revoked:
         raise JWTError('TOKEN_REVOKED', 'Token has been revoked. Please log in again.')
 
-    return payload
+    # Callers get their own copy; the cached payload must stay untouched
+    return dict(payload)
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+Per-process caches for JWT validation.
+
+``verified_tokens``  —  ``VerifiedTokenCache``
+    Payloads of tokens whose signature has already been checked, keyed by
+    ``(db, sha256(token))`` and kept until the token's own ``exp``.  Each
+    entry remembers the secret it was verified with, so a rotated secret
+    (``rotate_secret``) invalidates every entry at once.  A hit skips the
+    HMAC check and the JSON decoding.
+
+``revocation_filter``  —  ``RevocationFilter``
+    The set of revoked, not yet expired JTIs of each database, held in
+    memory so validating an access token needs no blacklist query.
+
+    - ``token.blacklist.revoke`` adds the JTI locally once the transaction
+      commits.
+    - Revocations made by other workers are picked up by an incremental
+      resync (rows created since the previous sync, with a safety overlap
+      for slow transactions, through the ``create_date`` index) at most
+      every ``helpdesk_api.revocation_sync_seconds`` (default 5).  That is
+      the longest a token revoked elsewhere can still be accepted here.
+      One thread resyncs while the others keep answering from the current
+      set; only the first load of a process makes callers wait.
+    - A full reload every ``FULL_RELOAD_SECONDS`` drops rows deleted by
+      hand.  It runs on its own cursor once the request that found it due
+      has ended, never inside ``require_jwt``; JTIs seen meanwhile are kept.
+      Expired JTIs are pruned on every sync.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+_logger = logging.getLogger(__name__)
+
+_PARAM_SYNC_SECONDS = 'helpdesk_api.revocation_sync_seconds'
+_DEFAULT_SYNC_SECONDS = 5
+FULL_RELOAD_SECONDS = 600
+SYNC_OVERLAP = timedelta(minutes=2)
+
+
+def token_digest(raw_token: str) -> str:
+    return hashlib.sha256(raw_token.encode()).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Verified token cache
+# ---------------------------------------------------------------------------
+
+class VerifiedTokenCache:
+
+    def __init__(self, max_size=50000):
+        self.max_size = max_size
+        self._entries = OrderedDict()      # (db, digest) → (secret, payload)
+        self._lock    = threading.Lock()
+
+    def get(self, dbname: str, digest: str, secret: str):
+        """Return the cached payload, or ``None`` on miss / expiry / new secret."""
+        key = (dbname, digest)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != secret or entry[1]['exp'] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, dbname: str, digest: str, secret: str, payload: dict) -> None:
+        with self._lock:
+            self._entries[(dbname, digest)] = (secret, payload)
+            self._entries.move_to_end((dbname, digest))
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# ---------------------------------------------------------------------------
+# Revocation filter
+# ---------------------------------------------------------------------------
+
+class _DbRevocations:
+    __slots__ = ('jtis', 'fresh', 'synced_at', 'synced_db_time', 'reloaded_at', 'sync_lock')
+
+    def __init__(self):
+        self.jtis           = {}        # jti → exp (epoch)
+        self.fresh          = None      # jti → exp seen while a full reload runs
+        self.synced_at      = 0.0       # monotonic
+        self.synced_db_time = None      # DB clock at the previous sync
+        self.reloaded_at    = 0.0       # monotonic
+        self.sync_lock      = threading.Lock()   # held by the thread syncing
+
+
+class RevocationFilter:
+
+    def __init__(self):
+        self._dbs  = {}
+        self._lock = threading.Lock()
+
+    def _state(self, dbname: str) -> _DbRevocations:
+        state = self._dbs.get(dbname)
+        if state is None:
+            with self._lock:
+                state = self._dbs.setdefault(dbname, _DbRevocations())
+        return state
+
+    def is_revoked(self, env, jti: str) -> bool:
+        state = self._state(env.cr.dbname)
+        if state.synced_db_time is None:
+            # First use in this process: every caller waits for the load
+            with state.sync_lock:
+                if state.synced_db_time is None:
+                    self._load(env.cr, state)
+        elif time.monotonic() - state.synced_at >= self._sync_seconds(env):
+            # One thread resyncs, the others keep using the current set
+            if state.sync_lock.acquire(blocking=False):
+                try:
+                    self.sync(env)
+                finally:
+                    state.sync_lock.release()
+        exp = state.jtis.get(jti)
+        return exp is not None and exp > time.time()
+
+    def add(self, dbname: str, jti: str, expires_at) -> None:
+        state = self._state(dbname)
+        with self._lock:
+            state.jtis[jti] = _epoch(expires_at)
+            if state.fresh is not None:
+                state.fresh[jti] = state.jtis[jti]
+
+    def sync(self, env) -> None:
+        """
+        Load revocations created since the previous sync.  When the full
+        reload is due, it is handed to a fresh cursor once this request's
+        transaction ends.
+        """
+        cr    = env.cr
+        state = self._state(cr.dbname)
+        if state.synced_db_time is None:
+            self._load(cr, state)
+            return
+
+        cr.execute("SELECT (now() AT TIME ZONE 'UTC')")
+        db_time = cr.fetchone()[0]
+        # Served by the create_date index of the blacklist table
+        cr.execute("""
+            SELECT jti, expires_at FROM helpdesk_api_token_blacklist
+             WHERE create_date >= %s AND expires_at > %s
+        """, (state.synced_db_time - SYNC_OVERLAP, db_time))
+        loaded = {jti: _epoch(expires_at) for jti, expires_at in cr.fetchall()}
+
+        now     = time.monotonic()
+        current = time.time()
+        with self._lock:
+            state.jtis.update(loaded)
+            state.jtis = {jti: exp for jti, exp in state.jtis.items() if exp > current}
+            if state.fresh is not None:
+                state.fresh.update(loaded)
+            state.synced_db_time = db_time
+            state.synced_at = now
+            reload_due = state.fresh is None and now - state.reloaded_at >= FULL_RELOAD_SECONDS
+            if reload_due:
+                state.fresh = {}
+
+        if reload_due:
+            registry, dbname = env.registry, cr.dbname
+
+            def reload():
+                self._reload(registry, dbname)
+            # Exactly one of them runs, whatever the request's outcome
+            cr.postcommit.add(reload)
+            cr.postrollback.add(reload)
+
+    def _load(self, cr, state) -> None:
+        db_time, rows = self._fetch_all(cr)
+        now = time.monotonic()
+        with self._lock:
+            # Keeps what add() recorded meanwhile
+            state.jtis = {**rows, **state.jtis}
+            state.synced_db_time = db_time
+            state.synced_at = state.reloaded_at = now
+
+    def _reload(self, registry, dbname: str) -> None:
+        """Full reload: drops the JTIs whose rows were deleted by hand."""
+        state = self._state(dbname)
+        try:
+            with registry.cursor() as cr:
+                _db_time, rows = self._fetch_all(cr)
+        except Exception:
+            _logger.exception('Revocation filter: full reload of %s failed.', dbname)
+            with self._lock:
+                state.fresh = None
+            return
+        with self._lock:
+            state.jtis = {**rows, **(state.fresh or {})}
+            state.fresh = None
+            state.reloaded_at = time.monotonic()
+
+    @staticmethod
+    def _fetch_all(cr):
+        cr.execute("SELECT (now() AT TIME ZONE 'UTC')")
+        db_time = cr.fetchone()[0]
+        cr.execute("""
+            SELECT jti, expires_at FROM helpdesk_api_token_blacklist
+             WHERE expires_at > %s
+        """, (db_time,))
+        return db_time, {jti: _epoch(expires_at) for jti, expires_at in cr.fetchall()}
+
+    def size(self, dbname: str) -> int:
+        return len(self._state(dbname).jtis)
+
+    @staticmethod
+    def _sync_seconds(env) -> float:
+        try:
+            return float(
+                env['ir.config_parameter'].sudo()
+                .get_param(_PARAM_SYNC_SECONDS, _DEFAULT_SYNC_SECONDS)
+            )
+        except (TypeError, ValueError):
+            return _DEFAULT_SYNC_SECONDS
+
+
+def _epoch(value) -> float:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return float(value)
+
+
+# Per-process singletons
+verified_tokens   = VerifiedTokenCache()
+revocation_filter = RevocationFilter()
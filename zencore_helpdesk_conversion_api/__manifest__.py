@@ -20,6 +20,8 @@
     'data': [
         'security/ir.model.access.csv',
         'data/mail_template_data.xml',
+        'data/ir_cron_data.xml',
+        'views/outbound_event_views.xml',
     ],
     'assets': {
         'web.assets_backend': [
@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+# Offline tooling: not imported by the addon, see conversation_benchmark.py
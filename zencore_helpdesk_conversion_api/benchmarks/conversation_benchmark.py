@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Conversation API benchmark
+==========================
+
+Offline measurement of how ``GET /api/v1/helpdesk/ticket/<id>/conversation``
+scales with thread length, reply-tree shape and attachments.  Requests are
+built with werkzeug's ``EnvironBuilder`` and handed to the real controller
+through a minimal stand-in for ``odoo.http.request``, on a private cursor
+that is rolled back at the end — the database is left exactly as it was.
+
+Usage (from ``odoo-bin shell -d <db>``)::
+
+    from odoo.addons.zencore_helpdesk_conversion_api.benchmarks.conversation_benchmark import run
+    report = run(env, message_counts=(10, 100, 1000), iterations=30)
+
+Synthetic threads
+-----------------
+One ticket per entry of ``message_counts``.  Each message:
+  - replies to an earlier message with probability ``reply_ratio``; the
+    parent is the previous message with probability ``chain_bias`` (deep
+    reply chains) and a random earlier message otherwise (bushy trees);
+  - carries ``attachments_per_message`` attachments on average;
+  - is an internal note with probability ``note_ratio``.
+Messages are created directly (no message_post), so no forward, outbox
+event or notification is produced.
+
+Measurements (per thread size × mode)
+-------------------------------------
+    p50/p95/p99   wall time of the controller call, ms
+    q/req         SQL queries on the request cursor
+    peak KiB      tracemalloc peak of one extra, separately timed request
+                  (tracing slows Python down, so it is kept out of the
+                  latency samples)
+    KiB           response body size
+    depth         deepest reply chain in the thread
+
+With ``warm_cache=False`` the plain-text body cache is cleared before every
+request, which gives the cost of a first poll.
+"""
+import random
+import time
+import tracemalloc
+from datetime import timedelta
+from unittest.mock import patch
+
+from odoo import api, fields, SUPERUSER_ID
+
+from ..controllers import main
+from ..controllers.main import HelpdeskConversationController
+from ._common import _OfflineRequest, _percentile
+
+MODES = ('tree', 'flat', 'hybrid')
+PERCENTILES = (50, 95, 99)
+
+_BODY_TEMPLATE = (
+    '<div><p>Hello, this is message <b>%(index)s</b> of the benchmark thread.</p>'
+    '<ul><li>Order reference: <i>BENCH-%(index)06d</i></li>'
+    '<li>Status: <span style="color:#c00">pending</span></li></ul>'
+    '<p>%(filler)s</p><blockquote>Quoted earlier reply &amp; signature</blockquote></div>'
+)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Synthetic population
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _create_thread(env, size, reply_ratio, chain_bias, attachments_per_message,
+                   note_ratio, authors):
+    ticket = env['helpdesk.ticket'].create({
+        'name': 'Conversation Benchmark (%s messages)' % size,
+    })
+    mt_note = env.ref('mail.mt_note')
+    mt_comment = env.ref('mail.mt_comment')
+    Message = env['mail.message']
+    start = fields.Datetime.now() - timedelta(days=1)
+
+    message_ids, depths = [], []
+    for index in range(size):
+        parent_pos = None
+        if message_ids and random.random() < reply_ratio:
+            parent_pos = (
+                len(message_ids) - 1
+                if random.random() < chain_bias
+                else random.randrange(len(message_ids))
+            )
+        message = Message.create({
+            'model':        'helpdesk.ticket',
+            'res_id':       ticket.id,
+            'message_type': 'comment',
+            'subtype_id':   (mt_note if random.random() < note_ratio else mt_comment).id,
+            'author_id':    random.choice(authors).id,
+            'body':         _BODY_TEMPLATE % {
+                'index': index, 'filler': 'lorem ipsum ' * random.randint(5, 60),
+            },
+            'date':         start + timedelta(seconds=index),
+            'parent_id':    message_ids[parent_pos] if parent_pos is not None else False,
+        })
+        message_ids.append(message.id)
+        depths.append(depths[parent_pos] + 1 if parent_pos is not None else 0)
+
+    # A fractional average gives some messages one attachment more; all
+    # attachments are created in one batch
+    attachment_vals, links = [], []
+    for message_id in message_ids:
+        count = int(attachments_per_message) + (
+            random.random() < attachments_per_message % 1
+        )
+        for n in range(count):
+            links.append(message_id)
+            attachment_vals.append({
+                'name':      'bench-%s-%s.txt' % (message_id, n),
+                'raw':       b'benchmark attachment %d\n' % message_id * 32,
+                'mimetype':  'text/plain',
+                'res_model': 'helpdesk.ticket',
+                'res_id':    ticket.id,
+            })
+    if attachment_vals:
+        attachments = env['ir.attachment'].create(attachment_vals)
+        by_message = {}
+        for message_id, attachment in zip(links, attachments):
+            by_message.setdefault(message_id, []).append(attachment.id)
+        for message_id, att_ids in by_message.items():
+            Message.browse(message_id).attachment_ids = [(6, 0, att_ids)]
+
+    env.flush_all()
+    return ticket, {
+        'messages':    size,
+        'attachments': len(attachment_vals),
+        'replies':     sum(1 for depth in depths if depth),
+        'max_depth':   max(depths, default=0),
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Runner
+# ─────────────────────────────────────────────────────────────────────────────
+
+def run(env, message_counts=(10, 100, 500), iterations=20, reply_ratio=0.6,
+        chain_bias=0.5, attachments_per_message=0.3, note_ratio=0.2,
+        warm_cache=True, seed=42, verbose=True):
+    """
+    Benchmark every mode on one synthetic thread per message count and
+    return ``{(message_count, mode): summary}``; times in ms.
+    """
+    random.seed(seed)
+    report = {}
+    with env.registry.cursor() as cr:
+        bench_env = api.Environment(cr, SUPERUSER_ID, {})
+        try:
+            authors = bench_env['res.partner'].create([
+                {'name': 'Bench Author %s' % n, 'email': 'bench%s@example.com' % n}
+                for n in range(5)
+            ])
+            for size in message_counts:
+                ticket, shape = _create_thread(
+                    bench_env, size, reply_ratio, chain_bias,
+                    attachments_per_message, note_ratio, authors,
+                )
+                for mode in MODES:
+                    report[(size, mode)] = dict(
+                        _measure(bench_env, ticket, mode, iterations, warm_cache),
+                        **shape,
+                    )
+        finally:
+            cr.rollback()
+            main._body_text_cache.clear()
+
+    if verbose:
+        print(format_report(report))
+    return report
+
+
+def _measure(env, ticket, mode, iterations, warm_cache):
+    controller = HelpdeskConversationController()
+    path = '/api/v1/helpdesk/ticket/%s/conversation' % ticket.id
+    query = {'mode': mode}
+
+    def call():
+        offline_request = _OfflineRequest(env, path, query=query)
+        if not warm_cache:
+            main._body_text_cache.clear()
+        # Every request starts from an empty ORM cache, like a new HTTP request
+        env.invalidate_all()
+        with patch.object(main, 'request', offline_request):
+            return controller.get_conversation(ticket.id, **query)
+
+    call()   # warm-up: registry, templates, body cache when warm_cache
+    totals, queries = [], []
+    response = None
+    for _i in range(iterations):
+        start_queries = env.cr.sql_log_count
+        start = time.perf_counter()
+        response = call()
+        totals.append((time.perf_counter() - start) * 1000)
+        queries.append(env.cr.sql_log_count - start_queries)
+
+    tracemalloc.start()
+    try:
+        call()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    totals.sort()
+    summary = {
+        'requests':            iterations,
+        'mean_ms':             sum(totals) / (len(totals) or 1),
+        'queries_per_request': sum(queries) / (len(queries) or 1),
+        'peak_kib':            peak / 1024,
+        'response_kib':        len(response.get_data()) / 1024 if response else 0,
+        'status':              response.status_code if response else None,
+    }
+    for pct in PERCENTILES:
+        summary['p%s_ms' % pct] = _percentile(totals, pct)
+    return summary
+
+
+def format_report(report):
+    """Render ``run()`` output as a plain-text table."""
+    header = (
+        f"{'msgs':>6} {'mode':<7} {'att':>5} {'depth':>5} {'p50':>8} {'p95':>8} "
+        f"{'p99':>8} {'q/req':>6} {'peak KiB':>9} {'KiB':>8}"
+    )
+    lines = [header, '-' * len(header)]
+    for (size, mode), summary in report.items():
+        lines.append(
+            f"{size:>6} {mode:<7} {summary['attachments']:>5} {summary['max_depth']:>5} "
+            f"{summary['p50_ms']:>8.2f} {summary['p95_ms']:>8.2f} {summary['p99_ms']:>8.2f} "
+            f"{summary['queries_per_request']:>6.1f} {summary['peak_kib']:>9.0f} "
+            f"{summary['response_kib']:>8.1f}"
+        )
+    return '\n'.join(lines)
@@ -2313,9 +2313,27 @@ Endpoints
 ─────────
   POST /api/v1/helpdesk/ticket/<ticket_id>/inbound_message
   GET  /api/v1/helpdesk/ticket/<ticket_id>/conversation
+  POST /api/v1/helpdesk/inbound_messages            (bulk inbound)
 
 Auth: public on all routes.
 
+Incremental sync
+────────────────
+Every conversation response carries an ETag and a `sync_cursor`.
+  - If-None-Match with the current ETag → 304, nothing is serialised.
+  - ?since=<sync_cursor> → messages created or edited after the cursor,
+    plus `deleted_message_ids` (tombstones) for messages deleted since.
+    write_date and deleted_at hold the *start* time of their transaction,
+    so a change committed after a poll can carry a time before that poll's
+    cursor.  The cursor is therefore moved back by SINCE_OVERLAP: changes
+    near the cursor are sent again, and clients must apply them by id
+    (upsert messages, ignore deletions of unknown ids).
+  - ?since=<message id> → new messages only: messages with a higher id,
+    plus every retained deletion of a message at or below that id.  Edits
+    are not reported, and the deletions are sent again on every poll (the
+    list is bounded by the tombstone retention).  Meant for a first catch-up
+    only: clients should continue with the returned `sync_cursor`.
+
 Attachment design (Odoo 19)
 ───────────────────────────
 message_post(attachment_ids=[...]) passes IDs through
@@ -2335,9 +2353,13 @@ Correct pattern:
 
 import base64
 import binascii
+import hashlib
 import json
 import logging
 import mimetypes
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from html.parser import HTMLParser
 
 from markupsafe import Markup, escape
@@ -2361,14 +2383,22 @@ class _HTMLStripper(HTMLParser):
     def handle_data(self, data):
         self._parts.append(data)
 
+    def reset(self):
+        super().reset()
+        self._parts = []
+
     def get_text(self):
         return ' '.join(self._parts).strip()
 
 
-def _strip_html(html):
+def _strip_html(html, stripper=None):
+    """Pass a shared *stripper* when converting many bodies in a row."""
     if not html:
         return ''
-    stripper = _HTMLStripper()
+    if stripper is None:
+        stripper = _HTMLStripper()
+    else:
+        stripper.reset()
     try:
         stripper.feed(html)
         return stripper.get_text()
@@ -2376,6 +2406,81 @@ def _strip_html(html):
         return html
 
 
+class _BodyTextCache:
+    """
+    Process-wide LRU of plain-text bodies keyed by (database, message id,
+    write_date).  Any edit of a message bumps its write_date, so a stale
+    entry is never served; it just ages out.  Pollers re-reading the same
+    thread skip the HTML parsing entirely.
+
+    Bounded by entry count and by total text length (``max_chars``, in
+    characters); a body longer than ``max_entry_chars`` is not cached at
+    all, so a few huge messages cannot evict everything else.
+    """
+
+    def __init__(self, max_size=20000, max_chars=8_000_000, max_entry_chars=100_000):
+        self.max_size = max_size
+        self.max_chars = max_chars
+        self.max_entry_chars = max_entry_chars
+        self._entries = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+
+    def get_many(self, keys):
+        found = {}
+        with self._lock:
+            for key in keys:
+                text = self._entries.get(key)
+                if text is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = text
+        return found
+
+    def set_many(self, items):
+        with self._lock:
+            for key, text in items:
+                if len(text) > self.max_entry_chars:
+                    continue
+                previous = self._entries.pop(key, None)
+                if previous is not None:
+                    self._chars -= len(previous)
+                self._entries[key] = text
+                self._chars += len(text)
+            while self._entries and (
+                len(self._entries) > self.max_size or self._chars > self.max_chars
+            ):
+                _key, evicted = self._entries.popitem(last=False)
+                self._chars -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._chars = 0
+
+
+_body_text_cache = _BodyTextCache()
+
+
+def _body_texts(dbname, rows):
+    """{message id: plain-text body} for read() rows, parsing only cache misses."""
+    keys = {row['id']: (dbname, row['id'], row['write_date']) for row in rows}
+    cached = _body_text_cache.get_many(keys.values())
+    texts, computed, stripper = {}, [], None
+    for row in rows:
+        key = keys[row['id']]
+        if key in cached:
+            texts[row['id']] = cached[key]
+            continue
+        if stripper is None:
+            stripper = _HTMLStripper()
+        text = _strip_html(row['body'], stripper)
+        texts[row['id']] = text
+        computed.append((key, text))
+    if computed:
+        _body_text_cache.set_many(computed)
+    return texts
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Author-type resolver
 # ─────────────────────────────────────────────────────────────────────────────
@@ -2396,64 +2501,120 @@ def _resolve_author_type(partner):
 # Message serialiser
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _serialise_message(msg, ticket):
-    partner     = msg.author_id
-    author_type = _resolve_author_type(partner)
+_MESSAGE_FIELDS = [
+    'parent_id', 'body', 'message_type', 'subtype_id', 'date',
+    'author_id', 'attachment_ids', 'write_date',
+]
+
+
+def _serialise_messages(messages, ticket):
+    """
+    Serialise a whole thread with a fixed number of queries.
+
+    Messages, authors (with their users' share flag), subtypes and
+    attachments are each read in one batch and mail.mt_note is resolved
+    once, so the query count does not grow with the thread length.  The
+    output is identical to calling _serialise_message on every message.
+    Plain-text bodies come from _body_text_cache when possible.
+    """
+    env = messages.env
+    rows = messages.read(_MESSAGE_FIELDS, load=None)
+
+    author_ids = {row['author_id'] for row in rows if row['author_id']}
+    subtype_ids = {row['subtype_id'] for row in rows if row['subtype_id']}
+    attachment_ids = {att_id for row in rows for att_id in row['attachment_ids']}
+
+    authors = {
+        partner['id']: partner
+        for partner in env['res.partner'].browse(author_ids).read(
+            ['name', 'email', 'user_ids'], load=None,
+        )
+    }
+    user_ids = {uid for partner in authors.values() for uid in partner['user_ids']}
+    share_by_user = {
+        user['id']: user['share']
+        for user in env['res.users'].browse(user_ids).read(['share'], load=None)
+    }
+    subtype_names = {
+        subtype['id']: subtype['name']
+        for subtype in env['mail.message.subtype'].browse(subtype_ids).read(['name'], load=None)
+    }
+    attachments = {
+        att['id']: att
+        for att in env['ir.attachment'].browse(attachment_ids).read(['name', 'mimetype'], load=None)
+    }
 
+    mt_note_ref = env.ref('mail.mt_note', raise_if_not_found=False)
+    mt_note_id = mt_note_ref.id if mt_note_ref else False
     assigned_pid = (
         ticket.user_id.partner_id.id
         if ticket.user_id and ticket.user_id.partner_id
         else False
     )
 
-    if author_type in ('portal_user', 'public'):
-        direction = 'inbound'
-    elif assigned_pid and partner and partner.id == assigned_pid:
-        direction = 'outbound'
-    else:
-        direction = 'internal'
+    def author_type(partner):
+        # Same rules as _resolve_author_type, on prefetched values
+        if not partner or not partner['user_ids']:
+            return 'public'
+        if any(not share_by_user.get(uid) for uid in partner['user_ids']):
+            return 'internal_user'
+        return 'portal_user'
+
+    body_texts = _body_texts(env.cr.dbname, rows)
+    result = []
+    for row in rows:
+        partner = authors.get(row['author_id'])
+        user_type = author_type(partner)
+        is_assigned = bool(assigned_pid and partner and partner['id'] == assigned_pid)
+
+        if user_type in ('portal_user', 'public'):
+            direction = 'inbound'
+        elif is_assigned:
+            direction = 'outbound'
+        else:
+            direction = 'internal'
+
+        subtype_id = row['subtype_id']
+        result.append({
+            'message_id':       row['id'],
+            'parent_id':        row['parent_id'] or None,
+            'body_html':        row['body'] or '',
+            'body_text':        body_texts[row['id']],
+            'message_type':     row['message_type'] or '',
+            'subtype_name':     subtype_names.get(subtype_id) if subtype_id else None,
+            'is_internal_note': bool(subtype_id and mt_note_id and subtype_id == mt_note_id),
+            'direction':        direction,
+            'date':             row['date'].strftime('%Y-%m-%dT%H:%M:%SZ') if row['date'] else None,
+            'attachments':      [
+                {
+                    'id':       att_id,
+                    'name':     attachments[att_id]['name'],
+                    'mimetype': attachments[att_id]['mimetype'],
+                    'url':      '/web/content/%s?download=true' % att_id,
+                }
+                for att_id in row['attachment_ids']
+                if att_id in attachments
+            ],
+            'author': {
+                'id':                partner['id'] if partner else None,
+                'name':              partner['name'] if partner else 'Unknown',
+                'email':             partner['email'] if partner else None,
+                'user_type':         user_type,
+                'is_assigned_agent': is_assigned,
+            },
+            'reply_count': 0,
+            'replies':     [],
+        })
+    return result
 
-    subtype     = msg.subtype_id
-    mt_note_ref = request.env.ref('mail.mt_note', raise_if_not_found=False)
-    is_internal_note = bool(
-        subtype and mt_note_ref and subtype.id == mt_note_ref.id
-    )
 
-    return {
-        'message_id':       msg.id,
-        'parent_id':        msg.parent_id.id if msg.parent_id else None,
-        'body_html':        msg.body or '',
-        'body_text':        _strip_html(msg.body),
-        'message_type':     msg.message_type or '',
-        'subtype_name':     subtype.name if subtype else None,
-        'is_internal_note': is_internal_note,
-        'direction':        direction,
-        'date':             msg.date.strftime('%Y-%m-%dT%H:%M:%SZ') if msg.date else None,
-        'attachments':      [
-            {
-                'id':       att.id,
-                'name':     att.name,
-                'mimetype': att.mimetype,
-                'url':      '/web/content/%s?download=true' % att.id,
-            }
-            for att in msg.attachment_ids
-        ],
-        'author': {
-            'id':                partner.id if partner else None,
-            'name':              partner.name if partner else 'Unknown',
-            'email':             partner.email if partner else None,
-            'user_type':         author_type,
-            'is_assigned_agent': bool(
-                assigned_pid and partner and partner.id == assigned_pid
-            ),
-        },
-        'reply_count': 0,
-        'replies':     [],
-    }
+def _serialise_message(msg, ticket):
+    return _serialise_messages(msg, ticket)[0]
 
 
-def _normalise_orphan_parent_ids(flat_messages):
-    message_ids = {msg['message_id'] for msg in flat_messages}
+def _normalise_orphan_parent_ids(flat_messages, visible_ids=()):
+    """Null parent ids that point outside the returned (or `visible_ids`) messages."""
+    message_ids = {msg['message_id'] for msg in flat_messages} | set(visible_ids)
     for msg in flat_messages:
         if msg['parent_id'] and msg['parent_id'] not in message_ids:
             msg['parent_id'] = None
@@ -2518,6 +2679,71 @@ def _build_hybrid(flat_messages):
     return timeline
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Incremental sync helpers
+# ─────────────────────────────────────────────────────────────────────────────
+
+_SYNC_CURSOR_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+# Longest transaction expected to commit after a poll that started later
+SINCE_OVERLAP = timedelta(minutes=2)
+_SINCE_FORMATS = (
+    _SYNC_CURSOR_FORMAT,
+    '%Y-%m-%dT%H:%M:%SZ',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%Y-%m-%d %H:%M:%S',
+)
+
+
+def _parse_since(raw):
+    """
+    Return ('id', message_id) or ('date', naive UTC datetime).
+    Raises ValueError for anything else.
+    """
+    raw = raw.strip()
+    if raw.isdigit():
+        return 'id', int(raw)
+    for fmt in _SINCE_FORMATS:
+        try:
+            return 'date', datetime.strptime(raw, fmt)
+        except ValueError:
+            continue
+    raise ValueError(
+        "Invalid 'since' value '%s'. Expected a message id or a UTC "
+        "timestamp such as 2024-01-31T12:00:00Z." % raw
+    )
+
+
+def _conversation_version(env, ticket_id):
+    """
+    One aggregate query over the ticket's messages and tombstones:
+    (message count, last message write_date, last deletion time).
+    Any post, edit or delete changes at least one of them.
+    """
+    env.cr.execute("""
+        SELECT COUNT(*), MAX(write_date),
+               (SELECT MAX(deleted_at)
+                  FROM zencore_conversation_tombstone
+                 WHERE ticket_id = %s)
+          FROM mail_message
+         WHERE model = 'helpdesk.ticket' AND res_id = %s
+    """, (ticket_id, ticket_id))
+    return env.cr.fetchone()
+
+
+def _conversation_etag(version, ticket, query_key):
+    digest = hashlib.sha1(
+        repr((version, ticket.write_date, query_key)).encode()
+    ).hexdigest()
+    return '"%s"' % digest
+
+
+def _sync_cursor(version):
+    _count, last_write, last_delete = version
+    latest = max(filter(None, (last_write, last_delete)), default=None)
+    return latest.strftime(_SYNC_CURSOR_FORMAT) if latest else None
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Controller
 # ─────────────────────────────────────────────────────────────────────────────
@@ -2525,6 +2751,8 @@ def _build_hybrid(flat_messages):
 class HelpdeskConversationController(http.Controller):
 
     MAX_ATTACHMENT_BYTES = 10 * 1024 * 1024
+    STREAM_CHUNK_BYTES   = 64 * 1024
+    MAX_BULK_MESSAGES    = 500
 
     # =========================================================================
     # GET /api/v1/helpdesk/ticket/<ticket_id>/conversation
@@ -2542,6 +2770,7 @@ class HelpdeskConversationController(http.Controller):
         mode             = query_params.get('mode', 'tree').strip().lower()
         include_internal = query_params.get('include_internal', '1') != '0'
         include_system   = query_params.get('include_system',   '0') == '1'
+        raw_since        = query_params.get('since') or ''
 
         if mode not in ('tree', 'flat', 'hybrid'):
             return self._json_response(
@@ -2550,6 +2779,15 @@ class HelpdeskConversationController(http.Controller):
                 status=400,
             )
 
+        since = None
+        if raw_since.strip():
+            try:
+                since = _parse_since(raw_since)
+            except ValueError as exc:
+                return self._json_response(
+                    {"status": "error", "message": str(exc)}, status=400,
+                )
+
         ticket = request.env['helpdesk.ticket'].sudo().browse(ticket_id)
         if not ticket.exists():
             return self._json_response(
@@ -2557,6 +2795,15 @@ class HelpdeskConversationController(http.Controller):
                 status=404,
             )
 
+        # ── Conditional GET: unchanged thread → 304 before any serialising ──
+        version = _conversation_version(request.env, ticket.id)
+        etag = _conversation_etag(
+            version, ticket, (mode, include_internal, include_system, since),
+        )
+        if request.httprequest.if_none_match.contains_weak(etag.strip('"')):
+            return Response(status=304, headers={'ETag': etag})
+        headers = {'ETag': etag}
+
         allowed_types = ['comment', 'email']
         if include_system:
             allowed_types += ['notification', 'user_notification']
@@ -2572,6 +2819,9 @@ class HelpdeskConversationController(http.Controller):
             if mt_note:
                 domain.append(('subtype_id', '!=', mt_note.id))
 
+        if since:
+            return self._conversation_changes(ticket, domain, since, version, headers)
+
         try:
             messages = request.env['mail.message'].sudo().search(
                 domain, order='date asc',
@@ -2587,7 +2837,7 @@ class HelpdeskConversationController(http.Controller):
             )
 
         flat_list = _normalise_orphan_parent_ids(
-            [_serialise_message(msg, ticket) for msg in messages]
+            _serialise_messages(messages, ticket)
         )
 
         if mode == 'tree':
@@ -2597,6 +2847,70 @@ class HelpdeskConversationController(http.Controller):
         else:
             conversation = flat_list
 
+        return self._json_response({
+            **self._ticket_header(ticket),
+            'total_messages': len(flat_list),
+            'mode':           mode,
+            'sync_cursor':    _sync_cursor(version),
+            'conversation':   conversation,
+        }, headers=headers)
+
+    def _conversation_changes(self, ticket, domain, since, version, headers):
+        """
+        Incremental response: messages created / edited after `since` as a
+        flat list, plus the ids of messages deleted since.  Tree and hybrid
+        structures need the whole thread, so they are not built here.
+        Timestamp cursors overlap the previous poll by SINCE_OVERLAP; id
+        cursors report new messages only (see the module docstring).
+        """
+        Message   = request.env['mail.message'].sudo()
+        Tombstone = request.env['zencore.conversation.tombstone'].sudo()
+        kind, value = since
+
+        if kind == 'id':
+            change_domain    = domain + [('id', '>', value)]
+            tombstone_domain = [('ticket_id', '=', ticket.id), ('message_id', '<=', value)]
+        else:
+            # See "Incremental sync" in the module docstring
+            value           -= SINCE_OVERLAP
+            change_domain    = domain + [('write_date', '>', value)]
+            tombstone_domain = [('ticket_id', '=', ticket.id), ('deleted_at', '>', value)]
+
+        try:
+            messages = Message.search(change_domain, order='date asc')
+            deleted  = Tombstone.search_read(tombstone_domain, ['message_id'])
+        except Exception as exc:
+            _logger.error(
+                "[Zencore] Failed to fetch conversation changes for ticket_id=%s: %s",
+                ticket.id, exc,
+            )
+            return self._json_response(
+                {"status": "error", "message": "Failed to retrieve conversation."},
+                status=500,
+            )
+
+        changes = _serialise_messages(messages, ticket)
+        # Parents outside this batch are kept when the client can see them
+        parent_ids = {
+            msg['parent_id'] for msg in changes if msg['parent_id']
+        } - set(messages.ids)
+        visible_parent_ids = (
+            Message.search(domain + [('id', 'in', list(parent_ids))]).ids
+            if parent_ids else []
+        )
+        changes = _normalise_orphan_parent_ids(changes, visible_parent_ids)
+
+        return self._json_response({
+            **self._ticket_header(ticket),
+            'total_messages':      len(changes),
+            'mode':                'incremental',
+            'sync_cursor':         _sync_cursor(version),
+            'conversation':        changes,
+            'deleted_message_ids': sorted({row['message_id'] for row in deleted}),
+        }, headers=headers)
+
+    @staticmethod
+    def _ticket_header(ticket):
         assigned_agent = None
         if ticket.user_id:
             assigned_agent = {
@@ -2604,17 +2918,13 @@ class HelpdeskConversationController(http.Controller):
                 'name':  ticket.user_id.name,
                 'email': ticket.user_id.email,
             }
-
-        return self._json_response({
+        return {
             'status':         'success',
             'ticket_id':      ticket.id,
             'ticket_name':    ticket.name or '',
             'ticket_status':  ticket.stage_id.name if ticket.stage_id else None,
             'assigned_agent': assigned_agent,
-            'total_messages': len(flat_list),
-            'mode':           mode,
-            'conversation':   conversation,
-        })
+        }
 
     # =========================================================================
     # POST /api/v1/helpdesk/ticket/<ticket_id>/inbound_message
@@ -2674,10 +2984,10 @@ class HelpdeskConversationController(http.Controller):
         # ── Resolve optional parent_message_id ──────────────────────────────
         parent_id = self._resolve_parent_message_id(raw_parent, ticket_id)
 
-        # ── Validate & decode attachment data BEFORE any DB write ────────────
+        # ── Validate & stream attachment data BEFORE any DB write ────────────
         try:
-            attachment_tuples  = self._prepare_inbound_attachments(raw_attachments)
-            attachment_tuples += self._prepare_uploaded_attachments(uploaded_files)
+            staged_attachments  = self._stage_inbound_attachments(raw_attachments)
+            staged_attachments += self._stage_uploaded_attachments(uploaded_files)
         except ValueError as exc:
             return self._json_response(
                 {"status": "error", "message": str(exc)}, status=422,
@@ -2693,16 +3003,8 @@ class HelpdeskConversationController(http.Controller):
             )
 
         # ── Step 1: Post message (body only, no attachments yet) ─────────────
-        chatter_body = Markup("<p>%s</p>" % escape(body or ""))
-
         try:
-            message = ticket.message_post(
-                body=chatter_body,
-                author_id=author_id or False,
-                message_type='comment',
-                subtype_xmlid='mail.mt_note',
-                parent_id=parent_id or False,
-            )
+            message = self._post_inbound_message(ticket, body, author_id, parent_id)
         except Exception as exc:
             _logger.error(
                 "[Zencore] Failed to post chatter message for ticket_id=%s: %s",
@@ -2715,7 +3017,7 @@ class HelpdeskConversationController(http.Controller):
 
         # ── Step 2 + 3: Create ir.attachment records, then link to message ───
         attachment_ids = self._create_and_link_attachments(
-            ticket, message, attachment_tuples
+            ticket, message, staged_attachments
         )
 
         # ── Notify assigned agent ────────────────────────────────────────────
@@ -2728,26 +3030,270 @@ class HelpdeskConversationController(http.Controller):
             "attachment_ids": attachment_ids,
         })
 
+    # =========================================================================
+    # POST /api/v1/helpdesk/inbound_messages
+    # =========================================================================
+
+    @http.route(
+        '/api/v1/helpdesk/inbound_messages',
+        type='http',
+        auth='public',
+        methods=['POST'],
+        csrf=False,
+        save_session=False,
+    )
+    def inbound_messages_bulk(self, **_kwargs):
+        """
+        Bulk variant of inbound_message for integrations replaying backlogs.
+
+        Body: {"messages": [{"ticket_id": 7, "sender_email": ..., "body": ...,
+                             "parent_message_id": ..., "attachments": [...],
+                             "reference": "<client id, echoed back>"}, ...]}
+
+        Tickets, author partners and parent messages are looked up once for
+        the whole request.  Messages are posted ticket by ticket in request
+        order, each inside its own savepoint, so one bad item does not
+        discard the others.  The assigned agent of a ticket gets a single
+        notification however many messages were posted to it.
+
+        Returns HTTP 200 with one result per item, in request order:
+            {"index", "reference", "status": "success"|"error",
+             "code", "message_id" / "message", "attachment_ids"}
+        """
+        raw = request.httprequest.data
+        try:
+            payload = json.loads(raw) if raw else None
+        except (ValueError, TypeError):
+            payload = None
+        items = payload.get('messages') if isinstance(payload, dict) else None
+        if not isinstance(items, list) or not items:
+            return self._json_response(
+                {"status": "error",
+                 "message": "'messages' must be a non-empty list."},
+                status=400,
+            )
+        if len(items) > self.MAX_BULK_MESSAGES:
+            return self._json_response(
+                {"status": "error",
+                 "message": "At most %s messages per request." % self.MAX_BULK_MESSAGES},
+                status=413,
+            )
+
+        env     = request.env
+        results = [None] * len(items)
+
+        def _fail(index, code, text):
+            item = items[index] if isinstance(items[index], dict) else {}
+            results[index] = {
+                'index':     index,
+                'reference': item.get('reference'),
+                'status':    'error',
+                'code':      code,
+                'message':   text,
+            }
+
+        # ── Validate items, group them per ticket (request order kept) ──────
+        by_ticket = {}
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                _fail(index, 422, "Item must be an object.")
+                continue
+            try:
+                ticket_id = int(item.get('ticket_id'))
+            except (TypeError, ValueError):
+                _fail(index, 422, "'ticket_id' must be an integer.")
+                continue
+            if not str(item.get('body') or '').strip() and not item.get('attachments'):
+                _fail(index, 422, "'body' or 'attachments' is required.")
+                continue
+            by_ticket.setdefault(ticket_id, []).append(index)
+
+        # ── Batched lookups: tickets, authors, parent messages ───────────────
+        tickets = env['helpdesk.ticket'].sudo().browse(list(by_ticket)).exists()
+        ticket_by_id = {ticket.id: ticket for ticket in tickets}
+        author_by_email = self._resolve_author_partners([
+            items[i] for indexes in by_ticket.values() for i in indexes
+        ])
+        parent_by_item = self._resolve_parent_message_ids({
+            i: (items[i].get('parent_message_id'), ticket_id)
+            for ticket_id, indexes in by_ticket.items()
+            for i in indexes
+        })
+
+        # ── Post per ticket ──────────────────────────────────────────────────
+        for ticket_id, indexes in by_ticket.items():
+            ticket = ticket_by_id.get(ticket_id)
+            if not ticket:
+                for index in indexes:
+                    _fail(index, 404, "Ticket #%s not found." % ticket_id)
+                continue
+
+            posted = 0
+            for index in indexes:
+                item = items[index]
+                body = str(item.get('body') or '').strip()
+                sender_email = str(item.get('sender_email') or '').strip()
+                try:
+                    with env.cr.savepoint():
+                        staged = self._stage_inbound_attachments(
+                            item.get('attachments') or []
+                        )
+                        message = self._post_inbound_message(
+                            ticket, body,
+                            author_by_email.get(sender_email, False),
+                            parent_by_item.get(index, False),
+                        )
+                        attachment_ids = self._create_and_link_attachments(
+                            ticket, message, staged,
+                        )
+                except ValueError as exc:
+                    _fail(index, 422, str(exc))
+                    continue
+                except Exception as exc:
+                    _logger.error(
+                        "[Zencore] Bulk inbound: failed to post item %s for "
+                        "ticket_id=%s: %s", index, ticket_id, exc,
+                    )
+                    _fail(index, 500, "Failed to post message.")
+                    continue
+
+                posted += 1
+                results[index] = {
+                    'index':          index,
+                    'reference':      item.get('reference'),
+                    'status':         'success',
+                    'code':           200,
+                    'ticket_id':      ticket_id,
+                    'message_id':     message.id,
+                    'attachment_ids': attachment_ids,
+                }
+
+            # ── One assignee notification per ticket ─────────────────────────
+            if posted:
+                ticket._notify_assigned_user_on_inbound()
+
+        succeeded = sum(1 for result in results if result['status'] == 'success')
+        return self._json_response({
+            "status":    "success" if succeeded == len(results) else "partial",
+            "total":     len(results),
+            "succeeded": succeeded,
+            "failed":    len(results) - succeeded,
+            "results":   results,
+        })
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Posting helpers
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _post_inbound_message(ticket, body, author_id, parent_id):
+        """Post an inbound chatter note (body only, attachments are linked after)."""
+        return ticket.message_post(
+            body=Markup("<p>%s</p>" % escape(body or "")),
+            author_id=author_id or False,
+            message_type='comment',
+            subtype_xmlid='mail.mt_note',
+            parent_id=parent_id or False,
+        )
+
+    @staticmethod
+    def _resolve_author_partners(items):
+        """
+        Map sender_email → res.partner id for all `items` with one
+        search and at most one create (same rules as inbound_message).
+        """
+        names_by_email = {}
+        for item in items:
+            email = str(item.get('sender_email') or '').strip()
+            if email and email not in names_by_email:
+                names_by_email[email] = str(item.get('sender_name') or '').strip()
+        if not names_by_email:
+            return {}
+
+        Partner = request.env['res.partner'].sudo()
+        partner_by_email = {}
+        for partner in Partner.search_read(
+            [('email', 'in', list(names_by_email))],
+            ['email'],
+        ):
+            # search() order: the first match wins, as with limit=1
+            partner_by_email.setdefault(partner['email'], partner['id'])
+
+        missing = [email for email in names_by_email if email not in partner_by_email]
+        if missing:
+            created = Partner.create([
+                {'name': names_by_email[email] or email, 'email': email}
+                for email in missing
+            ])
+            partner_by_email.update(zip(missing, created.ids))
+        return partner_by_email
+
+    @staticmethod
+    def _resolve_parent_message_ids(raw_parents):
+        """
+        Batched _resolve_parent_message_id: {key: (raw_parent, ticket_id)} →
+        {key: parent message id}.  Invalid parents are left out (logged).
+        """
+        wanted = {}
+        for key, (raw_parent, ticket_id) in raw_parents.items():
+            if raw_parent is None:
+                continue
+            try:
+                wanted[key] = (int(raw_parent), ticket_id)
+            except (ValueError, TypeError):
+                _logger.warning(
+                    "[Zencore] parent_message_id='%s' is not an integer "
+                    "(ticket_id=%s). Ignoring.",
+                    raw_parent, ticket_id,
+                )
+        if not wanted:
+            return {}
+
+        owners = {
+            msg['id']: (msg['model'], msg['res_id'])
+            for msg in request.env['mail.message'].sudo().search_read(
+                [('id', 'in', list({parent for parent, _tid in wanted.values()}))],
+                ['model', 'res_id'],
+            )
+        }
+        resolved = {}
+        for key, (parent_int, ticket_id) in wanted.items():
+            if owners.get(parent_int) == ('helpdesk.ticket', ticket_id):
+                resolved[key] = parent_int
+            else:
+                _logger.warning(
+                    "[Zencore] parent_message_id=%s does not exist or does not "
+                    "belong to ticket_id=%s. Ignoring.",
+                    parent_int, ticket_id,
+                )
+        return resolved
+
     # ─────────────────────────────────────────────────────────────────────────
     # Attachment helpers
     # ─────────────────────────────────────────────────────────────────────────
 
     @staticmethod
-    def _prepare_inbound_attachments(raw_attachments):
+    def _stage_inbound_attachments(raw_attachments):
         """
-        Decode and validate base64 attachments from a JSON payload.
-        Returns a list of (filename, file_bytes, mimetype) tuples.
+        Validate base64 attachments from a JSON payload and stream them into
+        the filestore.  The data is decoded one chunk at a time, so no
+        decoded copy of the whole file is ever held in memory.
+
+        Returns a list of staged dicts (name, mimetype + the storage values
+        from ir.attachment._zencore_store_chunks).
         Raises ValueError on the first invalid entry.
         """
         if not isinstance(raw_attachments, list):
             raise ValueError("'attachments' must be a list.")
 
+        Controller = HelpdeskConversationController
+        Attachment = request.env['ir.attachment'].sudo()
         result = []
         for index, item in enumerate(raw_attachments, start=1):
             if not isinstance(item, dict):
                 raise ValueError("Attachment #%s must be an object." % index)
 
-            filename = HelpdeskConversationController._clean_filename(
+            filename = Controller._clean_filename(
                 item.get('filename') or item.get('name') or 'attachment-%s' % index
             )
             raw_data = item.get('data') or item.get('datas') or item.get('content')
@@ -2761,54 +3307,63 @@ class HelpdeskConversationController(http.Controller):
             if ',' in raw_data and raw_data.lower().startswith('data:'):
                 raw_data = raw_data.split(',', 1)[1]
 
-            try:
-                file_content = base64.b64decode(raw_data, validate=True)
-            except (binascii.Error, ValueError):
-                raise ValueError(
-                    "Attachment '%s' has invalid base64 data." % filename
-                )
+            # Cheap upper bound before anything is decoded or written
+            if len(raw_data) // 4 * 3 - 2 > Controller.MAX_ATTACHMENT_BYTES:
+                raise ValueError("Attachment '%s' exceeds 10MB limit." % filename)
 
-            HelpdeskConversationController._check_attachment_size(
-                filename, file_content
+            storage = Attachment._zencore_store_chunks(
+                Controller._size_checked_chunks(
+                    filename, Controller._iter_base64_chunks(filename, raw_data),
+                )
             )
+            if not storage:
+                raise ValueError(
+                    "Attachment '%s' is missing base64 data." % filename
+                )
 
             mimetype = (
                 item.get('mimetype')
                 or mimetypes.guess_type(filename)[0]
                 or 'application/octet-stream'
             )
-            result.append((filename, file_content, mimetype))
+            result.append(dict(storage, name=filename, mimetype=mimetype))
         return result
 
     @staticmethod
-    def _prepare_uploaded_attachments(uploaded_files):
+    def _stage_uploaded_attachments(uploaded_files):
         """
-        Read and validate files from a multipart/form-data upload.
+        Stream files from a multipart/form-data upload into the filestore,
+        STREAM_CHUNK_BYTES at a time (Werkzeug has already spooled large
+        parts to a temporary file).
 
         FIX 1 — stream.seek(0): Werkzeug may have partially consumed the
         stream during request parsing.  Always reset before reading so that
-        file_content is never silently empty.
+        the file is never silently empty.
 
-        Returns a list of (filename, file_bytes, mimetype) tuples.
+        Returns a list of staged dicts, like _stage_inbound_attachments.
         Skips files with no name or zero-byte content (with a warning).
         """
+        Controller = HelpdeskConversationController
+        Attachment = request.env['ir.attachment'].sudo()
         result = []
         for uploaded_file in uploaded_files:
             if not uploaded_file or not uploaded_file.filename:
                 continue
 
-            filename = HelpdeskConversationController._clean_filename(
-                uploaded_file.filename
-            )
+            filename = Controller._clean_filename(uploaded_file.filename)
 
             # FIX 1: reset stream position before reading
             try:
                 uploaded_file.stream.seek(0)
             except Exception:
                 pass  # some stream types don't support seek; best-effort
-            file_content = uploaded_file.stream.read()
 
-            if not file_content:
+            storage = Attachment._zencore_store_chunks(
+                Controller._size_checked_chunks(
+                    filename, Controller._iter_stream_chunks(uploaded_file.stream),
+                )
+            )
+            if not storage:
                 _logger.warning(
                     "[Zencore] Skipping multipart file '%s': stream yielded "
                     "0 bytes (stream may have already been consumed).",
@@ -2816,10 +3371,6 @@ class HelpdeskConversationController(http.Controller):
                 )
                 continue
 
-            HelpdeskConversationController._check_attachment_size(
-                filename, file_content
-            )
-
             # .mimetype is a Werkzeug FileStorage property; fall back to
             # .content_type (older Werkzeug versions) then MIME guessing.
             mimetype = (
@@ -2828,57 +3379,109 @@ class HelpdeskConversationController(http.Controller):
                 or mimetypes.guess_type(filename)[0]
                 or 'application/octet-stream'
             )
-            result.append((filename, file_content, mimetype))
+            result.append(dict(storage, name=filename, mimetype=mimetype))
         return result
 
     @staticmethod
-    def _create_and_link_attachments(ticket, message, attachment_tuples):
+    def _create_and_link_attachments(ticket, message, staged_attachments):
         """
-        Create ir.attachment records and link them to both the ticket and
-        the chatter message.
-
-        FIX 2 — datas must be a str, not bytes:
-          base64.b64encode() returns bytes.  Odoo 19's Binary field writer
-          (fields.Binary._write) calls base64.b64decode() on whatever is
-          stored; if it receives bytes it may coerce correctly on some DB
-          adapters but fails silently or raises on others.  Calling
-          .decode() makes the value an explicit ASCII string, which is the
-          format Odoo expects for all Binary/datas fields.
-
-        Returns a list of ir.attachment IDs (empty list when no files).
+        Create the ir.attachment records for staged files in one batched
+        create() and link them to both the ticket and the chatter message.
+
+        Deduplication by checksum:
+          - the same file (checksum, name, mimetype) sent twice in one
+            request gives a single attachment;
+          - a file already attached to the ticket is linked again instead
+            of being re-created.
+        The filestore itself never holds the same content twice.
+
+        Returns the list of linked ir.attachment IDs (empty when no files).
         """
-        if not attachment_tuples:
+        if not staged_attachments:
             return []
 
-        att_ids = []
-        for filename, file_content, mimetype in attachment_tuples:
-            att = request.env['ir.attachment'].sudo().create({
-                'name':      filename,
-                'type':      'binary',
-                # FIX 2: .decode() → str, not bytes
-                'datas':     base64.b64encode(file_content).decode(),
-                'mimetype':  mimetype,
-                'res_model': 'helpdesk.ticket',   # ticket's Files tab
-                'res_id':    ticket.id,
-            })
-            att_ids.append(att.id)
-            _logger.debug(
-                "[Zencore] Created attachment id=%s name='%s' ticket_id=%s",
-                att.id, filename, ticket.id,
-            )
-
-        if att_ids:
-            # (4, id) = "add link" ORM command for Many2many.
-            message.sudo().write({
-                'attachment_ids': [(4, att_id) for att_id in att_ids],
-            })
+        Attachment = request.env['ir.attachment'].sudo()
+        ids_by_key = {
+            (att['checksum'], att['name'], att['mimetype']): att['id']
+            for att in Attachment.search_read([
+                ('res_model', '=', 'helpdesk.ticket'),
+                ('res_id',    '=', ticket.id),
+                ('checksum',  'in', [item['checksum'] for item in staged_attachments]),
+            ], ['checksum', 'name', 'mimetype'])
+        }
+
+        new_keys, vals_list = [], []
+        for item in staged_attachments:
+            key = (item['checksum'], item['name'], item['mimetype'])
+            if key in ids_by_key or key in new_keys:
+                continue
+            new_keys.append(key)
+            vals_list.append(dict(
+                item,
+                type='binary',
+                res_model='helpdesk.ticket',   # ticket's Files tab
+                res_id=ticket.id,
+            ))
+
+        if vals_list:
+            created = Attachment.create(vals_list)
+            ids_by_key.update(zip(new_keys, created.ids))
             _logger.debug(
-                "[Zencore] Linked %s attachment(s) to message_id=%s",
-                len(att_ids), message.id,
+                "[Zencore] Created %s attachment(s) %s ticket_id=%s",
+                len(created), created.ids, ticket.id,
             )
 
+        att_ids = []
+        for item in staged_attachments:
+            att_id = ids_by_key[(item['checksum'], item['name'], item['mimetype'])]
+            if att_id not in att_ids:
+                att_ids.append(att_id)
+
+        # (4, id) = "add link" ORM command for Many2many.
+        message.sudo().write({
+            'attachment_ids': [(4, att_id) for att_id in att_ids],
+        })
+        _logger.debug(
+            "[Zencore] Linked %s attachment(s) to message_id=%s",
+            len(att_ids), message.id,
+        )
         return att_ids
 
+    @staticmethod
+    def _iter_base64_chunks(filename, raw_data):
+        """Decode base64 text in slices of whole 4-character groups."""
+        step = HelpdeskConversationController.STREAM_CHUNK_BYTES // 3 * 4
+        for start in range(0, len(raw_data), step):
+            piece = raw_data[start:start + step]
+            try:
+                # Padding is only valid in the last slice
+                if '=' in piece and start + step < len(raw_data):
+                    raise ValueError
+                yield base64.b64decode(piece, validate=True)
+            except (binascii.Error, ValueError):
+                raise ValueError(
+                    "Attachment '%s' has invalid base64 data." % filename
+                )
+
+    @staticmethod
+    def _iter_stream_chunks(stream):
+        while True:
+            chunk = stream.read(HelpdeskConversationController.STREAM_CHUNK_BYTES)
+            if not chunk:
+                return
+            yield chunk
+
+    @staticmethod
+    def _size_checked_chunks(filename, chunks):
+        total = 0
+        for chunk in chunks:
+            total += len(chunk)
+            if total > HelpdeskConversationController.MAX_ATTACHMENT_BYTES:
+                raise ValueError(
+                    "Attachment '%s' exceeds 10MB limit." % filename
+                )
+            yield chunk
+
     # ─────────────────────────────────────────────────────────────────────────
     # Shared private helpers
     # ─────────────────────────────────────────────────────────────────────────
@@ -2933,24 +3536,18 @@ class HelpdeskConversationController(http.Controller):
             )
             raise ValueError('Invalid JSON payload.')
 
-    @staticmethod
-    def _check_attachment_size(filename, file_content):
-        if len(file_content) > HelpdeskConversationController.MAX_ATTACHMENT_BYTES:
-            raise ValueError(
-                "Attachment '%s' exceeds 10MB limit." % filename
-            )
-
     @staticmethod
     def _clean_filename(filename):
         filename = secure_filename(str(filename or '').strip())
         return filename or 'attachment'
 
     @staticmethod
-    def _json_response(data, status=200):
+    def _json_response(data, status=200, headers=None):
         return Response(
             json.dumps(data, default=str),
             content_type='application/json; charset=utf-8',
             status=status,
+            headers=headers,
         )
 
     @staticmethod
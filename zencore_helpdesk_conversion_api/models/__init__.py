@@ -1,2 +1,5 @@
 from . import helpdesk_ticket
-from . import mail_message
\ No newline at end of file
+from . import mail_message
+from . import conversation_tombstone
+from . import ir_attachment
+from . import outbound_event
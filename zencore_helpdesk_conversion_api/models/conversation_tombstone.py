@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+conversation_tombstone.py
+
+Deletion records for incremental conversation sync.
+
+When a chatter message of a helpdesk ticket is deleted, a tombstone keeps
+its id and deletion time so that GET .../conversation?since=<cursor> can tell
+polling clients which messages to drop.  Tombstones are purged by a daily
+cron after `zencore_helpdesk.tombstone_retention_days` (default 30); clients
+whose cursor is older than that should resync the full conversation.
+"""
+
+import logging
+from datetime import timedelta
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_RETENTION_DAYS = 30
+
+
+class ZencoreConversationTombstone(models.Model):
+    _name = 'zencore.conversation.tombstone'
+    _description = 'Zencore Deleted Conversation Message'
+    _order = 'deleted_at, id'
+    _log_access = False
+
+    message_id = fields.Integer(required=True, readonly=True)
+    ticket_id = fields.Many2one(
+        'helpdesk.ticket', required=True, readonly=True, ondelete='cascade',
+    )
+    deleted_at = fields.Datetime(
+        required=True, readonly=True, default=fields.Datetime.now,
+    )
+
+    _ticket_deleted_at_idx = models.Index('(ticket_id, deleted_at)')
+
+    @api.model
+    def _record_deleted_messages(self, messages):
+        """Create one tombstone per helpdesk.ticket message in `messages`."""
+        vals_list = [
+            {'message_id': msg.id, 'ticket_id': msg.res_id}
+            for msg in messages
+            if msg.model == 'helpdesk.ticket' and msg.res_id
+        ]
+        if vals_list:
+            self.sudo().create(vals_list)
+
+    @api.model
+    def _cron_purge_tombstones(self):
+        try:
+            days = int(self.env['ir.config_parameter'].sudo().get_param(
+                'zencore_helpdesk.tombstone_retention_days', DEFAULT_RETENTION_DAYS,
+            ))
+        except (ValueError, TypeError):
+            days = DEFAULT_RETENTION_DAYS
+        cutoff = fields.Datetime.now() - timedelta(days=days)
+        self.env.cr.execute(
+            "DELETE FROM zencore_conversation_tombstone WHERE deleted_at < %s",
+            (cutoff,),
+        )
+        _logger.info(
+            "[Zencore] Purged %s conversation tombstone(s) older than %s days.",
+            self.env.cr.rowcount, days,
+        )
+        return True
@@ -335,8 +335,6 @@ portal messages via the `parent_message_id` field in the POST payload.
 
 import logging
 
-import requests
-
 from odoo import models
 
 _logger = logging.getLogger(__name__)
@@ -476,7 +474,7 @@ class HelpdeskTicket(models.Model):
 
     def _forward_to_external_api(self, message):
         """
-        POST the reply payload to the URL stored in ir.config_parameter.
+        Queue the reply payload for the URL stored in ir.config_parameter.
 
         Config keys (set via Settings → Technical → Parameters):
             zencore_helpdesk.external_api_url   (required)
@@ -487,12 +485,14 @@ class HelpdeskTicket(models.Model):
                          specific message via the Odoo UI).
           - None      → the agent posted an independent root message.
 
-        Failures are swallowed — the chatter post must never be blocked.
+        Nothing is sent from the user's transaction: the payload is written
+        to the zencore.outbound.event outbox and delivered by its cron
+        (retries, per-ticket ordering, idempotency keys — see
+        models/outbound_event.py).  The chatter post is never blocked.
         """
-        ICP          = self.env['ir.config_parameter'].sudo()
-        external_url = ICP.get_param('zencore_helpdesk.external_api_url', default=False)
-        api_key      = ICP.get_param('zencore_helpdesk.outbound_api_key', default=False)
-
+        external_url = self.env['ir.config_parameter'].sudo().get_param(
+            'zencore_helpdesk.external_api_url', default=False,
+        )
         if not external_url:
             _logger.warning(
                 "[Zencore] 'zencore_helpdesk.external_api_url' is not set. "
@@ -519,43 +519,13 @@ class HelpdeskTicket(models.Model):
             "parent_message_id": parent_message_id,
         }
 
-        headers = {"Content-Type": "application/json"}
-        if api_key:
-            headers["X-API-Key"] = api_key
-
-        try:
-            resp = requests.post(
-                external_url,
-                json=payload,
-                headers=headers,
-                timeout=10,
-            )
-            resp.raise_for_status()
-            _logger.info(
-                "[Zencore] Forwarded message_id=%s (ticket_id=%s) → HTTP %s",
-                message.id, self.id, resp.status_code,
-            )
-
-        except requests.exceptions.Timeout:
-            _logger.error(
-                "[Zencore] Timeout forwarding message_id=%s for ticket_id=%s to '%s'.",
-                message.id, self.id, external_url,
-            )
-        except requests.exceptions.ConnectionError as exc:
-            _logger.error(
-                "[Zencore] Connection error forwarding message_id=%s for ticket_id=%s: %s",
-                message.id, self.id, exc,
-            )
-        except requests.exceptions.HTTPError as exc:
-            _logger.error(
-                "[Zencore] HTTP error forwarding message_id=%s for ticket_id=%s: %s",
-                message.id, self.id, exc,
-            )
-        except Exception as exc:  # noqa: BLE001
-            _logger.error(
-                "[Zencore] Unexpected error forwarding message_id=%s for ticket_id=%s: %s",
-                message.id, self.id, exc,
-            )
+        self.env['zencore.outbound.event']._enqueue(
+            self, 'message', payload, message_id=message.id,
+        )
+        _logger.debug(
+            "[Zencore] Queued message_id=%s (ticket_id=%s) for forwarding.",
+            message.id, self.id,
+        )
 
     # ──────────────────────────────────────────────────────────────────────────
     # SECTION 5 — Lightweight portal-user notification on outbound reply.
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+ir_attachment.py
+
+Streaming storage for inbound attachments.
+
+ir.attachment.create() needs the whole file as `raw` / `datas`, so a 10 MB
+upload used to be held in memory several times over (decoded bytes, base64
+re-encoding, the ORM's own copy).  _zencore_store_chunks() instead writes the
+chunks straight to the filestore while computing the SHA-1 checksum Odoo
+uses as the file name, then returns the values the attachment needs
+(store_fname, checksum, file_size).  Peak memory is one chunk per file.
+
+A file whose checksum is already in the filestore is not written twice.
+Newly written files are marked for the filestore garbage collector, so
+they are removed again if the transaction creating the attachment rolls
+back.  With database storage (ir_attachment.location = db) the chunks are
+joined and passed as `raw`, like a regular create.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+
+from odoo import models
+
+_logger = logging.getLogger(__name__)
+
+
+class IrAttachment(models.Model):
+    _inherit = 'ir.attachment'
+
+    def _zencore_store_chunks(self, chunks):
+        """
+        Store an iterable of bytes chunks.  Returns a dict of ir.attachment
+        values (checksum, file_size and store_fname or raw), or None when
+        the iterable yielded no data.
+        """
+        if self._storage() != 'file':
+            raw = b''.join(chunks)
+            if not raw:
+                return None
+            return {
+                'raw':       raw,
+                'checksum':  hashlib.sha1(raw).hexdigest(),
+                'file_size': len(raw),
+            }
+
+        sha = hashlib.sha1()
+        size = 0
+        filestore = self._filestore()
+        os.makedirs(filestore, exist_ok=True)
+        tmp = tempfile.NamedTemporaryFile(
+            dir=filestore, prefix='.zencore-upload-', delete=False,
+        )
+        try:
+            with tmp:
+                for chunk in chunks:
+                    sha.update(chunk)
+                    size += len(chunk)
+                    tmp.write(chunk)
+            if not size:
+                return None
+
+            checksum = sha.hexdigest()
+            fname = '%s/%s' % (checksum[:2], checksum)
+            full_path = self._full_path(fname)
+            if os.path.isfile(full_path):
+                _logger.debug("[Zencore] Filestore already holds %s, reusing it.", fname)
+            else:
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                os.replace(tmp.name, full_path)
+                self._mark_for_gc(fname)
+            return {'store_fname': fname, 'checksum': checksum, 'file_size': size}
+        finally:
+            if os.path.exists(tmp.name):
+                os.unlink(tmp.name)
@@ -56,6 +56,16 @@ Root cause of removal:
       Inbound controller  → subtype_xmlid='mail.mt_note'   (internal note)
       Agent reply via UI  → subtype_xmlid='mail.mt_comment' (native Odoo default)
 
-No override is needed here.
+The only override left is unlink(): deleting a helpdesk ticket message
+leaves a zencore.conversation.tombstone so that incremental conversation
+sync (GET .../conversation?since=...) can report the deletion.
 """
-from odoo import models  # noqa: F401  — file kept; referenced by models/__init__.py
\ No newline at end of file
+from odoo import models
+
+
+class MailMessage(models.Model):
+    _inherit = 'mail.message'
+
+    def unlink(self):
+        self.env['zencore.conversation.tombstone']._record_deleted_messages(self)
+        return super().unlink()
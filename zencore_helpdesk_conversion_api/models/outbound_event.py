@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+outbound_event.py
+
+Durable outbox for events forwarded to the external system.
+
+helpdesk.ticket._forward_to_external_api() used to POST inline, inside the
+agent's transaction: a slow remote slowed down every reply and a failed
+call was only logged.  It now only inserts a zencore.outbound.event row
+(same transaction, so an event exists if and only if the message does) and
+triggers the delivery cron.
+
+Delivery (_cron_deliver_events)
+───────────────────────────────
+  - Events are delivered in batches over one keep-alive HTTP session.
+  - Ordering per ticket: only the oldest pending event of a ticket is
+    eligible; the next one waits until it is delivered or given up.
+  - Every request carries an Idempotency-Key header (stable per event),
+    so the remote can drop the duplicates a retry may produce.
+  - Failures are retried with exponential backoff
+    (RETRY_BASE_SECONDS · 2^(attempt-1), capped at RETRY_MAX_SECONDS).
+    After MAX_ATTEMPTS, or on a non-retryable 4xx, the event is marked
+    failed and stops blocking its ticket.
+  - Each outcome is committed on its own, so a crash mid-batch never
+    re-sends events already acknowledged.
+"""
+
+import logging
+import time
+from datetime import timedelta
+
+import requests
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS       = 8
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS  = 3600
+REQUEST_TIMEOUT    = 10
+BATCH_SIZE         = 100
+TIME_BUDGET        = 240   # seconds per cron run
+
+# 4xx answers worth retrying; any other 4xx is a permanent failure
+RETRYABLE_4XX = {408, 409, 425, 429}
+
+
+class ZencoreOutboundEvent(models.Model):
+    _name = 'zencore.outbound.event'
+    _description = 'Zencore Outbound Event'
+    _order = 'id'
+
+    ticket_id = fields.Many2one(
+        'helpdesk.ticket', required=True, readonly=True, ondelete='cascade',
+    )
+    message_id = fields.Integer(readonly=True)
+    event_type = fields.Char(required=True, readonly=True, default='message')
+    payload = fields.Json(required=True, readonly=True)
+    idempotency_key = fields.Char(required=True, readonly=True)
+    state = fields.Selection(
+        [('pending', 'Pending'), ('done', 'Delivered'), ('failed', 'Failed')],
+        required=True, default='pending', readonly=True,
+    )
+    attempts = fields.Integer(readonly=True, default=0)
+    next_attempt_at = fields.Datetime(
+        readonly=True, default=fields.Datetime.now,
+    )
+    sent_at = fields.Datetime(readonly=True)
+    last_status_code = fields.Integer(readonly=True)
+    last_error = fields.Text(readonly=True)
+
+    _idempotency_key_uniq = models.Constraint(
+        'UNIQUE(idempotency_key)',
+        'An outbound event with this idempotency key already exists.',
+    )
+    _pending_idx = models.Index(
+        '(ticket_id, id) WHERE state = \'pending\'',
+    )
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Enqueue — called inside the user's transaction
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @api.model
+    def _enqueue(self, ticket, event_type, payload, message_id=False):
+        """Queue `payload`; enqueuing the same (ticket, type, message) twice is a no-op."""
+        key = 'helpdesk.ticket/%s/%s/%s' % (ticket.id, event_type, message_id or 0)
+        if self.sudo().search_count([('idempotency_key', '=', key)], limit=1):
+            return self.browse()
+        event = self.sudo().create({
+            'ticket_id':       ticket.id,
+            'message_id':      message_id,
+            'event_type':      event_type,
+            'payload':         payload,
+            'idempotency_key': key,
+        })
+        cron = self.env.ref(
+            'zencore_helpdesk_conversion_api.ir_cron_deliver_outbound_events',
+            raise_if_not_found=False,
+        )
+        if cron:
+            cron.sudo()._trigger()
+        return event
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Worker
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @api.model
+    def _cron_deliver_events(self, batch_size=BATCH_SIZE):
+        ICP          = self.env['ir.config_parameter'].sudo()
+        external_url = ICP.get_param('zencore_helpdesk.external_api_url', default=False)
+        api_key      = ICP.get_param('zencore_helpdesk.outbound_api_key', default=False)
+        if not external_url:
+            _logger.warning(
+                "[Zencore] 'zencore_helpdesk.external_api_url' is not set. "
+                "Outbound events stay queued.",
+            )
+            return True
+
+        headers = {"Content-Type": "application/json"}
+        if api_key:
+            headers["X-API-Key"] = api_key
+
+        deadline  = time.monotonic() + TIME_BUDGET
+        delivered = failed = retried = 0
+        with requests.Session() as session:
+            while delivered + failed + retried < batch_size and time.monotonic() < deadline:
+                events = self._due_ticket_heads(batch_size - delivered - failed - retried)
+                if not events:
+                    break
+                for event in events:
+                    outcome = event._deliver(session, external_url, headers)
+                    self.env.cr.commit()
+                    if outcome == 'done':
+                        delivered += 1
+                    elif outcome == 'failed':
+                        failed += 1
+                    else:
+                        retried += 1
+                    if time.monotonic() >= deadline:
+                        break
+
+        if delivered or failed or retried:
+            _logger.info(
+                "[Zencore] Outbox run: %s delivered, %s retry scheduled, %s failed.",
+                delivered, retried, failed,
+            )
+        if self._due_ticket_heads(1):
+            # More due events than this run could handle; a retried head
+            # is not due any more, so this cannot loop on a failing remote.
+            self.env.ref(
+                'zencore_helpdesk_conversion_api.ir_cron_deliver_outbound_events'
+            )._trigger()
+        return True
+
+    @api.model
+    def _due_ticket_heads(self, limit):
+        """Oldest pending event of each ticket, if it is due."""
+        self.env.cr.execute("""
+            SELECT id
+              FROM (
+                    SELECT DISTINCT ON (ticket_id) id, next_attempt_at
+                      FROM zencore_outbound_event
+                     WHERE state = 'pending'
+                     ORDER BY ticket_id, id
+                   ) AS heads
+             WHERE next_attempt_at IS NULL
+                OR next_attempt_at <= (now() AT TIME ZONE 'UTC')
+             ORDER BY id
+             LIMIT %s
+        """, (limit,))
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
+
+    def _deliver(self, session, url, headers):
+        """POST one event; record the outcome. Returns 'done', 'retry' or 'failed'."""
+        self.ensure_one()
+        status_code = None
+        try:
+            resp = session.post(
+                url,
+                json=self.payload,
+                headers=dict(headers, **{'Idempotency-Key': self.idempotency_key}),
+                timeout=REQUEST_TIMEOUT,
+            )
+            status_code = resp.status_code
+            resp.raise_for_status()
+        except requests.exceptions.RequestException as exc:
+            retryable = (
+                status_code is None
+                or status_code >= 500
+                or status_code in RETRYABLE_4XX
+            )
+            return self._record_failure(status_code, str(exc), retryable)
+
+        self.write({
+            'state':            'done',
+            'attempts':         self.attempts + 1,
+            'sent_at':          fields.Datetime.now(),
+            'last_status_code': status_code,
+            'last_error':       False,
+        })
+        _logger.info(
+            "[Zencore] Forwarded message_id=%s (ticket_id=%s) → HTTP %s",
+            self.message_id, self.ticket_id.id, status_code,
+        )
+        return 'done'
+
+    def _record_failure(self, status_code, error, retryable):
+        attempts = self.attempts + 1
+        vals = {
+            'attempts':         attempts,
+            'last_status_code': status_code or 0,
+            'last_error':       error,
+        }
+        if retryable and attempts < MAX_ATTEMPTS:
+            delay = min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+            vals['next_attempt_at'] = fields.Datetime.now() + timedelta(seconds=delay)
+            outcome = 'retry'
+            _logger.warning(
+                "[Zencore] Forwarding message_id=%s for ticket_id=%s failed "
+                "(attempt %s): %s. Retrying in %ss.",
+                self.message_id, self.ticket_id.id, attempts, error, delay,
+            )
+        else:
+            vals['state'] = 'failed'
+            outcome = 'failed'
+            _logger.error(
+                "[Zencore] Giving up forwarding message_id=%s for ticket_id=%s "
+                "after %s attempt(s): %s",
+                self.message_id, self.ticket_id.id, attempts, error,
+            )
+        self.write(vals)
+        return outcome
+
+    def action_retry(self):
+        """Re-queue failed events for immediate delivery."""
+        self.filtered(lambda e: e.state == 'failed').write({
+            'state':           'pending',
+            'attempts':        0,
+            'next_attempt_at': fields.Datetime.now(),
+        })
+        return True
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+from . import test_outbound_event
+from . import test_body_text_cache
+from . import test_conversation_sync
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+from odoo.tests.common import BaseCase, tagged
+
+from ..controllers.main import _BodyTextCache, _strip_html
+
+
+@tagged('post_install', '-at_install', 'zencore_helpdesk')
+class TestBodyTextCache(BaseCase):
+
+    def test_hit_and_miss(self):
+        cache = _BodyTextCache()
+        cache.set_many([(('db', 1, 'w1'), 'hello')])
+        self.assertEqual(cache.get_many([('db', 1, 'w1'), ('db', 1, 'w2')]),
+                         {('db', 1, 'w1'): 'hello'})
+
+    def test_entry_bound_evicts_least_recently_used(self):
+        cache = _BodyTextCache(max_size=2)
+        cache.set_many([('a', 'x'), ('b', 'y')])
+        cache.get_many(['a'])
+        cache.set_many([('c', 'z')])
+        self.assertEqual(set(cache.get_many(['a', 'b', 'c'])), {'a', 'c'})
+
+    def test_size_bound_counts_characters(self):
+        cache = _BodyTextCache(max_chars=10)
+        cache.set_many([('a', '1234'), ('b', '5678')])
+        cache.set_many([('c', 'abcd')])
+        self.assertEqual(set(cache.get_many(['a', 'b', 'c'])), {'b', 'c'})
+        self.assertEqual(cache._chars, 8)
+
+    def test_oversized_body_is_not_cached(self):
+        cache = _BodyTextCache(max_chars=100, max_entry_chars=5)
+        cache.set_many([('small', 'abc'), ('huge', 'x' * 6)])
+        self.assertEqual(cache.get_many(['small', 'huge']), {'small': 'abc'})
+
+    def test_replacing_an_entry_keeps_the_size_exact(self):
+        cache = _BodyTextCache()
+        cache.set_many([('a', 'x' * 10)])
+        cache.set_many([('a', 'y' * 3)])
+        self.assertEqual(cache._chars, 3)
+        cache.clear()
+        self.assertEqual(cache._chars, 0)
+        self.assertFalse(cache.get_many(['a']))
+
+    def test_strip_html(self):
+        self.assertEqual(_strip_html('<p>Hello</p><p>world</p>'), 'Hello world')
+        self.assertEqual(_strip_html(False), '')
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime
+
+from odoo.tests.common import TransactionCase, tagged
+
+from ..controllers.main import (
+    _conversation_etag,
+    _conversation_version,
+    _parse_since,
+    _sync_cursor,
+)
+
+
+@tagged('post_install', '-at_install', 'zencore_helpdesk')
+class TestSinceParser(TransactionCase):
+
+    def test_message_id(self):
+        self.assertEqual(_parse_since(' 42 '), ('id', 42))
+
+    def test_timestamps(self):
+        expected = datetime(2024, 1, 31, 12, 0, 0)
+        for raw in ('2024-01-31T12:00:00Z', '2024-01-31T12:00:00',
+                    '2024-01-31 12:00:00', '2024-01-31T12:00:00.000000Z'):
+            self.assertEqual(_parse_since(raw), ('date', expected), raw)
+        self.assertEqual(
+            _parse_since('2024-01-31 12:00:00.250000'),
+            ('date', datetime(2024, 1, 31, 12, 0, 0, 250000)),
+        )
+
+    def test_invalid(self):
+        for raw in ('', 'yesterday', '-5', '2024-13-01T00:00:00Z', '12.5'):
+            with self.assertRaises(ValueError, msg=raw):
+                _parse_since(raw)
+
+    def test_sync_cursor_round_trip(self):
+        last_write = datetime(2024, 1, 31, 12, 0, 0, 123456)
+        last_delete = datetime(2024, 1, 31, 11, 0, 0)
+        cursor = _sync_cursor((3, last_write, last_delete))
+        self.assertEqual(_parse_since(cursor), ('date', last_write))
+        self.assertIsNone(_sync_cursor((0, None, None)))
+
+
+@tagged('post_install', '-at_install', 'zencore_helpdesk')
+class TestConversationVersion(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.ticket = cls.env['helpdesk.ticket'].create({'name': 'Version'})
+
+    def _version(self):
+        self.env.flush_all()
+        return _conversation_version(self.env, self.ticket.id)
+
+    def test_post_changes_the_version(self):
+        before = self._version()
+        self.ticket.message_post(body='Hello', message_type='comment')
+        self.assertNotEqual(self._version(), before)
+
+    def test_edit_changes_the_version(self):
+        message = self.ticket.message_post(body='Hello', message_type='comment')
+        before = self._version()
+        # Same transaction: move write_date by hand, as a later edit would
+        self.env.cr.execute(
+            "UPDATE mail_message SET write_date = write_date + interval '1 second' WHERE id = %s",
+            (message.id,),
+        )
+        self.assertNotEqual(self._version(), before)
+
+    def test_delete_changes_the_version(self):
+        self.ticket.message_post(body='One', message_type='comment')
+        message = self.ticket.message_post(body='Two', message_type='comment')
+        before = self._version()
+        message.unlink()
+        self.assertNotEqual(self._version(), before)
+
+    def test_etag_depends_on_query(self):
+        version = self._version()
+        etag = _conversation_etag(version, self.ticket, ('tree', True, False))
+        self.assertEqual(etag, _conversation_etag(version, self.ticket, ('tree', True, False)))
+        self.assertNotEqual(etag, _conversation_etag(version, self.ticket, ('flat', True, False)))
+        self.assertTrue(etag.startswith('"') and etag.endswith('"'))
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import requests
+
+from odoo import fields
+from odoo.tests.common import TransactionCase, tagged
+
+from ..models import outbound_event
+from ..models.outbound_event import MAX_ATTEMPTS, RETRY_BASE_SECONDS
+
+
+class _RemoteHandler(BaseHTTPRequestHandler):
+    """Answers with the next scripted reply and records every request."""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        server = self.server
+        server.received.append({
+            'idempotency_key': self.headers.get('Idempotency-Key'),
+            'api_key':         self.headers.get('X-API-Key'),
+            'payload':         json.loads(body or b'null'),
+        })
+        reply = server.replies.pop(0) if server.replies else 200
+        if reply == 'timeout':
+            time.sleep(server.hang_seconds)
+            reply = 200
+        try:
+            self.send_response(reply)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        except OSError:
+            pass    # the client gave up on a 'timeout' reply
+
+    def log_message(self, *args):
+        pass
+
+
+class _Remote:
+    """Local stand-in for the external API, served from a thread."""
+
+    def __init__(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _RemoteHandler)
+        self.server.daemon_threads = True
+        self.server.received = []
+        self.server.replies = []
+        self.server.hang_seconds = 1.0
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:%s/events' % self.server.server_address[1]
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@tagged('post_install', '-at_install', 'zencore_helpdesk')
+class TestOutboundEvent(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.remote = _Remote()
+        cls.addClassCleanup(cls.remote.close)
+        cls.Event = cls.env['zencore.outbound.event']
+        cls.ticket_a, cls.ticket_b = cls.env['helpdesk.ticket'].create([
+            {'name': 'Outbox A'}, {'name': 'Outbox B'},
+        ])
+
+    def setUp(self):
+        super().setUp()
+        self.remote.server.received.clear()
+        self.remote.server.replies.clear()
+        self.session = requests.Session()
+        self.addCleanup(self.session.close)
+
+    def _enqueue(self, ticket, message_id):
+        event = self.Event._enqueue(ticket, 'message', {'message_id': message_id}, message_id)
+        self._make_due(event)
+        return event
+
+    def _deliver(self, event, *replies):
+        self.remote.server.replies.extend(replies)
+        return event._deliver(self.session, self.remote.url, {'X-API-Key': 'secret'})
+
+    def _make_due(self, event):
+        # Due now, whatever the test transaction's start time
+        event.next_attempt_at = fields.Datetime.now() - timedelta(minutes=1)
+
+    # ── Ordering ──────────────────────────────────────────────────────────────
+
+    def test_only_ticket_heads_are_due(self):
+        a1 = self._enqueue(self.ticket_a, 1)
+        a2 = self._enqueue(self.ticket_a, 2)
+        b1 = self._enqueue(self.ticket_b, 3)
+        self.assertEqual(self.Event._due_ticket_heads(10), a1 | b1)
+
+        self.assertEqual(self._deliver(a1, 200), 'done')
+        self.assertEqual(self.Event._due_ticket_heads(10), a2 | b1)
+
+    def test_retrying_head_blocks_its_ticket(self):
+        a1 = self._enqueue(self.ticket_a, 1)
+        self._enqueue(self.ticket_a, 2)
+        b1 = self._enqueue(self.ticket_b, 3)
+        self.assertEqual(self._deliver(a1, 503), 'retry')
+        self.assertEqual(self.Event._due_ticket_heads(10), b1)
+
+    def test_failed_head_unblocks_its_ticket(self):
+        a1 = self._enqueue(self.ticket_a, 1)
+        a2 = self._enqueue(self.ticket_a, 2)
+        self.assertEqual(self._deliver(a1, 400), 'failed')
+        self.assertEqual(self.Event._due_ticket_heads(10), a2)
+
+    # ── Retry and backoff ─────────────────────────────────────────────────────
+
+    def test_5xx_is_retried_with_exponential_backoff(self):
+        event = self._enqueue(self.ticket_a, 1)
+        for attempt in (1, 2, 3):
+            before = fields.Datetime.now()
+            self.assertEqual(self._deliver(event, 502), 'retry')
+            self.assertEqual(event.attempts, attempt)
+            self.assertEqual(event.last_status_code, 502)
+            delay = (event.next_attempt_at - before).total_seconds()
+            expected = RETRY_BASE_SECONDS * 2 ** (attempt - 1)
+            self.assertGreaterEqual(delay, expected - 1)
+            self.assertLessEqual(delay, expected + 2)
+            self._make_due(event)
+        self.assertEqual(self._deliver(event, 200), 'done')
+        self.assertEqual(event.state, 'done')
+        self.assertEqual(event.attempts, 4)
+        self.assertFalse(event.last_error)
+
+    def test_timeout_is_retried(self):
+        event = self._enqueue(self.ticket_a, 1)
+        with patch.object(outbound_event, 'REQUEST_TIMEOUT', 0.2):
+            self.assertEqual(self._deliver(event, 'timeout'), 'retry')
+        self.assertEqual(event.state, 'pending')
+        self.assertEqual(event.last_status_code, 0)
+        self.assertTrue(event.last_error)
+
+    def test_retryable_4xx(self):
+        event = self._enqueue(self.ticket_a, 1)
+        self.assertEqual(self._deliver(event, 429), 'retry')
+
+    # ── Dead letter ───────────────────────────────────────────────────────────
+
+    def test_gives_up_after_max_attempts(self):
+        event = self._enqueue(self.ticket_a, 1)
+        for _attempt in range(MAX_ATTEMPTS - 1):
+            self.assertEqual(self._deliver(event, 500), 'retry')
+            self._make_due(event)
+        self.assertEqual(self._deliver(event, 500), 'failed')
+        self.assertEqual(event.state, 'failed')
+        self.assertEqual(event.attempts, MAX_ATTEMPTS)
+        self.assertFalse(self.Event._due_ticket_heads(10))
+
+    def test_non_retryable_4xx_fails_at_once(self):
+        event = self._enqueue(self.ticket_a, 1)
+        self.assertEqual(self._deliver(event, 422), 'failed')
+        self.assertEqual(event.attempts, 1)
+
+    def test_action_retry_requeues_failed_events(self):
+        event = self._enqueue(self.ticket_a, 1)
+        self._deliver(event, 400)
+        event.action_retry()
+        self.assertEqual(event.state, 'pending')
+        self.assertEqual(event.attempts, 0)
+        self._make_due(event)
+        self.assertEqual(self.Event._due_ticket_heads(10), event)
+
+    # ── Idempotency ───────────────────────────────────────────────────────────
+
+    def test_idempotency_key_is_stable_across_retries(self):
+        event = self._enqueue(self.ticket_a, 1)
+        for reply in (503, 500):
+            self._deliver(event, reply)
+            self._make_due(event)
+        self._deliver(event, 200)
+        keys = [request['idempotency_key'] for request in self.remote.server.received]
+        self.assertEqual(keys, [event.idempotency_key] * 3)
+        self.assertEqual(self.remote.server.received[0]['api_key'], 'secret')
+
+    def test_enqueue_twice_is_a_noop(self):
+        event = self._enqueue(self.ticket_a, 1)
+        self.assertFalse(self.Event._enqueue(self.ticket_a, 'message', {}, 1))
+        self.assertEqual(self.Event.search([('ticket_id', '=', self.ticket_a.id)]), event)
+
+    # ── Cron ──────────────────────────────────────────────────────────────────
+
+    def test_cron_delivers_in_ticket_order(self):
+        ICP = self.env['ir.config_parameter'].sudo()
+        ICP.set_param('zencore_helpdesk.external_api_url', self.remote.url)
+        ICP.set_param('zencore_helpdesk.outbound_api_key', 'secret')
+        events = [self._enqueue(self.ticket_a, 1), self._enqueue(self.ticket_b, 2),
+                  self._enqueue(self.ticket_a, 3)]
+        # The cron commits every outcome; the test transaction must not
+        with patch.object(self.env.cr, 'commit', lambda: None):
+            self.Event._cron_deliver_events()
+        received = [request['payload']['message_id'] for request in self.remote.server.received]
+        self.assertEqual(received, [1, 2, 3])
+        self.assertEqual(set(e.state for e in events), {'done'})